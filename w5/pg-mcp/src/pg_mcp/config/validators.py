@@ -4,18 +4,52 @@ This module provides tools for validating configuration files
 before starting the server.
 """
 
-import re
+import copy
+import hashlib
+import io
+import string
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, TextIO
 
 import structlog
 import yaml
+from cachetools import LRUCache
 from pydantic import ValidationError
 
 from pg_mcp.config.models import AccessPolicyConfig, AppConfig
 
 logger = structlog.get_logger()
 
+# LibYAML-backed loader when PyYAML was built with it; same safe subset of YAML
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Characters allowed in column patterns (alphanumeric, underscore, hyphen, dot, asterisk)
+_COLUMN_PATTERN_CHARS = frozenset(string.ascii_letters + string.digits + "_.*-")
+
+
+# Parsed YAML keyed by the SHA-256 digest of the text, so raw config
+# (API keys, DSNs) is not kept around as cache keys
+_parsed_yaml_cache: LRUCache[bytes, object] = LRUCache(maxsize=64)
+
+
+def _parse_yaml(content: str, source: str) -> object:
+    """Parse YAML text, reusing the parse for identical content.
+
+    An edited file hashes differently and is always re-parsed. Each caller
+    gets its own copy of the cached object. ``source`` only names the input
+    in syntax error messages.
+    """
+    digest = hashlib.sha256(content.encode("utf-8")).digest()
+    try:
+        parsed = _parsed_yaml_cache[digest]
+    except KeyError:
+        stream = io.StringIO(content)
+        stream.name = source  # type: ignore[misc]
+        parsed = _parsed_yaml_cache[digest] = yaml.load(stream, Loader=_YAML_LOADER)
+    return copy.deepcopy(parsed)
+
 
 @dataclass
 class ValidationResult:
@@ -36,6 +70,20 @@ class ConfigValidator:
     - Detect potential issues and generate warnings
     """
 
+    def validate(self, source: str | Path | TextIO) -> ValidationResult:
+        """Validate a configuration from a file path or an open text stream.
+
+        Args:
+            source: Path to the configuration file, or a readable text stream
+                (e.g. an open file or io.StringIO)
+
+        Returns:
+            ValidationResult with success status, errors and warnings
+        """
+        if isinstance(source, (str, Path)):
+            return self.validate_file(str(source))
+        return self.validate_text(source.read(), source=getattr(source, "name", "<stream>"))
+
     def validate_file(self, config_path: str) -> ValidationResult:
         """Validate a configuration file.
 
@@ -45,10 +93,7 @@ class ConfigValidator:
         Returns:
             ValidationResult with success status, errors and warnings
         """
-        errors: list[str] = []
-        warnings: list[str] = []
-
-        # 1. Check file exists
+        # Check file exists
         path = Path(config_path)
         if not path.exists():
             return ValidationResult(
@@ -62,10 +107,21 @@ class ConfigValidator:
                 errors=[f"Path is not a file: {config_path}"],
             )
 
-        # 2. Parse YAML
+        return self.validate_text(path.read_text(encoding="utf-8"), source=config_path)
+
+    def validate_text(self, content: str, source: str = "<memory>") -> ValidationResult:
+        """Validate configuration YAML already held in memory.
+
+        Args:
+            content: YAML configuration text
+            source: Name of the input, used in YAML syntax error messages
+
+        Returns:
+            ValidationResult with success status, errors and warnings
+        """
+        # 1. Parse YAML
         try:
-            with open(path, encoding="utf-8") as f:
-                raw_config = yaml.safe_load(f)
+            raw_config = _parse_yaml(content, source)
         except yaml.YAMLError as e:
             return ValidationResult(
                 success=False,
@@ -84,7 +140,21 @@ class ConfigValidator:
                 errors=["Configuration must be a YAML mapping (dictionary)"],
             )
 
-        # 3. Validate with Pydantic
+        return self.validate_dict(raw_config)
+
+    def validate_dict(self, raw_config: dict[str, Any]) -> ValidationResult:
+        """Validate an already-parsed configuration mapping.
+
+        Args:
+            raw_config: Configuration as loaded from YAML
+
+        Returns:
+            ValidationResult with success status, errors and warnings
+        """
+        errors: list[str] = []
+        warnings: list[str] = []
+
+        # 2. Validate with Pydantic
         try:
             config = AppConfig(**raw_config)
         except ValidationError as e:
@@ -94,11 +164,11 @@ class ConfigValidator:
                 errors.append(f"{loc}: {msg}")
             return ValidationResult(success=False, errors=errors)
 
-        # 4. Validate databases
+        # 3. Validate databases
         db_errors = self._validate_databases(config)
         errors.extend(db_errors)
 
-        # 5. Validate access policies for each database
+        # 4. Validate access policies for each database
         for db in config.databases:
             policy_errors, policy_warnings = self._validate_access_policy(
                 db.name, db.access_policy
@@ -117,23 +187,15 @@ class ConfigValidator:
         - Connection parameters
         """
         errors: list[str] = []
-
-        # Check for duplicate database names
-        db_names = [db.name for db in config.databases]
         seen: set[str] = set()
         duplicates: set[str] = set()
-        for name in db_names:
-            if name in seen:
-                duplicates.add(name)
-            seen.add(name)
 
-        if duplicates:
-            errors.append(
-                f"Duplicate database names: {', '.join(sorted(duplicates))}"
-            )
-
-        # Check connection parameters for each database
+        # One pass: record duplicate names, then check connection parameters
         for db in config.databases:
+            if db.name in seen:
+                duplicates.add(db.name)
+            seen.add(db.name)
+
             if db.url is None:
                 # When not using URL, host and dbname are required
                 missing = []
@@ -147,6 +209,12 @@ class ConfigValidator:
                         f"{', '.join(missing)} (or provide 'url')"
                     )
 
+        if duplicates:
+            # Reported first, ahead of per-database connection errors
+            errors.insert(
+                0, f"Duplicate database names: {', '.join(sorted(duplicates))}"
+            )
+
         return errors
 
     def _validate_access_policy(
@@ -168,21 +236,20 @@ class ConfigValidator:
         warnings: list[str] = []
 
         # Check for table conflicts (tables in both allowed and denied)
-        table_conflicts = set(policy.tables.allowed) & set(policy.tables.denied)
+        table_conflicts = set(policy.tables.allowed).intersection(policy.tables.denied)
         if table_conflicts:
             errors.append(
                 f"Database '{db_name}': Tables in both allowed and denied lists: "
                 f"{', '.join(sorted(table_conflicts))}"
             )
 
-        # Check column pattern validity
+        # Check column pattern validity and warn about overly broad patterns
         for pattern in policy.columns.denied_patterns:
-            pattern_errors = self._validate_column_pattern(pattern)
-            for err in pattern_errors:
-                errors.append(f"Database '{db_name}': {err}")
+            errors.extend(
+                f"Database '{db_name}': {err}"
+                for err in self._validate_column_pattern(pattern)
+            )
 
-        # Generate warnings for overly broad patterns
-        for pattern in policy.columns.denied_patterns:
             # Patterns with too many wildcards
             if pattern.count("*") > 2:
                 warnings.append(
@@ -232,10 +299,11 @@ class ConfigValidator:
             return errors
 
         # Check for valid characters (alphanumeric, underscore, dot, asterisk)
-        valid_pattern = r"^[a-zA-Z0-9_.*-]+$"
-        if not re.match(valid_pattern, pattern):
+        # issuperset scans the string in C and stops at the first bad character
+        if not _COLUMN_PATTERN_CHARS.issuperset(pattern):
+            invalid = sorted(set(pattern) - _COLUMN_PATTERN_CHARS)
             errors.append(
-                f"Column pattern '{pattern}' contains invalid characters. "
+                f"Column pattern '{pattern}' contains invalid characters {invalid!r}. "
                 "Only alphanumeric, underscore, hyphen, dot, and asterisk are allowed."
             )
 
@@ -249,17 +317,18 @@ class ConfigValidator:
         - Configuration has errors: (on failure)
         Warnings: (if any)
         """
+        # Build the whole report and write it once instead of printing per line
         if result.success:
-            print("Configuration is valid")
+            lines = ["Configuration is valid"]
         else:
-            print("Configuration has errors:")
-            for error in result.errors:
-                print(f"  - {error}")
+            lines = ["Configuration has errors:"]
+            lines.extend(f"  - {error}" for error in result.errors)
 
         if result.warnings:
-            print("\nWarnings:")
-            for warning in result.warnings:
-                print(f"  - {warning}")
+            lines.append("\nWarnings:")
+            lines.extend(f"  - {warning}" for warning in result.warnings)
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def validate_config_command(config_path: str) -> int:
@@ -1,6 +1,6 @@
 import ssl
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Any
 
 import asyncpg
@@ -146,6 +146,9 @@ class DatabasePool:
     ) -> list[asyncpg.Record]:
         """在只读事务中执行查询（深度防御）
 
+        BEGIN READ ONLY 与服务端语句超时（SET LOCAL）合并为一次
+        simple-query 往返发送，随后执行查询并提交。
+
         Args:
             query: SQL 查询
             *args: 查询参数
@@ -154,13 +157,23 @@ class DatabasePool:
         Returns:
             查询结果列表
         """
-        async with self.acquire() as conn, conn.transaction(readonly=True):
-            # 设置服务端语句超时
-            if timeout:
-                await conn.execute(
-                    f"SET LOCAL statement_timeout = '{int(timeout * 1000)}'"
-                )
-            return await conn.fetch(query, *args, timeout=timeout)
+        begin = "BEGIN READ ONLY"
+        if timeout:
+            begin += f"; SET LOCAL statement_timeout = '{int(timeout * 1000)}'"
+
+        async with self.acquire() as conn:
+            try:
+                # SET LOCAL 失败时事务已开启，同样需要 ROLLBACK
+                await conn.execute(begin)
+                records = await conn.fetch(query, *args, timeout=timeout)
+            except BaseException:
+                # 连接已损坏时由连接池在归还时重置
+                if not conn.is_closed():
+                    with suppress(Exception):
+                        await conn.execute("ROLLBACK")
+                raise
+            await conn.execute("COMMIT")
+            return records
 
     async def fetchrow(
         self,
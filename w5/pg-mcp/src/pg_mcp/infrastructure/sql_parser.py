@@ -1,38 +1,45 @@
 import re
-from dataclasses import dataclass, field
+import sys
+from collections.abc import Collection
+from dataclasses import dataclass
 
 import sqlglot
+from cachetools import LRUCache
 from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import ErrorLevel
 
 from pg_mcp.models.errors import SQLSyntaxError, UnsafeSQLError
 from pg_mcp.models.query import SQLValidationResult
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedSQLInfo:
     """
     SQL 解析结果 (用于访问策略验证)
 
     扩展现有 SQLParser，在验证 SQL 安全性的同时提取结构化信息。
+    实例不可变（序列字段均为元组），parse_for_policy 的缓存结果可在多次调用间共享。
+    schema/表/列名均为小写并经 sys.intern 驻留。
     """
 
     # 原始 SQL
     sql: str
 
     # 访问的 Schema 列表 (默认 "public" 如果未指定)
-    schemas: list[str] = field(default_factory=lambda: ["public"])
+    schemas: tuple[str, ...] = ("public",)
 
     # 访问的表列表 (不含 schema 前缀)
-    tables: list[str] = field(default_factory=list)
+    tables: tuple[str, ...] = ()
 
-    # 访问的列列表: [(table, column), ...]
-    columns: list[tuple[str, str]] = field(default_factory=list)
+    # 访问的列列表: ((table, column), ...)
+    columns: tuple[tuple[str, str], ...] = ()
 
     # 是否包含 SELECT *
     has_select_star: bool = False
 
     # SELECT * 涉及的表 (用于列展开)
-    select_star_tables: list[str] = field(default_factory=list)
+    select_star_tables: tuple[str, ...] = ()
 
     # 是否为只读查询 (现有功能)
     is_readonly: bool = True
@@ -40,9 +47,18 @@ class ParsedSQLInfo:
     # 验证错误信息 (现有功能)
     error_message: str | None = None
 
+    def __post_init__(self) -> None:
+        """将传入的列表等可迭代对象规范化为元组"""
+        for name in ("schemas", "tables", "select_star_tables"):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+        if not isinstance(self.columns, tuple):
+            object.__setattr__(self, "columns", tuple(tuple(pair) for pair in self.columns))
 
-# 禁止的语句类型
-FORBIDDEN_STATEMENT_TYPES: set[type[exp.Expression]] = {
+
+# 禁止的语句类型（元组可直接传给 isinstance，一次调用完成检查）
+FORBIDDEN_STATEMENT_TYPES: tuple[type[exp.Expression], ...] = (
     exp.Insert,
     exp.Update,
     exp.Delete,
@@ -54,10 +70,10 @@ FORBIDDEN_STATEMENT_TYPES: set[type[exp.Expression]] = {
     exp.Revoke,  # 权限撤销
     exp.Command,
     exp.Set,  # SET ROLE 等
-}
+)
 
 # 禁止的危险函数
-FORBIDDEN_FUNCTIONS: set[str] = {
+FORBIDDEN_FUNCTIONS: frozenset[str] = frozenset({
     "pg_sleep",
     "pg_terminate_backend",
     "pg_cancel_backend",
@@ -72,7 +88,7 @@ FORBIDDEN_FUNCTIONS: set[str] = {
     "pg_read_binary_file",
     "pg_write_file",
     "pg_ls_dir",
-}
+})
 
 # 禁止的关键字（正则匹配）
 FORBIDDEN_KEYWORDS_PATTERNS: list[tuple[str, str]] = [
@@ -95,22 +111,62 @@ FORBIDDEN_KEYWORDS_PATTERNS: list[tuple[str, str]] = [
     (r"\bUNLISTEN\b", "UNLISTEN"),
 ]
 
+# 每个禁止关键字的必含字面量（小写）。先用 `in` 做子串预筛，
+# 只有字面量出现时才运行对应正则，绝大多数普通 SELECT 无需任何正则匹配
+FORBIDDEN_KEYWORD_ANCHORS: dict[str, str] = {
+    "COPY TO": "copy",
+    "COPY FROM": "copy",
+    "SELECT INTO": "into",
+    "FOR UPDATE": "for",
+    "FOR SHARE": "for",
+    "FOR NO KEY UPDATE": "for",
+    "FOR KEY SHARE": "for",
+    "SET ROLE": "role",
+    "SET SESSION AUTHORIZATION": "authorization",
+    "RESET ROLE": "role",
+    "LISTEN": "listen",
+    "NOTIFY": "notify",
+    "UNLISTEN": "listen",
+}
+
+# 导入时一次性编译的关键字检查：(正则, 关键字名, 预筛字面量)，所有实例共享
+FORBIDDEN_KEYWORD_CHECKS: list[tuple[re.Pattern[str], str, str]] = [
+    (re.compile(pattern, re.IGNORECASE), name, FORBIDDEN_KEYWORD_ANCHORS[name])
+    for pattern, name in FORBIDDEN_KEYWORDS_PATTERNS
+]
+
+# 去重后的预筛字面量：每条 SQL 对每个字面量只扫描一次
+FORBIDDEN_KEYWORD_ANCHOR_LITERALS: tuple[str, ...] = tuple(
+    dict.fromkeys(FORBIDDEN_KEYWORD_ANCHORS.values())
+)
+
 
 class SQLParser:
     """SQL 解析与验证器"""
 
-    def __init__(self, dialect: str = "postgres") -> None:
+    def __init__(self, dialect: str = "postgres", cache_size: int = 1024) -> None:
         """初始化解析器
 
         Args:
             dialect: SQL 方言
+            cache_size: validate / parse_for_policy 结果的 LRU 缓存容量，0 表示不缓存
         """
         self.dialect = dialect
-        # 预编译正则表达式
-        self._keyword_patterns = [
-            (re.compile(pattern, re.IGNORECASE), name)
-            for pattern, name in FORBIDDEN_KEYWORDS_PATTERNS
-        ]
+        # 方言对象只解析一次，避免每次 parse/生成 SQL 时按名称重新查找并实例化
+        self._dialect = Dialect.get_or_raise(dialect)
+        # 相同 SQL 的验证/策略解析结果缓存（结果不可变，可安全共享）
+        self._validation_cache: LRUCache[str, SQLValidationResult] | None = (
+            LRUCache(maxsize=cache_size) if cache_size > 0 else None
+        )
+        self._policy_cache: LRUCache[str, ParsedSQLInfo] | None = (
+            LRUCache(maxsize=cache_size) if cache_size > 0 else None
+        )
+
+    def cache_clear(self) -> None:
+        """清空 validate 与 parse_for_policy 的结果缓存"""
+        for cache in (self._validation_cache, self._policy_cache):
+            if cache is not None:
+                cache.clear()
 
     def parse(self, sql: str) -> list[exp.Expression]:
         """解析 SQL 语句
@@ -125,7 +181,10 @@ class SQLParser:
             SQLSyntaxError: SQL 语法错误
         """
         try:
-            statements = sqlglot.parse(sql, dialect=self.dialect)
+            # IMMEDIATE: 遇到第一个语法错误立即抛出，不累积多条错误
+            statements = sqlglot.parse(
+                sql, dialect=self._dialect, error_level=ErrorLevel.IMMEDIATE
+            )
             # 过滤掉 None 值（可能由于空语句产生）
             return [stmt for stmt in statements if stmt is not None]
         except sqlglot.errors.ParseError as e:
@@ -134,8 +193,37 @@ class SQLParser:
     def validate(self, sql: str) -> SQLValidationResult:
         """验证 SQL 安全性
 
+        相同 SQL 字符串的结果会被缓存，重复验证只需一次字典查找。
+
+        Args:
+            sql: SQL 语句
+
+        Returns:
+            验证结果
+        """
+        return self._validate_cached(sql)
+
+    def _validate_cached(
+        self, sql: str, statements: list[exp.Expression] | None = None
+    ) -> SQLValidationResult:
+        """经过缓存的验证；statements 为调用方已解析好的语句，可避免重复解析"""
+        cache = self._validation_cache
+        if cache is None:
+            return self._validate(sql, statements)
+
+        result = cache.get(sql)
+        if result is None:
+            result = cache[sql] = self._validate(sql, statements)
+        return result
+
+    def _validate(
+        self, sql: str, statements: list[exp.Expression] | None = None
+    ) -> SQLValidationResult:
+        """执行完整的 SQL 安全性验证（不经过缓存）
+
         Args:
             sql: SQL 语句
+            statements: 已解析的语句；为 None 时按需解析
 
         Returns:
             验证结果
@@ -152,14 +240,15 @@ class SQLParser:
             )
 
         # 2. 解析 SQL
-        try:
-            statements = self.parse(sql)
-        except SQLSyntaxError as e:
-            return SQLValidationResult(
-                is_valid=False,
-                is_safe=False,
-                error_message=e.message,
-            )
+        if statements is None:
+            try:
+                statements = self.parse(sql)
+            except SQLSyntaxError as e:
+                return SQLValidationResult(
+                    is_valid=False,
+                    is_safe=False,
+                    error_message=e.message,
+                )
 
         # 3. 检查多语句（stacked queries）
         if len(statements) > 1:
@@ -187,37 +276,19 @@ class SQLParser:
                 error_message=type_error,
             )
 
-        # 5. 检查危险函数
-        func_error = self._check_dangerous_functions(stmt)
-        if func_error:
-            return SQLValidationResult(
-                is_valid=True,
-                is_safe=False,
-                error_message=func_error,
-            )
-
-        # 6. 检查 SELECT 变体（INTO, FOR UPDATE 等）
-        variant_error = self._check_select_variants(stmt)
-        if variant_error:
-            return SQLValidationResult(
-                is_valid=True,
-                is_safe=False,
-                error_message=variant_error,
-            )
-
-        # 7. 检查子查询和 CTE 中的修改操作
-        subquery_error = self._check_subqueries(stmt)
-        if subquery_error:
+        # 5. 单次遍历 AST：危险函数、SELECT 变体、子查询/CTE 中的修改操作
+        ast_error = self._check_ast(stmt)
+        if ast_error:
             return SQLValidationResult(
                 is_valid=True,
                 is_safe=False,
-                error_message=subquery_error,
+                error_message=ast_error,
             )
 
         return SQLValidationResult(
             is_valid=True,
             is_safe=True,
-            warnings=warnings,
+            warnings=tuple(warnings),
         )
 
     def _check_forbidden_keywords(self, sql: str) -> str | None:
@@ -229,8 +300,22 @@ class SQLParser:
         Returns:
             错误消息或 None
         """
-        for pattern, name in self._keyword_patterns:
-            if pattern.search(sql):
+        # 预筛只能多报不能漏报。re.IGNORECASE 会把 'ſ'、'ı'、'İ'、开尔文符号等
+        # 非 ASCII 字符视为 ASCII 字母，任何字符串折叠都无法与之完全一致，
+        # 因此非 ASCII 输入跳过预筛、逐条运行全部正则
+        present: Collection[str]
+        if sql.isascii():
+            lowered = sql.lower()
+            present = {
+                anchor for anchor in FORBIDDEN_KEYWORD_ANCHOR_LITERALS if anchor in lowered
+            }
+            if not present:
+                return None
+        else:
+            present = FORBIDDEN_KEYWORD_ANCHOR_LITERALS
+        # 按原列表顺序检查，保证多个关键字同时出现时报告的错误不变
+        for pattern, name, anchor in FORBIDDEN_KEYWORD_CHECKS:
+            if anchor in present and pattern.search(sql):
                 return f"Forbidden keyword detected: {name}"
         return None
 
@@ -243,47 +328,15 @@ class SQLParser:
         Returns:
             错误消息或 None
         """
-        for forbidden_type in FORBIDDEN_STATEMENT_TYPES:
-            if isinstance(stmt, forbidden_type):
-                return f"Statement type '{stmt.key}' is not allowed (read-only queries only)"
-        return None
-
-    def _check_dangerous_functions(self, stmt: exp.Expression) -> str | None:
-        """检查危险函数调用
-
-        Args:
-            stmt: 解析后的语句
-
-        Returns:
-            错误消息或 None
-        """
-        for func in stmt.find_all(exp.Func):
-            func_name = func.name.lower() if hasattr(func, "name") else str(func.key).lower()
-            if func_name in FORBIDDEN_FUNCTIONS:
-                return f"Dangerous function '{func_name}' is not allowed"
+        if isinstance(stmt, FORBIDDEN_STATEMENT_TYPES):
+            return f"Statement type '{stmt.key}' is not allowed (read-only queries only)"
         return None
 
-    def _check_select_variants(self, stmt: exp.Expression) -> str | None:
-        """检查危险的 SELECT 变体
-
-        Args:
-            stmt: 解析后的语句
-
-        Returns:
-            错误消息或 None
-        """
-        # 检查 INTO 子句 (SELECT INTO)
-        if stmt.find(exp.Into):
-            return "SELECT INTO is not allowed (creates tables)"
-
-        # 检查 FOR UPDATE/SHARE 子句
-        for _lock in stmt.find_all(exp.Lock):
-            return "Locking clause is not allowed"
+    def _check_ast(self, stmt: exp.Expression) -> str | None:
+        """单次遍历 AST，检查危险函数、SELECT 变体以及子查询/CTE 中的修改操作
 
-        return None
-
-    def _check_subqueries(self, stmt: exp.Expression) -> str | None:
-        """检查子查询和 CTE 中的修改操作
+        多个问题同时存在时，按 危险函数 > SELECT INTO > 锁定子句 > CTE > 子查询
+        的优先级返回错误消息。
 
         Args:
             stmt: 解析后的语句
@@ -291,23 +344,29 @@ class SQLParser:
         Returns:
             错误消息或 None
         """
-        # 检查 CTE
-        for cte in stmt.find_all(exp.CTE):
-            cte_query = cte.this
-            if cte_query:
-                for forbidden_type in FORBIDDEN_STATEMENT_TYPES:
-                    if isinstance(cte_query, forbidden_type):
-                        return f"CTE contains forbidden statement type: {cte_query.key}"
-
-        # 检查子查询
-        for subquery in stmt.find_all(exp.Subquery):
-            inner = subquery.this
-            if inner:
-                for forbidden_type in FORBIDDEN_STATEMENT_TYPES:
-                    if isinstance(inner, forbidden_type):
-                        return f"Subquery contains forbidden statement type: {inner.key}"
-
-        return None
+        into_error: str | None = None
+        lock_error: str | None = None
+        cte_error: str | None = None
+        subquery_error: str | None = None
+
+        for node in stmt.walk():
+            if isinstance(node, exp.Func):
+                func_name = node.name.lower() if hasattr(node, "name") else str(node.key).lower()
+                if func_name in FORBIDDEN_FUNCTIONS:
+                    # 危险函数优先级最高，命中即可返回
+                    return f"Dangerous function '{func_name}' is not allowed"
+            elif isinstance(node, exp.Into):
+                into_error = "SELECT INTO is not allowed (creates tables)"
+            elif isinstance(node, exp.Lock):
+                lock_error = "Locking clause is not allowed"
+            elif isinstance(node, exp.CTE):
+                if cte_error is None and isinstance(node.this, FORBIDDEN_STATEMENT_TYPES):
+                    cte_error = f"CTE contains forbidden statement type: {node.this.key}"
+            elif isinstance(node, exp.Subquery):
+                if subquery_error is None and isinstance(node.this, FORBIDDEN_STATEMENT_TYPES):
+                    subquery_error = f"Subquery contains forbidden statement type: {node.this.key}"
+
+        return into_error or lock_error or cte_error or subquery_error
 
     def validate_and_raise(self, sql: str) -> None:
         """验证 SQL 并在失败时抛出异常
@@ -362,7 +421,7 @@ class SQLParser:
                 # 添加 LIMIT
                 stmt = stmt.limit(limit)
 
-            return stmt.sql(dialect=self.dialect)
+            return stmt.sql(dialect=self._dialect)
         except Exception:
             # 解析失败时返回原始 SQL
             return sql
@@ -405,7 +464,7 @@ class SQLParser:
         try:
             statements = self.parse(sql)
             if statements:
-                return statements[0].sql(dialect=self.dialect, pretty=True)
+                return statements[0].sql(dialect=self._dialect, pretty=True)
             return sql
         except Exception:
             return sql
@@ -414,7 +473,7 @@ class SQLParser:
         """解析 SQL 用于策略验证
 
         提取 SQL 中的 schema、表、列信息，检测 SELECT * 模式，
-        并验证是否为只读查询。
+        并验证是否为只读查询。相同 SQL 字符串的结果会被缓存。
 
         Args:
             sql: SQL 语句
@@ -422,47 +481,65 @@ class SQLParser:
         Returns:
             ParsedSQLInfo: 包含解析结果的数据结构
         """
-        result = ParsedSQLInfo(sql=sql)
+        cache = self._policy_cache
+        if cache is None:
+            return self._parse_for_policy(sql)
+
+        result = cache.get(sql)
+        if result is None:
+            result = cache[sql] = self._parse_for_policy(sql)
+        return result
+
+    def _parse_for_policy(self, sql: str) -> ParsedSQLInfo:
+        """执行完整的策略解析（不经过缓存）
 
+        Args:
+            sql: SQL 语句
+
+        Returns:
+            ParsedSQLInfo: 包含解析结果的数据结构
+        """
         # 1. 解析 SQL
         try:
             statements = self.parse(sql)
         except SQLSyntaxError as e:
-            result.error_message = str(e.message)
-            result.is_readonly = False
-            return result
+            return ParsedSQLInfo(sql=sql, is_readonly=False, error_message=str(e.message))
 
         if not statements:
-            result.error_message = "No valid SQL statement found"
-            result.is_readonly = False
-            return result
+            return ParsedSQLInfo(
+                sql=sql, is_readonly=False, error_message="No valid SQL statement found"
+            )
 
         # 只处理第一条语句
         stmt = statements[0]
 
-        # 2. 检查是否为只读查询
-        validation = self.validate(sql)
-        result.is_readonly = validation.is_safe
-        if not validation.is_safe:
-            result.error_message = validation.error_message
+        # 2. 检查是否为只读查询（复用已解析的语句，不再重复解析）
+        validation = self._validate_cached(sql, statements)
 
         # 3. 提取 schema 列表
-        result.schemas = self._extract_schemas(stmt)
+        schemas = self._extract_schemas(stmt)
 
         # 4. 提取表列表（不含 schema 前缀）
-        result.tables = self._extract_tables_without_schema(stmt)
+        tables = self._extract_tables_without_schema(stmt)
 
         # 5. 提取列及其所属表
-        result.columns = self._extract_columns_with_tables(stmt)
+        columns = self._extract_columns_with_tables(stmt)
 
         # 6. 检测 SELECT *
         has_star, star_tables = self._detect_select_star(stmt)
-        result.has_select_star = has_star
-        result.select_star_tables = star_tables
 
-        return result
+        return ParsedSQLInfo(
+            sql=sql,
+            schemas=schemas,
+            tables=tables,
+            columns=columns,
+            has_select_star=has_star,
+            select_star_tables=star_tables,
+            is_readonly=validation.is_safe,
+            error_message=None if validation.is_safe else validation.error_message,
+        )
 
-    def _extract_schemas(self, ast: exp.Expression) -> list[str]:
+    def _extract_schemas(self, ast: exp.Expression) -> tuple[str, ...]:
         """从 AST 提取 schema 名称
 
         Args:
@@ -477,15 +554,15 @@ class SQLParser:
             # sqlglot 中 table.db 表示 schema
             schema = table.db
             if schema:
-                schemas.add(schema.lower())
+                schemas.add(sys.intern(schema.lower()))
 
         # 如果没有显式指定 schema，默认为 public
         if not schemas:
-            return ["public"]
+            return ("public",)
 
-        return list(schemas)
+        return tuple(schemas)
 
-    def _extract_tables_without_schema(self, ast: exp.Expression) -> list[str]:
+    def _extract_tables_without_schema(self, ast: exp.Expression) -> tuple[str, ...]:
         """提取表名（不含 schema 前缀）
 
         Args:
@@ -499,11 +576,13 @@ class SQLParser:
         for table in ast.find_all(exp.Table):
             name = table.name
             if name:
-                tables.add(name.lower())
+                tables.add(sys.intern(name.lower()))
 
-        return list(tables)
+        return tuple(tables)
 
-    def _extract_columns_with_tables(self, ast: exp.Expression) -> list[tuple[str, str]]:
+    def _extract_columns_with_tables(
+        self, ast: exp.Expression
+    ) -> tuple[tuple[str, str], ...]:
         """从 AST 提取列和其所属表
 
         对于有明确表前缀的列（如 t.id），提取表名和列名。
@@ -513,7 +592,7 @@ class SQLParser:
             ast: 解析后的 AST
 
         Returns:
-            列列表，格式为 [(table, column), ...]
+            列元组，格式为 ((table, column), ...)
         """
         columns: list[tuple[str, str]] = []
         seen: set[tuple[str, str]] = set()
@@ -527,15 +606,15 @@ class SQLParser:
                 continue
 
             # 获取表引用（可能是别名），解析为实际表名
-            table_ref = column.table
-            actual_table = alias_map.get(table_ref.lower(), table_ref.lower()) if table_ref else ""
+            table_ref = column.table.lower()
+            actual_table = (alias_map.get(table_ref) or sys.intern(table_ref)) if table_ref else ""
 
-            pair = (actual_table, col_name.lower())
+            pair = (actual_table, sys.intern(col_name.lower()))
             if pair not in seen:
                 seen.add(pair)
                 columns.append(pair)
 
-        return columns
+        return tuple(columns)
 
     def _build_table_alias_map(self, ast: exp.Expression) -> dict[str, str]:
         """构建表别名到实际表名的映射
@@ -553,7 +632,7 @@ class SQLParser:
             if not table_name:
                 continue
 
-            table_name_lower = table_name.lower()
+            table_name_lower = sys.intern(table_name.lower())
 
             # 检查是否有别名
             alias = table.alias
@@ -565,7 +644,7 @@ class SQLParser:
 
         return alias_map
 
-    def _detect_select_star(self, ast: exp.Expression) -> tuple[bool, list[str]]:
+    def _detect_select_star(self, ast: exp.Expression) -> tuple[bool, tuple[str, ...]]:
         """检测 SELECT * 及涉及的表
 
         Args:
@@ -599,9 +678,9 @@ class SQLParser:
                 for table in ast.find_all(exp.Table):
                     table_name = table.name
                     if table_name:
-                        table_name_lower = table_name.lower()
+                        table_name_lower = sys.intern(table_name.lower())
                         if table_name_lower not in seen_tables:
                             seen_tables.add(table_name_lower)
                             star_tables.append(table_name_lower)
 
-        return has_select_star, star_tables
+        return has_select_star, tuple(star_tables)
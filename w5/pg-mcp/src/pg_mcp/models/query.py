@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ReturnType(str, Enum):
@@ -44,8 +44,13 @@ class SQLGenerationResult(BaseModel):
 
 
 class SQLValidationResult(BaseModel):
-    """SQL 验证结果（内部使用）"""
+    """SQL 验证结果（内部使用）
+
+    不可变（序列字段为元组），以便 SQLParser 缓存并在多次调用间共享同一实例。
+    """
+    model_config = ConfigDict(frozen=True)
+
     is_valid: bool
     is_safe: bool
     error_message: str | None = None
-    warnings: list[str] = Field(default_factory=list)
+    warnings: tuple[str, ...] = ()
@@ -40,7 +40,7 @@ class MetricsServer:
         """Initialize the metrics server.
 
         Args:
-            port: The port to listen on
+            port: The port to listen on (0 lets the OS pick a free port)
             registry: Optional custom CollectorRegistry. If not provided,
                      the default registry will be used.
             path: The path to expose metrics at (default: /metrics)
@@ -53,7 +53,13 @@ class MetricsServer:
 
     @property
     def port(self) -> int:
-        """Get the configured port."""
+        """Get the listening port.
+
+        While running this is the port actually bound, so a server configured
+        with port 0 reports the free port the OS picked for it.
+        """
+        if self._server is not None and self._server.sockets:
+            return self._server.sockets[0].getsockname()[1]
         return self._port
 
     @property
@@ -83,7 +89,7 @@ class MetricsServer:
         self._started = True
         logger.info(
             "Metrics server started",
-            port=self._port,
+            port=self.port,
             path=self._path,
         )
 
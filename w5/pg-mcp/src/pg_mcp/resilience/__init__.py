@@ -12,6 +12,7 @@ from pg_mcp.resilience.backoff import (
 )
 from pg_mcp.resilience.rate_limiter import (
     ClientIdentifier,
+    RateLimitBatchResult,
     RateLimitBucket,
     RateLimitConfig,
     RateLimiter,
@@ -37,6 +38,7 @@ __all__ = [
     "create_backoff_strategy",
     # Rate limiting
     "ClientIdentifier",
+    "RateLimitBatchResult",
     "RateLimitBucket",
     "RateLimitConfig",
     "RateLimiter",
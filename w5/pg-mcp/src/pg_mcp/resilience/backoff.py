@@ -10,6 +10,7 @@
 
 import random
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 
@@ -37,6 +38,18 @@ class BackoffStrategy(ABC):
         """
         pass
 
+    def get_delays(self, attempts: Iterable[int]) -> list[float]:
+        """
+        一次性计算多次重试的等待时间
+
+        Args:
+            attempts: 重试次数序列（从 1 开始）
+
+        Returns:
+            与 attempts 一一对应的等待时间列表（秒）
+        """
+        return [self.get_delay(attempt) for attempt in attempts]
+
 
 @dataclass
 class ExponentialBackoff(BackoffStrategy):
@@ -69,6 +82,9 @@ class FixedBackoff(BackoffStrategy):
     def get_delay(self, attempt: int) -> float:
         return self.delay
 
+    def get_delays(self, attempts: Iterable[int]) -> list[float]:
+        return [self.delay for _ in attempts]
+
 
 @dataclass
 class FibonacciBackoff(BackoffStrategy):
@@ -89,6 +105,19 @@ class FibonacciBackoff(BackoffStrategy):
         delay = a * self.base_delay
         return min(delay, self.max_delay)
 
+    def get_delays(self, attempts: Iterable[int]) -> list[float]:
+        # 对递增的 attempts 复用上一次的斐波那契状态，避免每次从头计算
+        delays = []
+        n, a, b = 1, 1, 1
+        for attempt in attempts:
+            if attempt < n:
+                n, a, b = 1, 1, 1
+            while n < attempt:
+                a, b = b, a + b
+                n += 1
+            delays.append(min(a * self.base_delay, self.max_delay))
+        return delays
+
 
 def create_backoff_strategy(
     strategy_type: BackoffStrategyType,
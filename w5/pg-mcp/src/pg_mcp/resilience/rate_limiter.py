@@ -9,7 +9,9 @@
 - 多种限制策略（拒绝/排队/延迟）
 """
 
+import heapq
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 
@@ -65,6 +67,17 @@ class RateLimitResult:
     retry_after: float | None = None  # 秒
 
 
+@dataclass
+class RateLimitBatchResult:
+    """批量速率限制检查结果"""
+    allowed_count: int
+    denied_count: int
+    limit: int
+    remaining: int
+    reset_at: float  # Unix timestamp
+    retry_after: float | None = None  # 秒
+
+
 @dataclass
 class RateLimitBucket:
     """速率限制桶"""
@@ -74,7 +87,8 @@ class RateLimitBucket:
     def check_and_increment(
         self,
         limit: int,
-        window_seconds: float
+        window_seconds: float,
+        now: float | None = None
     ) -> tuple[bool, int, float]:
         """
         检查并增加计数
@@ -82,11 +96,13 @@ class RateLimitBucket:
         Args:
             limit: 限制值
             window_seconds: 时间窗口（秒）
+            now: 当前时间，默认 time.time()
 
         Returns:
             (是否允许, 剩余配额, 重置时间)
         """
-        now = time.time()
+        if now is None:
+            now = time.time()
 
         # 检查是否需要重置
         if now >= self.reset_at:
@@ -101,6 +117,38 @@ class RateLimitBucket:
         self.count += 1
         return True, limit - self.count, self.reset_at
 
+    def check_and_increment_many(
+        self,
+        n: int,
+        limit: int,
+        window_seconds: float,
+        now: float | None = None
+    ) -> tuple[int, int, float]:
+        """
+        一次性检查并增加 n 次计数
+
+        与连续调用 n 次 check_and_increment 结果一致。
+
+        Args:
+            n: 请求次数
+            limit: 限制值
+            window_seconds: 时间窗口（秒）
+            now: 当前时间，默认 time.time()
+
+        Returns:
+            (允许次数, 剩余配额, 重置时间)
+        """
+        if now is None:
+            now = time.time()
+
+        if now >= self.reset_at:
+            self.count = 0
+            self.reset_at = now + window_seconds
+
+        granted = max(0, min(n, limit - self.count))
+        self.count += granted
+        return granted, max(0, limit - self.count), self.reset_at
+
 
 class RateLimiter:
     """
@@ -110,10 +158,24 @@ class RateLimiter:
     - 在请求处理前检查速率限制
     - 在请求处理后记录 Token 消耗
     - 支持全局和单客户端限制
+
+    并发模型:
+    所有检查方法都是同步的且内部没有 await，在事件循环中天然原子执行，
+    因此客户端桶字典无需加锁（也无需分片锁）。多线程共享同一实例不受支持。
     """
 
-    def __init__(self, config: RateLimitConfig):
+    def __init__(
+        self,
+        config: RateLimitConfig,
+        clock: Callable[[], float] | None = None
+    ):
+        """
+        Args:
+            config: 速率限制配置
+            clock: 返回当前 Unix 时间的函数，默认在调用时解析为 time.time（测试可注入假时钟）
+        """
         self.config = config
+        self._clock = clock
 
         # 全局桶
         self._global_minute_bucket = RateLimitBucket()
@@ -125,9 +187,33 @@ class RateLimiter:
 
         # 客户端桶
         self._client_buckets: dict[str, RateLimitBucket] = {}
+        # (reset_at, client_key) 最小堆，用于快速清理过期桶。每个桶只有一个条目，
+        # 记录的 reset_at 可能早于桶的实际值，清理时再惰性更新
+        self._client_expiry_heap: list[tuple[float, str]] = []
 
         self._logger = logger.bind(component="rate_limiter")
 
+    def _now(self) -> float:
+        """获取当前时间"""
+        return (self._clock or time.time)()
+
+    def _get_client_bucket(self, client_key: str) -> RateLimitBucket:
+        """获取客户端桶，不存在时创建"""
+        bucket = self._client_buckets.get(client_key)
+        if bucket is None:
+            bucket = self._client_buckets[client_key] = RateLimitBucket()
+        return bucket
+
+    def _track_client_bucket(
+        self,
+        client_key: str,
+        bucket: RateLimitBucket,
+        previous_reset_at: float
+    ) -> None:
+        """新桶首次使用时加入清理堆；之后的窗口续期不再入堆，堆大小不超过桶数"""
+        if not previous_reset_at:
+            heapq.heappush(self._client_expiry_heap, (bucket.reset_at, client_key))
+
     def _get_client_key(
         self,
         client_ip: str | None,
@@ -159,18 +245,20 @@ class RateLimiter:
         Returns:
             RateLimitResult
         """
+        now = self._now()
         if not self.config.enabled:
             return RateLimitResult(
                 allowed=True,
                 limit=self.config.requests_per_minute,
                 remaining=self.config.requests_per_minute,
-                reset_at=time.time() + 60
+                reset_at=now + 60
             )
 
         # 检查全局限制（每分钟）
         allowed, remaining, reset_at = self._global_minute_bucket.check_and_increment(
             self.config.requests_per_minute,
-            60.0
+            60.0,
+            now=now
         )
         if not allowed:
             self._logger.warning(
@@ -183,13 +271,14 @@ class RateLimiter:
                 limit=self.config.requests_per_minute,
                 remaining=0,
                 reset_at=reset_at,
-                retry_after=reset_at - time.time()
+                retry_after=reset_at - now
             )
 
         # 检查全局限制（每小时）
         allowed, _, _ = self._global_hour_bucket.check_and_increment(
             self.config.requests_per_hour,
-            3600.0
+            3600.0,
+            now=now
         )
         if not allowed:
             self._logger.warning(
@@ -202,19 +291,19 @@ class RateLimiter:
                 limit=self.config.requests_per_hour,
                 remaining=0,
                 reset_at=self._global_hour_bucket.reset_at,
-                retry_after=self._global_hour_bucket.reset_at - time.time()
+                retry_after=self._global_hour_bucket.reset_at - now
             )
 
         # 检查单客户端限制
         client_key = self._get_client_key(client_ip, session_id)
-        if client_key not in self._client_buckets:
-            self._client_buckets[client_key] = RateLimitBucket()
-
-        client_bucket = self._client_buckets[client_key]
+        client_bucket = self._get_client_bucket(client_key)
+        previous_reset_at = client_bucket.reset_at
         allowed, client_remaining, client_reset = client_bucket.check_and_increment(
             self.config.per_client_per_minute,
-            60.0
+            60.0,
+            now=now
         )
+        self._track_client_bucket(client_key, client_bucket, previous_reset_at)
         if not allowed:
             self._logger.warning(
                 "Client rate limit exceeded",
@@ -227,7 +316,7 @@ class RateLimiter:
                 limit=self.config.per_client_per_minute,
                 remaining=0,
                 reset_at=client_reset,
-                retry_after=client_reset - time.time()
+                retry_after=client_reset - now
             )
 
         return RateLimitResult(
@@ -237,6 +326,107 @@ class RateLimiter:
             reset_at=reset_at
         )
 
+    def check_requests(
+        self,
+        n: int,
+        client_ip: str | None = None,
+        session_id: str | None = None
+    ) -> RateLimitBatchResult:
+        """
+        批量检查 n 个请求
+
+        结果与连续调用 n 次 check_request 一致，但每个桶只计算一次。
+
+        Args:
+            n: 请求数量
+            client_ip: 客户端 IP（SSE 模式）
+            session_id: 会话 ID
+
+        Returns:
+            RateLimitBatchResult
+
+        Raises:
+            ValueError: n 为负数
+        """
+        if n < 0:
+            raise ValueError(f"Request count must be non-negative, got {n}")
+
+        now = self._now()
+        if not self.config.enabled:
+            return RateLimitBatchResult(
+                allowed_count=n,
+                denied_count=0,
+                limit=self.config.requests_per_minute,
+                remaining=self.config.requests_per_minute,
+                reset_at=now + 60
+            )
+
+        # 全局限制（每分钟）：被拒绝的请求不会进入后续桶
+        passed_minute, remaining, reset_at = self._global_minute_bucket.check_and_increment_many(
+            n,
+            self.config.requests_per_minute,
+            60.0,
+            now=now
+        )
+        limit = self.config.requests_per_minute
+        denied_reset_at = reset_at
+
+        # 全局限制（每小时）
+        passed_hour = 0
+        if passed_minute > 0:
+            passed_hour, _, hour_reset = self._global_hour_bucket.check_and_increment_many(
+                passed_minute,
+                self.config.requests_per_hour,
+                3600.0,
+                now=now
+            )
+            if passed_hour < passed_minute:
+                limit = self.config.requests_per_hour
+                denied_reset_at = hour_reset
+
+        # 单客户端限制
+        allowed_count = 0
+        if passed_hour > 0:
+            client_key = self._get_client_key(client_ip, session_id)
+            client_bucket = self._get_client_bucket(client_key)
+            previous_reset_at = client_bucket.reset_at
+            allowed_count, _, client_reset = client_bucket.check_and_increment_many(
+                passed_hour,
+                self.config.per_client_per_minute,
+                60.0,
+                now=now
+            )
+            self._track_client_bucket(client_key, client_bucket, previous_reset_at)
+            if allowed_count < passed_hour:
+                limit = self.config.per_client_per_minute
+                denied_reset_at = client_reset
+
+        denied_count = n - allowed_count
+        if denied_count:
+            self._logger.warning(
+                "Rate limit exceeded in batch",
+                requested=n,
+                denied=denied_count,
+                limit=limit,
+                reset_at=denied_reset_at
+            )
+            return RateLimitBatchResult(
+                allowed_count=allowed_count,
+                denied_count=denied_count,
+                limit=limit,
+                remaining=0,
+                reset_at=denied_reset_at,
+                retry_after=denied_reset_at - now
+            )
+
+        return RateLimitBatchResult(
+            allowed_count=allowed_count,
+            denied_count=0,
+            limit=self.config.requests_per_minute,
+            remaining=remaining,
+            reset_at=reset_at
+        )
+
     def record_tokens(self, tokens_used: int) -> RateLimitResult:
         """
         记录 Token 消耗
@@ -252,11 +442,11 @@ class RateLimiter:
                 allowed=True,
                 limit=self.config.tokens_per_minute,
                 remaining=self.config.tokens_per_minute,
-                reset_at=time.time() + 60
+                reset_at=self._now() + 60
             )
 
         # 更新 Token 计数（每分钟）
-        now = time.time()
+        now = self._now()
         if now >= self._token_minute_bucket.reset_at:
             self._token_minute_bucket.count = 0
             self._token_minute_bucket.reset_at = now + 60
@@ -312,21 +502,30 @@ class RateLimiter:
         Returns:
             清理的桶数量
         """
-        now = time.time()
-        stale_keys = [
-            key for key, bucket in self._client_buckets.items()
-            if now - bucket.reset_at > max_age
-        ]
-        for key in stale_keys:
-            del self._client_buckets[key]
-
-        if stale_keys:
+        now = self._now()
+        heap = self._client_expiry_heap
+        cleaned = 0
+
+        # 只弹出已过期的堆顶，复杂度 O(k log n) 而非全量扫描
+        while heap and now - heap[0][0] > max_age:
+            _, key = heapq.heappop(heap)
+            bucket = self._client_buckets.get(key)
+            if bucket is None:
+                continue
+            if now - bucket.reset_at > max_age:
+                del self._client_buckets[key]
+                cleaned += 1
+            else:
+                # 桶已进入新窗口：按实际重置时间重新入堆
+                heapq.heappush(heap, (bucket.reset_at, key))
+
+        if cleaned:
             self._logger.debug(
                 "Cleaned up stale client buckets",
-                count=len(stale_keys)
+                count=cleaned
             )
 
-        return len(stale_keys)
+        return cleaned
 
     def get_status(self) -> dict[str, int | float | bool]:
         """
@@ -365,4 +564,5 @@ class RateLimiter:
         self._token_minute_bucket = RateLimitBucket()
         self._token_hour_bucket = RateLimitBucket()
         self._client_buckets.clear()
+        self._client_expiry_heap.clear()
         self._logger.info("Rate limiter reset")
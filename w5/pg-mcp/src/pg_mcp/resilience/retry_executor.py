@@ -9,6 +9,7 @@
 """
 
 import asyncio
+import re
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import TypeVar
@@ -25,6 +26,14 @@ logger = structlog.get_logger()
 
 T = TypeVar("T")
 
+# 数据库错误分类（模块加载时预编译，忽略大小写，避免每次 lower() 后多次子串扫描）
+_CONNECTION_LOST_RE = re.compile(
+    r"connection.*(?:lost|closed)|(?:lost|closed).*connection",
+    re.IGNORECASE | re.DOTALL,
+)
+_TIMEOUT_RE = re.compile(r"timeout", re.IGNORECASE)
+_SYNTAX_RE = re.compile(r"syntax", re.IGNORECASE)
+
 
 @dataclass
 class RetryConfig:
@@ -78,9 +87,19 @@ class RetryExecutor:
     - 记录重试日志
     """
 
-    def __init__(self, config: RetryConfig):
+    def __init__(
+        self,
+        config: RetryConfig,
+        sleep: Callable[[float], Awaitable[None]] | None = None,
+    ):
+        """
+        Args:
+            config: 重试配置
+            sleep: 退避等待函数，默认在调用时解析为 asyncio.sleep（测试可注入空操作）
+        """
         self.config = config
         self.backoff: BackoffStrategy = self._create_backoff(config)
+        self._sleep = sleep
 
     def _create_backoff(self, config: RetryConfig) -> BackoffStrategy:
         """Create backoff strategy based on config."""
@@ -160,7 +179,7 @@ class RetryExecutor:
                     error=str(e)
                 )
 
-                await asyncio.sleep(delay)
+                await (self._sleep or asyncio.sleep)(delay)
 
         # 不应该到达这里
         raise last_exception  # type: ignore
@@ -180,8 +199,12 @@ class RetryExecutor:
 class OpenAIRetryExecutor(RetryExecutor):
     """OpenAI API 专用重试执行器"""
 
-    def __init__(self, config: OpenAIRetryConfig | None = None):
-        super().__init__(config or OpenAIRetryConfig())
+    def __init__(
+        self,
+        config: OpenAIRetryConfig | None = None,
+        sleep: Callable[[float], Awaitable[None]] | None = None,
+    ):
+        super().__init__(config or OpenAIRetryConfig(), sleep=sleep)
 
     def _is_default_retryable(self, error: Exception) -> bool:
         """OpenAI 特定的可重试判断"""
@@ -202,24 +225,28 @@ class OpenAIRetryExecutor(RetryExecutor):
 class DatabaseRetryExecutor(RetryExecutor):
     """数据库操作专用重试执行器"""
 
-    def __init__(self, config: DatabaseRetryConfig | None = None):
-        super().__init__(config or DatabaseRetryConfig())
+    def __init__(
+        self,
+        config: DatabaseRetryConfig | None = None,
+        sleep: Callable[[float], Awaitable[None]] | None = None,
+    ):
+        super().__init__(config or DatabaseRetryConfig(), sleep=sleep)
 
     def _is_default_retryable(self, error: Exception) -> bool:
         """数据库特定的可重试判断"""
         error_type = type(error).__name__
-        error_str = str(error).lower()
+        error_str = str(error)
 
         # 连接丢失可重试
-        if "connection" in error_str and ("lost" in error_str or "closed" in error_str):
+        if _CONNECTION_LOST_RE.search(error_str):
             return True
 
         # 超时可重试
-        if "timeout" in error_str or "TimeoutError" in error_type:
+        if _TIMEOUT_RE.search(error_str) or "TimeoutError" in error_type:
             return True
 
         # 语法错误不可重试
-        if "syntax" in error_str or "SyntaxError" in error_type:
+        if _SYNTAX_RE.search(error_str) or "SyntaxError" in error_type:
             return False
 
         return super()._is_default_retryable(error)
@@ -15,6 +15,7 @@ from pg_mcp.security.access_policy import (
     PolicyViolation,
     SchemaAccessDeniedError,
     TableAccessDeniedError,
+    ViolationKind,
 )
 from pg_mcp.security.audit_logger import (
     AuditEvent,
@@ -43,6 +44,7 @@ __all__ = [
     "PolicyViolation",
     "SchemaAccessDeniedError",
     "TableAccessDeniedError",
+    "ViolationKind",
     # Audit logging
     "AuditEvent",
     "AuditEventType",
@@ -9,8 +9,9 @@ This module provides:
 
 import fnmatch
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntFlag
 from typing import TYPE_CHECKING, NamedTuple
 
 import structlog
@@ -27,6 +28,20 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Glob wildcards that fnmatch.translate turns into regex operators
+_GLOB_WILDCARDS = re.compile(r"[*?]")
+
+
+def _required_literal(pattern: str) -> str:
+    """Return the longest literal run that every match of a glob must contain.
+
+    Used as a cheap substring pre-check before running the pattern regex.
+    Returns "" (always passes) for patterns with bracket expressions.
+    """
+    if "[" in pattern:
+        return ""
+    return max(_GLOB_WILDCARDS.split(pattern), key=len)
+
 
 class PolicyCheckResult(str, Enum):
     """Policy check result status."""
@@ -36,15 +51,24 @@ class PolicyCheckResult(str, Enum):
     WARNING = "warning"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PolicyViolation:
-    """Policy violation details."""
+    """Policy violation details (immutable, no per-instance __dict__)."""
 
     check_type: str  # "schema", "table", "column", "explain"
     resource: str  # The denied resource
     reason: str  # Denial reason
 
 
+class ViolationKind(IntFlag):
+    """Bit flags for the check types present in a result's violations."""
+
+    NONE = 0
+    SCHEMA = 1
+    TABLE = 2
+    COLUMN = 4
+
+
 class PolicyValidationResult(NamedTuple):
     """Policy validation result."""
 
@@ -52,6 +76,8 @@ class PolicyValidationResult(NamedTuple):
     violations: list[PolicyViolation]
     warnings: list[str]
     rewritten_sql: str | None = None  # Only used in filter mode
+    # Union of the kinds in violations, e.g. ``result.violation_kinds & ViolationKind.TABLE``
+    violation_kinds: ViolationKind = ViolationKind.NONE
 
 
 class TableAccessDeniedError(PgMcpError):
@@ -107,20 +133,62 @@ class DatabaseAccessPolicy:
             config: Access policy configuration
         """
         self.config = config
-        self._compiled_patterns: list[re.Pattern[str]] = []
+        # All denied patterns as one alternation regex, plus the literal runs
+        # used to skip it for names that cannot match any pattern
+        self._denied_pattern: re.Pattern[str] | None = None
+        self._pattern_literals: tuple[str, ...] = ()
         self._compile_patterns()
 
+        # Lowercased lookup sets, built once so each check is a single hash lookup
+        self._allowed_schemas = frozenset(s.lower() for s in config.allowed_schemas)
+        self._allowed_tables = frozenset(t.lower() for t in config.tables.allowed)
+        self._denied_tables = frozenset(t.lower() for t in config.tables.denied)
+        self._denied_columns = frozenset(c.lower() for c in config.columns.denied)
+        self._denied_columns_by_table = self._group_denied_columns(self._denied_columns)
+
         # Validate configuration consistency
         warnings = config.validate_consistency()
         for warning in warnings:
             logger.warning("access_policy_config_warning", warning=warning)
 
     def _compile_patterns(self) -> None:
-        """Pre-compile column name patterns for matching."""
-        for pattern in self.config.columns.denied_patterns:
-            # Convert glob pattern to regex
-            regex = fnmatch.translate(pattern.lower())
-            self._compiled_patterns.append(re.compile(regex))
+        """Pre-compile column name patterns into a single alternation regex."""
+        patterns = [p.lower() for p in self.config.columns.denied_patterns]
+        if not patterns:
+            return
+        # Convert glob patterns to regex; one match() call checks them all
+        self._denied_pattern = re.compile(
+            "|".join(f"(?:{fnmatch.translate(p)})" for p in patterns)
+        )
+        self._pattern_literals = tuple(dict.fromkeys(_required_literal(p) for p in patterns))
+
+    @staticmethod
+    def _group_denied_columns(denied: frozenset[str]) -> dict[str, frozenset[str]]:
+        """Index ``table.column`` entries by table for SELECT * expansion.
+
+        An entry is indexed under every dot split, so ``a.b.c`` is found both
+        as column ``b.c`` of ``a`` and as column ``c`` of ``a.b``, exactly as
+        the full-name comparison would.
+        """
+        by_table: dict[str, set[str]] = {}
+        for full_name in denied:
+            index = full_name.find(".")
+            while index != -1:
+                by_table.setdefault(full_name[:index], set()).add(full_name[index + 1 :])
+                index = full_name.find(".", index + 1)
+        return {table: frozenset(cols) for table, cols in by_table.items()}
+
+    def _matches_denied_pattern(self, full_name: str) -> bool:
+        """Check a lowercase ``table.column`` name against the denied patterns.
+
+        Most columns match no pattern; the substring pre-check rejects those
+        without running the (backtracking) regex.
+        """
+        if self._denied_pattern is None:
+            return False
+        if not any(literal in full_name for literal in self._pattern_literals):
+            return False
+        return self._denied_pattern.match(full_name) is not None
 
     def validate_schema(self, schema: str) -> PolicyValidationResult:
         """
@@ -132,24 +200,16 @@ class DatabaseAccessPolicy:
         Returns:
             PolicyValidationResult
         """
-        schema_lower = schema.lower()
-        allowed_schemas_lower = [s.lower() for s in self.config.allowed_schemas]
-
-        if schema_lower not in allowed_schemas_lower:
-            return PolicyValidationResult(
-                passed=False,
-                violations=[
-                    PolicyViolation(
-                        check_type="schema",
-                        resource=schema,
-                        reason=f"Schema not in allowed list: {self.config.allowed_schemas}",
-                    )
-                ],
-                warnings=[],
-            )
-        return PolicyValidationResult(passed=True, violations=[], warnings=[])
+        violations: list[PolicyViolation] = []
+        kinds = self._check_schema(schema, violations)
+        return PolicyValidationResult(
+            passed=len(violations) == 0,
+            violations=violations,
+            warnings=[],
+            violation_kinds=kinds,
+        )
 
-    def validate_tables(self, tables: list[str]) -> PolicyValidationResult:
+    def validate_tables(self, tables: Sequence[str]) -> PolicyValidationResult:
         """
         Validate table access permissions.
 
@@ -161,13 +221,63 @@ class DatabaseAccessPolicy:
         Returns:
             PolicyValidationResult
         """
-        violations = []
-        tables_lower = [t.lower() for t in tables]
+        violations: list[PolicyViolation] = []
+        kinds = self._check_tables(tables, violations)
+        return PolicyValidationResult(
+            passed=len(violations) == 0,
+            violations=violations,
+            warnings=[],
+            violation_kinds=kinds,
+        )
+
+    def validate_columns(
+        self,
+        columns: Sequence[tuple[str, str]],  # [(table, column), ...]
+        is_select_star: bool = False,
+    ) -> PolicyValidationResult:
+        """
+        Validate column access permissions.
+
+        Args:
+            columns: Column list, each item is (table, column) tuple
+            is_select_star: Whether from SELECT * expansion
 
-        allowed = [t.lower() for t in self.config.tables.allowed]
-        denied = [t.lower() for t in self.config.tables.denied]
+        Returns:
+            PolicyValidationResult
+        """
+        violations: list[PolicyViolation] = []
+        warnings: list[str] = []
+        kinds = self._check_columns(columns, is_select_star, violations, warnings)
+        return PolicyValidationResult(
+            passed=len(violations) == 0,
+            violations=violations,
+            warnings=warnings,
+            violation_kinds=kinds,
+        )
 
-        for table in tables_lower:
+    def _check_schema(self, schema: str, violations: list[PolicyViolation]) -> ViolationKind:
+        """Append a violation if the schema is not allowed; return the kinds added."""
+        if schema.lower() in self._allowed_schemas:
+            return ViolationKind.NONE
+        violations.append(
+            PolicyViolation(
+                check_type="schema",
+                resource=schema,
+                reason=f"Schema not in allowed list: {self.config.allowed_schemas}",
+            )
+        )
+        return ViolationKind.SCHEMA
+
+    def _check_tables(
+        self, tables: Sequence[str], violations: list[PolicyViolation]
+    ) -> ViolationKind:
+        """Append a violation for each table the whitelist/blacklist denies."""
+        allowed = self._allowed_tables
+        denied = self._denied_tables
+        count = len(violations)
+
+        for table in tables:
+            table = table.lower()
             # Whitelist mode
             if allowed and table not in allowed:
                 violations.append(
@@ -187,78 +297,60 @@ class DatabaseAccessPolicy:
                     )
                 )
 
-        return PolicyValidationResult(
-            passed=len(violations) == 0,
-            violations=violations,
-            warnings=[],
-        )
+        return ViolationKind.TABLE if len(violations) > count else ViolationKind.NONE
 
-    def validate_columns(
+    def _check_columns(
         self,
-        columns: list[tuple[str, str]],  # [(table, column), ...]
-        is_select_star: bool = False,
-    ) -> PolicyValidationResult:
+        columns: Sequence[tuple[str, str]],
+        is_select_star: bool,
+        violations: list[PolicyViolation],
+        warnings: list[str],
+        reasons: dict[str, str | None] | None = None,
+    ) -> ViolationKind:
+        """Append a violation for each denied column, plus the SELECT * warning.
+
+        ``reasons`` memoizes the verdict per ``table.column`` name when given,
+        so a batch checks each distinct column once.
         """
-        Validate column access permissions.
-
-        Args:
-            columns: Column list, each item is (table, column) tuple
-            is_select_star: Whether from SELECT * expansion
-
-        Returns:
-            PolicyValidationResult
-        """
-        violations = []
         denied_columns: list[str] = []
 
-        denied_explicit = [c.lower() for c in self.config.columns.denied]
-
         for table, column in columns:
             full_name = f"{table.lower()}.{column.lower()}"
 
-            # Check explicit denied list
-            if full_name in denied_explicit:
-                violations.append(
-                    PolicyViolation(
-                        check_type="column",
-                        resource=full_name,
-                        reason="Column in denied list",
-                    )
-                )
-                denied_columns.append(full_name)
+            if reasons is None:
+                reason = self._column_denial_reason(full_name)
+            elif full_name in reasons:
+                reason = reasons[full_name]
+            else:
+                reason = reasons[full_name] = self._column_denial_reason(full_name)
+            if reason is None:
                 continue
 
-            # Check pattern matching
-            for pattern in self._compiled_patterns:
-                if pattern.match(full_name):
-                    violations.append(
-                        PolicyViolation(
-                            check_type="column",
-                            resource=full_name,
-                            reason="Column matches denied pattern",
-                        )
-                    )
-                    denied_columns.append(full_name)
-                    break
+            violations.append(
+                PolicyViolation(check_type="column", resource=full_name, reason=reason)
+            )
+            denied_columns.append(full_name)
 
         # Special handling for SELECT *
         if (
             is_select_star
-            and violations
+            and denied_columns
             and self.config.columns.select_star_policy == SelectStarPolicy.REJECT
         ):
             # Explicitly indicate which sensitive columns are triggered
-            return PolicyValidationResult(
-                passed=False,
-                violations=violations,
-                warnings=[f"SELECT * would access sensitive columns: {denied_columns}"],
-            )
+            warnings.append(f"SELECT * would access sensitive columns: {denied_columns}")
 
-        return PolicyValidationResult(
-            passed=len(violations) == 0,
-            violations=violations,
-            warnings=[],
-        )
+        return ViolationKind.COLUMN if denied_columns else ViolationKind.NONE
+
+    def _column_denial_reason(self, full_name: str) -> str | None:
+        """Return why a lowercase ``table.column`` name is denied, or None."""
+        # Check explicit denied list
+        if full_name in self._denied_columns:
+            return "Column in denied list"
+        # Check pattern matching
+        if self._matches_denied_pattern(full_name):
+            return "Column matches denied pattern"
+        return None
 
     def get_safe_columns(self, table: str, all_columns: list[str]) -> list[str]:
         """
@@ -271,24 +363,23 @@ class DatabaseAccessPolicy:
         Returns:
             List of safe columns
         """
-        safe_columns = []
-        denied_explicit = [c.lower() for c in self.config.columns.denied]
+        table_lower = table.lower()
+        denied = self._denied_columns_by_table.get(table_lower, frozenset())
 
+        # Without patterns a per-table set lookup decides, no full names needed
+        if self._denied_pattern is None:
+            return [col for col in all_columns if col.lower() not in denied]
+
+        safe_columns = []
         for col in all_columns:
-            full_name = f"{table.lower()}.{col.lower()}"
+            col_lower = col.lower()
 
             # Check if in denied list
-            if full_name in denied_explicit:
+            if col_lower in denied:
                 continue
 
             # Check if matches denied pattern
-            is_denied = False
-            for pattern in self._compiled_patterns:
-                if pattern.match(full_name):
-                    is_denied = True
-                    break
-
-            if not is_denied:
+            if not self._matches_denied_pattern(f"{table_lower}.{col_lower}"):
                 safe_columns.append(col)
 
         return safe_columns
@@ -297,35 +388,66 @@ class DatabaseAccessPolicy:
         """
         Complete SQL policy validation.
 
+        Schemas, tables and columns are checked in one pass that appends to
+        a single violations list, without building per-check results.
+
         Args:
             parsed_result: SQL parse result from sql_parser
 
         Returns:
             PolicyValidationResult
         """
-        all_violations: list[PolicyViolation] = []
-        all_warnings: list[str] = []
+        return self._validate_sql(parsed_result, None)
+
+    def _validate_sql(
+        self,
+        parsed_result: "ParsedSQLInfo",
+        column_reasons: dict[str, str | None] | None,
+    ) -> PolicyValidationResult:
+        """validate_sql body; ``column_reasons`` is shared across a batch."""
+        violations: list[PolicyViolation] = []
+        warnings: list[str] = []
+
+        kinds = ViolationKind.NONE
 
         # 1. Validate schemas
         for schema in parsed_result.schemas:
-            result = self.validate_schema(schema)
-            all_violations.extend(result.violations)
-            all_warnings.extend(result.warnings)
+            kinds |= self._check_schema(schema, violations)
 
         # 2. Validate tables
-        result = self.validate_tables(parsed_result.tables)
-        all_violations.extend(result.violations)
-        all_warnings.extend(result.warnings)
+        kinds |= self._check_tables(parsed_result.tables, violations)
 
         # 3. Validate columns
-        result = self.validate_columns(
-            parsed_result.columns, is_select_star=parsed_result.has_select_star
+        kinds |= self._check_columns(
+            parsed_result.columns,
+            parsed_result.has_select_star,
+            violations,
+            warnings,
+            column_reasons,
         )
-        all_violations.extend(result.violations)
-        all_warnings.extend(result.warnings)
 
         return PolicyValidationResult(
-            passed=len(all_violations) == 0,
-            violations=all_violations,
-            warnings=all_warnings,
+            passed=len(violations) == 0,
+            violations=violations,
+            warnings=warnings,
+            violation_kinds=kinds,
         )
+
+    def validate_many(
+        self, parsed_results: Sequence["ParsedSQLInfo"]
+    ) -> list[PolicyValidationResult]:
+        """
+        Validate a batch of parsed SQL statements.
+
+        Equivalent to calling validate_sql on each item, but each distinct
+        column is looked up in the denied list and matched against the
+        denied patterns only once for the whole batch.
+
+        Args:
+            parsed_results: SQL parse results from sql_parser
+
+        Returns:
+            One PolicyValidationResult per input, in order
+        """
+        column_reasons: dict[str, str | None] = {}
+        return [self._validate_sql(parsed, column_reasons) for parsed in parsed_results]
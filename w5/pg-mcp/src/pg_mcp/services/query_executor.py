@@ -25,6 +25,7 @@ from pg_mcp.security.access_policy import (
     PolicyValidationResult,
     SchemaAccessDeniedError,
     TableAccessDeniedError,
+    ViolationKind,
 )
 from pg_mcp.security.audit_logger import AuditEventType, AuditLogger
 from pg_mcp.security.explain_validator import (
@@ -127,12 +128,12 @@ class QueryExecutor:
             # 2. Access policy check
             policy_result = self.access_policy.validate_sql(parsed)
             policy_checks = {
-                "table_access": "passed"
-                if not any(v.check_type == "table" for v in policy_result.violations)
-                else "denied",
-                "column_access": "passed"
-                if not any(v.check_type == "column" for v in policy_result.violations)
-                else "denied",
+                "table_access": "denied"
+                if policy_result.violation_kinds & ViolationKind.TABLE
+                else "passed",
+                "column_access": "denied"
+                if policy_result.violation_kinds & ViolationKind.COLUMN
+                else "passed",
                 "explain_check": "pending",
             }
 
@@ -1,7 +1,6 @@
 """Pytest configuration and fixtures."""
 
-import asyncio
-from collections.abc import Generator
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -27,12 +26,14 @@ from pg_mcp.models.schema import (
 )
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop]:
-    """Create event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+UNIT_TESTS_DIR = Path(__file__).parent / "unit"
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark every test under tests/unit with ``unit`` so ``-m unit`` skips PostgreSQL."""
+    for item in items:
+        if item.path.is_relative_to(UNIT_TESTS_DIR):
+            item.add_marker(pytest.mark.unit)
 
 
 @pytest.fixture
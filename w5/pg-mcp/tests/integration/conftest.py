@@ -2,12 +2,21 @@
 
 This module provides:
 - PostgreSQL container fixtures using testcontainers
+- Per-worker embedded PostgreSQL servers for parallel runs with pytest-xdist
 - Database setup/teardown helpers
 - Configuration fixtures for various test scenarios
 """
 
-from collections.abc import AsyncGenerator
+import contextlib
+import importlib.util
+import os
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Generator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import parse_qs, quote_plus, urlsplit
 
 import asyncpg
 import pytest
@@ -28,6 +37,11 @@ from pg_mcp.config.models import (
 from pg_mcp.infrastructure.database import DatabasePool
 
 
+# Test pools run one query at a time: asyncpg opens min_size connections on
+# connect(), so keep them tiny instead of paying the default 2..10 handshakes
+TEST_POOL_SIZES: dict[str, int] = {"min_pool_size": 1, "max_pool_size": 2}
+
+
 # =============================================================================
 # PostgreSQL Container Fixtures
 # =============================================================================
@@ -59,6 +73,175 @@ def shared_postgres_container() -> PostgresContainer:
     container.stop()
 
 
+@dataclass(frozen=True)
+class PostgresServer:
+    """Connection details for a running PostgreSQL test server.
+
+    ``host`` is either a hostname or, for the embedded pgserver cluster,
+    the directory holding its unix socket.
+    """
+
+    host: str
+    port: int
+    dbname: str
+    user: str
+    password: str
+
+    def dsn(self, dbname: str | None = None) -> str:
+        """Build a DSN for ``dbname`` (defaults to the server's own database)."""
+        auth = f"{quote_plus(self.user)}:{quote_plus(self.password)}"
+        database = dbname or self.dbname
+        if self.host.startswith("/"):
+            return f"postgresql://{auth}@/{database}?host={self.host}&port={self.port}"
+        return f"postgresql://{auth}@{self.host}:{self.port}/{database}"
+
+    def database_config(
+        self, name: str, dbname: str | None = None, **kwargs: Any
+    ) -> DatabaseConfig:
+        """Create a DatabaseConfig pointing at ``dbname`` on this server.
+
+        Pools default to ``TEST_POOL_SIZES``; pass ``min_pool_size`` /
+        ``max_pool_size`` to size a pool for concurrent tests.
+        """
+        return DatabaseConfig(
+            name=name,
+            url=self.dsn(dbname),  # type: ignore
+            ssl_mode="disable",
+            **{**TEST_POOL_SIZES, **kwargs},
+        )
+
+    @contextlib.asynccontextmanager
+    async def temporary_database(self, prefix: str) -> AsyncIterator[str]:
+        """Create a uniquely named database and drop it on exit."""
+        dbname = f"{prefix}_{uuid.uuid4().hex[:8]}"
+        conn = await self.connect()
+        try:
+            await conn.execute(f'CREATE DATABASE "{dbname}"')
+            try:
+                yield dbname
+            finally:
+                await conn.execute(f'DROP DATABASE IF EXISTS "{dbname}" WITH (FORCE)')
+        finally:
+            await conn.close()
+
+    async def connect(self, dbname: str | None = None) -> asyncpg.Connection:
+        """Open a raw asyncpg connection to ``dbname``."""
+        return await asyncpg.connect(
+            host=self.host,
+            port=self.port,
+            database=dbname or self.dbname,
+            user=self.user,
+            password=self.password or None,
+        )
+
+
+def _start_embedded_postgres(
+    pgdata: Path,
+) -> tuple[PostgresServer, Callable[[], None]]:
+    """Start an embedded pgserver cluster (no Docker, boots in well under a second)."""
+    import pgserver
+
+    srv = pgserver.get_server(pgdata, cleanup_mode="stop")
+    uri = urlsplit(srv.get_uri())
+    socket_dir = parse_qs(uri.query).get("host", [None])[0]
+    server = PostgresServer(
+        host=socket_dir or uri.hostname or "localhost",
+        port=uri.port or 5432,
+        dbname=uri.path.lstrip("/") or "postgres",
+        user=uri.username or "postgres",
+        password=uri.password or "",
+    )
+    return server, srv.cleanup
+
+
+# Run the Docker container instead of the embedded cluster. USE_TESTCONTAINERS
+# is the older name of the switch and is still honoured. pgserver is not a
+# declared dependency (it ships no wheels for Python 3.13 yet), so Docker is
+# also used whenever it is not installed.
+USE_DOCKER_POSTGRES = "1" in (
+    os.environ.get("PG_MCP_USE_DOCKER"),
+    os.environ.get("USE_TESTCONTAINERS"),
+) or importlib.util.find_spec("pgserver") is None
+
+# Image for PG_MCP_USE_DOCKER runs; point at the pre-initialized image built
+# from tests/integration/docker/Dockerfile.postgres to skip initdb on startup
+TEST_POSTGRES_IMAGE = os.environ.get("PG_MCP_TEST_IMAGE", "postgres:16")
+
+# Test data is disposable, so durability is switched off on the stock image too
+FAST_POSTGRES_COMMAND = (
+    "postgres -c fsync=off -c synchronous_commit=off -c full_page_writes=off"
+)
+
+
+# Keep containers running between pytest invocations (needs testcontainers
+# reuse enabled: testcontainers.reuse.enable=true in ~/.testcontainers.properties)
+REUSE_POSTGRES_CONTAINER = os.environ.get("PG_MCP_REUSE_CONTAINER") == "1"
+
+
+def _start_postgres_container(
+    worker_id: str,
+) -> tuple[PostgresServer, Callable[[], None]]:
+    """Start a Docker PostgreSQL container via testcontainers.
+
+    With ``PG_MCP_REUSE_CONTAINER=1`` the container is named per xdist worker
+    and left running, so the next run attaches to it instead of booting a new
+    one. Tests isolate themselves with per-test databases, so leftover state
+    from earlier runs does not leak in.
+    """
+    container = PostgresContainer(TEST_POSTGRES_IMAGE).with_command(FAST_POSTGRES_COMMAND)
+    if REUSE_POSTGRES_CONTAINER:
+        container = container.with_name(f"pg-mcp-tests-{worker_id}").with_reuse()
+    container.start()
+    server = PostgresServer(
+        host=container.get_container_host_ip(),
+        port=int(container.get_exposed_port(5432)),
+        dbname=container.dbname,
+        user=container.username,
+        password=container.password,
+    )
+    if REUSE_POSTGRES_CONTAINER:
+        return server, lambda: None
+    return server, container.stop
+
+
+@pytest.fixture(scope="session")
+def worker_postgres(
+    worker_id: str,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[PostgresServer]:
+    """Start one PostgreSQL server per pytest-xdist worker.
+
+    Session scope is per worker process under xdist, so every worker gets
+    its own server and workers never contend for the same one. Without xdist
+    ``worker_id`` is ``"master"`` and a single server serves the session.
+
+    An embedded pgserver cluster is used when pgserver is installed; set
+    ``PG_MCP_USE_DOCKER=1`` to run ``postgres:16`` (or ``PG_MCP_TEST_IMAGE``)
+    in Docker instead when image parity matters. Without pgserver, Docker is
+    always used.
+    """
+    if USE_DOCKER_POSTGRES:
+        server, stop = _start_postgres_container(worker_id)
+    else:
+        server, stop = _start_embedded_postgres(tmp_path_factory.mktemp(f"pg_{worker_id}"))
+    yield server
+    stop()
+
+
+@pytest.fixture
+async def worker_database(
+    worker_postgres: PostgresServer,
+    worker_id: str,
+) -> AsyncGenerator[str]:
+    """Create an isolated logical database on the worker's server.
+
+    Tests that create tables get a fresh database instead of a fresh server,
+    which keeps them isolated while paying the server boot only once per worker.
+    """
+    async with worker_postgres.temporary_database(f"test_{worker_id}") as dbname:
+        yield dbname
+
+
 # =============================================================================
 # Database Configuration Fixtures
 # =============================================================================
@@ -75,6 +258,7 @@ def database_config(postgres_container: PostgresContainer) -> DatabaseConfig:
         user=postgres_container.username,
         password=postgres_container.password,  # type: ignore
         ssl_mode="disable",  # testcontainers doesn't support SSL
+        **TEST_POOL_SIZES,
     )
 
 
@@ -91,6 +275,7 @@ def database_config_with_access_policy(
         user=postgres_container.username,
         password=postgres_container.password,  # type: ignore
         ssl_mode="disable",
+        **TEST_POOL_SIZES,
         access_policy=AccessPolicyConfig(
             allowed_schemas=["public"],
             tables=TableAccessConfig(
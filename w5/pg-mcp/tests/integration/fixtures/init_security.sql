@@ -0,0 +1,16 @@
+-- Schema for tests/integration/test_security.py
+-- UNLOGGED skips WAL for throwaway test data.
+
+CREATE UNLOGGED TABLE sensitive_data (
+    id SERIAL PRIMARY KEY,
+    username VARCHAR(100) NOT NULL,
+    password_hash VARCHAR(255) NOT NULL,
+    secret_key VARCHAR(255)
+);
+
+-- Target for write attempts
+CREATE UNLOGGED TABLE audit_log (
+    id SERIAL PRIMARY KEY,
+    action VARCHAR(100),
+    timestamp TIMESTAMP DEFAULT NOW()
+);
@@ -0,0 +1,6 @@
+-- Seed rows for tests/integration/test_security.py, reloaded before each test
+
+INSERT INTO sensitive_data (username, password_hash, secret_key)
+VALUES
+    ('admin', 'hash123', 'secret_admin_key'),
+    ('user1', 'hash456', 'secret_user_key');
@@ -135,7 +135,6 @@ class TestFullQueryWorkflow:
         finally:
             await conn.close()
 
-    @pytest.mark.asyncio
     async def test_simple_select_workflow(
         self,
         setup_workflow_data: None,
@@ -173,7 +172,6 @@ class TestFullQueryWorkflow:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_join_query_workflow(
         self,
         setup_workflow_data: None,
@@ -212,7 +210,6 @@ class TestFullQueryWorkflow:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_aggregation_query_workflow(
         self,
         setup_workflow_data: None,
@@ -249,7 +246,6 @@ class TestFullQueryWorkflow:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_sql_only_return_type(
         self,
         setup_workflow_data: None,
@@ -285,7 +281,6 @@ class TestFullQueryWorkflow:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_unsafe_sql_rejected(
         self,
         setup_workflow_data: None,
@@ -427,7 +422,6 @@ class TestMultiDatabaseScenarios:
         finally:
             await conn2.close()
 
-    @pytest.mark.asyncio
     async def test_query_specific_database(
         self,
         setup_multi_db_data: None,
@@ -463,7 +457,6 @@ class TestMultiDatabaseScenarios:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_default_database_used(
         self,
         setup_multi_db_data: None,
@@ -499,7 +492,6 @@ class TestMultiDatabaseScenarios:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_unknown_database_error(
         self,
         setup_multi_db_data: None,
@@ -781,7 +773,6 @@ class TestRateLimitingAcrossRequests:
         finally:
             await conn.close()
 
-    @pytest.mark.asyncio
     async def test_rate_limit_exceeded(
         self,
         setup_rate_limit_data: None,
@@ -821,7 +812,6 @@ class TestRateLimitingAcrossRequests:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_rate_limit_disabled(
         self,
         postgres_container: PostgresContainer,
@@ -944,7 +934,6 @@ class TestRetryBehaviorWithFailures:
         finally:
             await conn.close()
 
-    @pytest.mark.asyncio
     async def test_openai_error_properly_raised(
         self,
         setup_retry_data: None,
@@ -985,7 +974,6 @@ class TestRetryBehaviorWithFailures:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_sql_syntax_error_retry(
         self,
         setup_retry_data: None,
@@ -1101,7 +1089,6 @@ class TestEmptyResultHandling:
         finally:
             await conn.close()
 
-    @pytest.mark.asyncio
     async def test_empty_result_handling(
         self,
         setup_empty_data: None,
@@ -1137,7 +1124,6 @@ class TestEmptyResultHandling:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_result_limit_applied(
         self,
         setup_empty_data: None,
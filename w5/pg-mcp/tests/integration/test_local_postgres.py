@@ -75,7 +75,6 @@ async def test_table(local_pool: DatabasePool) -> AsyncGenerator[str]:
 class TestLocalPostgresConnection:
     """Test basic PostgreSQL connectivity."""
 
-    @pytest.mark.asyncio
     async def test_connection_successful(self, local_pool: DatabasePool):
         """Test that we can connect to local PostgreSQL."""
         assert local_pool.is_connected
@@ -83,7 +82,6 @@ class TestLocalPostgresConnection:
         assert result[0]["value"] == 1
         print("[OK] Basic SELECT query works")
 
-    @pytest.mark.asyncio
     async def test_version_check(self, local_pool: DatabasePool):
         """Check PostgreSQL version."""
         result = await local_pool.fetch("SELECT version()")
@@ -95,7 +93,6 @@ class TestLocalPostgresConnection:
 class TestReadOnlyTransactionDefense:
     """Test read-only transaction enforcement (defense in depth)."""
 
-    @pytest.mark.asyncio
     async def test_readonly_transaction_blocks_insert(
         self, local_pool: DatabasePool, test_table: str
     ):
@@ -106,7 +103,6 @@ class TestReadOnlyTransactionDefense:
             )
         print("[OK] INSERT blocked by read-only transaction")
 
-    @pytest.mark.asyncio
     async def test_readonly_transaction_blocks_update(
         self, local_pool: DatabasePool, test_table: str
     ):
@@ -117,7 +113,6 @@ class TestReadOnlyTransactionDefense:
             )
         print("[OK] UPDATE blocked by read-only transaction")
 
-    @pytest.mark.asyncio
     async def test_readonly_transaction_blocks_delete(
         self, local_pool: DatabasePool, test_table: str
     ):
@@ -126,7 +121,6 @@ class TestReadOnlyTransactionDefense:
             await local_pool.fetch_readonly(f"DELETE FROM {test_table} WHERE name = 'alice'")
         print("[OK] DELETE blocked by read-only transaction")
 
-    @pytest.mark.asyncio
     async def test_readonly_transaction_blocks_truncate(
         self, local_pool: DatabasePool, test_table: str
     ):
@@ -135,7 +129,6 @@ class TestReadOnlyTransactionDefense:
             await local_pool.fetch_readonly(f"TRUNCATE {test_table}")
         print("[OK] TRUNCATE blocked by read-only transaction")
 
-    @pytest.mark.asyncio
     async def test_readonly_transaction_allows_select(
         self, local_pool: DatabasePool, test_table: str
     ):
@@ -227,7 +220,6 @@ class TestSQLParserValidation:
 class TestStatementTimeout:
     """Test statement timeout enforcement."""
 
-    @pytest.mark.asyncio
     async def test_statement_timeout_works(self, local_pool: DatabasePool):
         """Test that statement timeout is enforced."""
         # This should timeout (pg_sleep for 5 seconds with 1 second timeout)
@@ -238,7 +230,6 @@ class TestStatementTimeout:
             )
         print("[OK] Statement timeout enforced")
 
-    @pytest.mark.asyncio
     async def test_fast_query_succeeds(self, local_pool: DatabasePool, test_table: str):
         """Test that fast queries succeed within timeout."""
         result = await local_pool.fetch_readonly(
@@ -252,7 +243,6 @@ class TestStatementTimeout:
 class TestDataIntegrity:
     """Test that data is not modified after attempted attacks."""
 
-    @pytest.mark.asyncio
     async def test_data_unchanged_after_blocked_insert(
         self, local_pool: DatabasePool, test_table: str
     ):
@@ -272,7 +262,6 @@ class TestDataIntegrity:
         assert before[0]["cnt"] == after[0]["cnt"]
         print(f"[OK] Data unchanged: {before[0]['cnt']} rows before and after blocked INSERT")
 
-    @pytest.mark.asyncio
     async def test_data_unchanged_after_blocked_update(
         self, local_pool: DatabasePool, test_table: str
     ):
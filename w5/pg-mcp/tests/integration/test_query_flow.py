@@ -136,7 +136,6 @@ class TestEndToEndQueryFlow:
             ),
         )
 
-    @pytest.mark.asyncio
     async def test_simple_query_flow(
         self,
         database_pool: DatabasePool,
@@ -179,7 +178,6 @@ class TestEndToEndQueryFlow:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_query_with_join(
         self,
         database_pool: DatabasePool,
@@ -222,7 +220,6 @@ class TestEndToEndQueryFlow:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_query_with_limit(
         self,
         database_pool: DatabasePool,
@@ -263,7 +260,6 @@ class TestEndToEndQueryFlow:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_sql_only_return_type(
         self,
         database_pool: DatabasePool,
@@ -411,7 +407,6 @@ class TestMultiDatabaseScenario:
         )
         await conn2.close()
 
-    @pytest.mark.asyncio
     async def test_query_specific_database(
         self,
         setup_multi_db_data: None,
@@ -450,7 +445,6 @@ class TestMultiDatabaseScenario:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_unknown_database_error(
         self,
         setup_multi_db_data: None,
@@ -480,7 +474,6 @@ class TestMultiDatabaseScenario:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_default_database_used(
         self,
         setup_multi_db_data: None,
@@ -588,7 +581,6 @@ class TestTimeoutHandling:
         )
         await conn.close()
 
-    @pytest.mark.asyncio
     async def test_query_timeout_with_slow_query(
         self,
         setup_timeout_data: None,
@@ -704,7 +696,6 @@ class TestRateLimiting:
         await conn.execute("INSERT INTO users (name) VALUES ('Test')")
         await conn.close()
 
-    @pytest.mark.asyncio
     async def test_rate_limit_exceeded(
         self,
         setup_rate_limit_data: None,
@@ -747,7 +738,6 @@ class TestRateLimiting:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_rate_limit_disabled(
         self,
         postgres_container: PostgresContainer,
@@ -874,7 +864,6 @@ class TestMockOpenAIResponses:
         )
         await conn.close()
 
-    @pytest.mark.asyncio
     async def test_aggregation_query(
         self,
         setup_data: None,
@@ -914,7 +903,6 @@ class TestMockOpenAIResponses:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_filtered_query(
         self,
         setup_data: None,
@@ -955,7 +943,6 @@ class TestMockOpenAIResponses:
             finally:
                 await server.shutdown()
 
-    @pytest.mark.asyncio
     async def test_empty_result_handling(
         self,
         setup_data: None,
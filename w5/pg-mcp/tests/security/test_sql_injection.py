@@ -54,14 +54,20 @@ UNION_INJECTION_PAYLOADS = [
 ]
 
 
+@pytest.fixture(scope="module")
+def parser() -> SQLParser:
+    """Create one SQL parser for the module (it holds no per-test state)."""
+    return SQLParser()
+
+
 class TestSQLInjection:
     """SQL injection security tests."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
-    @pytest.mark.parametrize("payload,description", STANDALONE_INJECTION_PAYLOADS)
+    @pytest.mark.parametrize(
+        "payload,description",
+        STANDALONE_INJECTION_PAYLOADS,
+        ids=[description for _, description in STANDALONE_INJECTION_PAYLOADS],
+    )
     def test_injection_blocked(self, parser: SQLParser, payload: str, description: str) -> None:
         """Test that standalone SQL injection payloads are blocked."""
         result = parser.validate(payload)
@@ -0,0 +1,15 @@
+"""Shared fixtures for configuration tests."""
+
+import pytest
+
+from pg_mcp.config.validators import ConfigValidator
+
+
+@pytest.fixture(scope="session")
+def validator() -> ConfigValidator:
+    """ConfigValidator instance shared by the whole session (it holds no state).
+
+    Under pytest-xdist every worker is its own process and session, so each
+    builds its own instance and nothing needs to be pickled across workers.
+    """
+    return ConfigValidator()
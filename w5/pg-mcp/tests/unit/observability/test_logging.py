@@ -2,7 +2,46 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import logging
+import sys
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pg_mcp.observability.logging import SlowQueryLogger, add_trace_id, setup_logging
+
+SlowLoggerFactory = Callable[..., tuple[SlowQueryLogger, Mock]]
+
+# add_trace_id imports this lazily, so it is patched at its source module
+GET_TRACING_MANAGER = "pg_mcp.observability.tracing.get_tracing_manager"
+
+
+def _tracing_manager(trace_id: str | Exception | None) -> Mock:
+    """Build a tracing manager mock whose get_current_trace_id returns or raises trace_id."""
+    manager = Mock(spec_set=["get_current_trace_id"])
+    if isinstance(trace_id, Exception):
+        manager.get_current_trace_id.side_effect = trace_id
+    else:
+        manager.get_current_trace_id.return_value = trace_id
+    return manager
+
+
+@pytest.fixture
+def slow_logger_factory() -> SlowLoggerFactory:
+    """Build a SlowQueryLogger whose structlog logger is replaced by a mock."""
+
+    def _make(
+        threshold: float = 5.0, log_sql: bool = False
+    ) -> tuple[SlowQueryLogger, Mock]:
+        # SlowQueryLogger only ever calls .warning() on its logger
+        mock_logger = Mock(spec_set=["warning"])
+        logger = SlowQueryLogger(threshold=threshold, log_sql=log_sql)
+        logger.logger = mock_logger
+        return logger, mock_logger
+
+    return _make
 
 
 class TestSlowQueryLogger:
@@ -10,27 +49,21 @@ class TestSlowQueryLogger:
 
     def test_default_threshold_value(self) -> None:
         """Test that default threshold is 5.0 seconds."""
-        from pg_mcp.observability.logging import SlowQueryLogger
-
         logger = SlowQueryLogger()
         assert logger.threshold == 5.0
         assert logger.log_sql is False
 
     def test_custom_threshold_value(self) -> None:
         """Test custom threshold value."""
-        from pg_mcp.observability.logging import SlowQueryLogger
-
         logger = SlowQueryLogger(threshold=10.0, log_sql=True)
         assert logger.threshold == 10.0
         assert logger.log_sql is True
 
-    def test_log_if_slow_does_not_log_below_threshold(self) -> None:
+    def test_log_if_slow_does_not_log_below_threshold(
+        self, slow_logger_factory: SlowLoggerFactory
+    ) -> None:
         """Test log_if_slow() does NOT log when duration < threshold."""
-        from pg_mcp.observability.logging import SlowQueryLogger
-
-        mock_logger = MagicMock()
-        logger = SlowQueryLogger(threshold=5.0)
-        logger.logger = mock_logger
+        logger, mock_logger = slow_logger_factory(threshold=5.0)
 
         logger.log_if_slow(
             duration=4.9,  # Below 5.0 threshold
@@ -41,13 +74,9 @@ class TestSlowQueryLogger:
 
         mock_logger.warning.assert_not_called()
 
-    def test_log_if_slow_logs_at_threshold(self) -> None:
+    def test_log_if_slow_logs_at_threshold(self, slow_logger_factory: SlowLoggerFactory) -> None:
         """Test log_if_slow() logs when duration == threshold."""
-        from pg_mcp.observability.logging import SlowQueryLogger
-
-        mock_logger = MagicMock()
-        logger = SlowQueryLogger(threshold=5.0)
-        logger.logger = mock_logger
+        logger, mock_logger = slow_logger_factory(threshold=5.0)
 
         logger.log_if_slow(
             duration=5.0,  # Exactly at threshold
@@ -63,13 +92,9 @@ class TestSlowQueryLogger:
         assert call_args[1]["duration_seconds"] == 5.0
         assert call_args[1]["rows_returned"] == 100
 
-    def test_log_if_slow_logs_above_threshold(self) -> None:
+    def test_log_if_slow_logs_above_threshold(self, slow_logger_factory: SlowLoggerFactory) -> None:
         """Test log_if_slow() logs when duration > threshold."""
-        from pg_mcp.observability.logging import SlowQueryLogger
-
-        mock_logger = MagicMock()
-        logger = SlowQueryLogger(threshold=5.0)
-        logger.logger = mock_logger
+        logger, mock_logger = slow_logger_factory(threshold=5.0)
 
         logger.log_if_slow(
             duration=6.5,
@@ -85,13 +110,11 @@ class TestSlowQueryLogger:
         assert call_args[1]["duration_seconds"] == 6.5
         assert call_args[1]["rows_returned"] == 10000
 
-    def test_log_if_slow_truncates_long_sql_when_log_sql_true(self) -> None:
+    def test_log_if_slow_truncates_long_sql_when_log_sql_true(
+        self, slow_logger_factory: SlowLoggerFactory
+    ) -> None:
         """Test log_if_slow() truncates SQL when log_sql=True and SQL > 500 chars."""
-        from pg_mcp.observability.logging import SlowQueryLogger
-
-        mock_logger = MagicMock()
-        logger = SlowQueryLogger(threshold=1.0, log_sql=True)
-        logger.logger = mock_logger
+        logger, mock_logger = slow_logger_factory(threshold=1.0, log_sql=True)
 
         # Create a SQL string longer than 500 characters
         long_sql = "SELECT " + "a" * 600 + " FROM table"
@@ -110,13 +133,11 @@ class TestSlowQueryLogger:
         assert len(call_args[1]["sql"]) == 500
         assert call_args[1]["sql_truncated"] is True
 
-    def test_log_if_slow_does_not_truncate_short_sql(self) -> None:
+    def test_log_if_slow_does_not_truncate_short_sql(
+        self, slow_logger_factory: SlowLoggerFactory
+    ) -> None:
         """Test log_if_slow() does not truncate SQL when <= 500 chars."""
-        from pg_mcp.observability.logging import SlowQueryLogger
-
-        mock_logger = MagicMock()
-        logger = SlowQueryLogger(threshold=1.0, log_sql=True)
-        logger.logger = mock_logger
+        logger, mock_logger = slow_logger_factory(threshold=1.0, log_sql=True)
 
         short_sql = "SELECT * FROM users WHERE id = 1"
 
@@ -134,13 +155,11 @@ class TestSlowQueryLogger:
         assert call_args[1]["sql"] == short_sql
         assert "sql_truncated" not in call_args[1]
 
-    def test_log_if_slow_only_logs_sql_length_when_log_sql_false(self) -> None:
+    def test_log_if_slow_only_logs_sql_length_when_log_sql_false(
+        self, slow_logger_factory: SlowLoggerFactory
+    ) -> None:
         """Test log_if_slow() only logs sql_length when log_sql=False."""
-        from pg_mcp.observability.logging import SlowQueryLogger
-
-        mock_logger = MagicMock()
-        logger = SlowQueryLogger(threshold=5.0, log_sql=False)
-        logger.logger = mock_logger
+        logger, mock_logger = slow_logger_factory(threshold=5.0, log_sql=False)
 
         sql = "SELECT * FROM users WHERE id = 1"
 
@@ -158,13 +177,9 @@ class TestSlowQueryLogger:
         assert "sql" not in call_args[1]
         assert call_args[1]["sql_length"] == len(sql)
 
-    def test_log_if_slow_rounds_duration(self) -> None:
+    def test_log_if_slow_rounds_duration(self, slow_logger_factory: SlowLoggerFactory) -> None:
         """Test that duration is rounded to 3 decimal places."""
-        from pg_mcp.observability.logging import SlowQueryLogger
-
-        mock_logger = MagicMock()
-        logger = SlowQueryLogger(threshold=5.0)
-        logger.logger = mock_logger
+        logger, mock_logger = slow_logger_factory(threshold=5.0)
 
         logger.log_if_slow(
             duration=5.123456789,
@@ -183,271 +198,159 @@ class TestAddTraceId:
 
     def test_adds_trace_id_when_tracing_manager_returns_valid_id(self) -> None:
         """Test that it adds trace_id when TracingManager returns a valid trace_id."""
-        from pg_mcp.observability.logging import add_trace_id
-
-        # Mock the tracing manager
-        mock_manager = MagicMock()
-        mock_manager.get_current_trace_id.return_value = "abc123def456"
-
-        with patch(
-            "pg_mcp.observability.tracing.get_tracing_manager",
-            return_value=mock_manager,
-        ):
+        with patch(GET_TRACING_MANAGER, return_value=_tracing_manager("abc123def456")):
             event_dict: dict = {"event": "test_event", "level": "info"}
             result = add_trace_id(None, "info", event_dict)
 
             assert result["trace_id"] == "abc123def456"
             assert result["event"] == "test_event"
 
-    def test_does_not_add_trace_id_when_manager_is_none(self) -> None:
-        """Test that it doesn't add trace_id when TracingManager is None."""
-        from pg_mcp.observability.logging import add_trace_id
-
-        with patch(
-            "pg_mcp.observability.tracing.get_tracing_manager",
-            return_value=None,
-        ):
+    @pytest.mark.parametrize(
+        "tracing_patch",
+        [
+            pytest.param(
+                lambda: patch(GET_TRACING_MANAGER, return_value=None),
+                id="manager_none",
+            ),
+            pytest.param(
+                lambda: patch(GET_TRACING_MANAGER, return_value=_tracing_manager(None)),
+                id="trace_id_none",
+            ),
+            pytest.param(
+                lambda: patch(GET_TRACING_MANAGER, return_value=_tracing_manager("")),
+                id="trace_id_empty",
+            ),
+            pytest.param(
+                # A None entry in sys.modules makes the lazy import raise ImportError
+                lambda: patch.dict(sys.modules, {"pg_mcp.observability.tracing": None}),
+                id="import_error",
+            ),
+            pytest.param(
+                lambda: patch(GET_TRACING_MANAGER, side_effect=RuntimeError("Unexpected error")),
+                id="manager_error",
+            ),
+            pytest.param(
+                lambda: patch(
+                    GET_TRACING_MANAGER,
+                    return_value=_tracing_manager(RuntimeError("Tracing error")),
+                ),
+                id="trace_id_error",
+            ),
+        ],
+    )
+    def test_leaves_event_unchanged_without_trace_id(
+        self, tracing_patch: Callable[[], AbstractContextManager[object]]
+    ) -> None:
+        """Test that no trace_id is added when none is available or tracing fails."""
+        with tracing_patch():
             event_dict: dict = {"event": "test_event", "level": "info"}
             result = add_trace_id(None, "info", event_dict)
 
-            assert "trace_id" not in result
-            assert result["event"] == "test_event"
-
-    def test_does_not_add_trace_id_when_trace_id_is_none(self) -> None:
-        """Test that it doesn't add trace_id when get_current_trace_id returns None."""
-        from pg_mcp.observability.logging import add_trace_id
-
-        mock_manager = MagicMock()
-        mock_manager.get_current_trace_id.return_value = None
-
-        with patch(
-            "pg_mcp.observability.tracing.get_tracing_manager",
-            return_value=mock_manager,
-        ):
-            event_dict: dict = {"event": "test_event"}
-            result = add_trace_id(None, "info", event_dict)
-
-            assert "trace_id" not in result
-
-    def test_does_not_add_trace_id_when_trace_id_is_empty_string(self) -> None:
-        """Test that it doesn't add trace_id when get_current_trace_id returns empty string."""
-        from pg_mcp.observability.logging import add_trace_id
-
-        mock_manager = MagicMock()
-        mock_manager.get_current_trace_id.return_value = ""
-
-        with patch(
-            "pg_mcp.observability.tracing.get_tracing_manager",
-            return_value=mock_manager,
-        ):
-            event_dict: dict = {"event": "test_event"}
-            result = add_trace_id(None, "info", event_dict)
-
-            assert "trace_id" not in result
-
-    def test_handles_import_error_gracefully(self) -> None:
-        """Test that it handles ImportError gracefully."""
-        import sys
-
-        from pg_mcp.observability.logging import add_trace_id
-
-        # Temporarily remove the tracing module to simulate ImportError
-        # We need to use patch.dict to simulate the module not being available
-        with patch.dict(sys.modules, {"pg_mcp.observability.tracing": None}):
-            event_dict: dict = {"event": "test_event"}
-            result = add_trace_id(None, "info", event_dict)
-
-            # Should return event_dict unchanged without trace_id
-            assert "trace_id" not in result
-            assert result["event"] == "test_event"
-
-    def test_handles_general_exception_gracefully(self) -> None:
-        """Test that it handles exceptions gracefully."""
-        from pg_mcp.observability.logging import add_trace_id
-
-        with patch(
-            "pg_mcp.observability.tracing.get_tracing_manager",
-            side_effect=RuntimeError("Unexpected error"),
-        ):
-            event_dict: dict = {"event": "test_event"}
-            result = add_trace_id(None, "info", event_dict)
-
-            # Should return event_dict unchanged without trace_id
-            assert "trace_id" not in result
-            assert result["event"] == "test_event"
-
-    def test_handles_exception_from_get_current_trace_id(self) -> None:
-        """Test that it handles exceptions from get_current_trace_id gracefully."""
-        from pg_mcp.observability.logging import add_trace_id
-
-        mock_manager = MagicMock()
-        mock_manager.get_current_trace_id.side_effect = RuntimeError("Tracing error")
-
-        with patch(
-            "pg_mcp.observability.tracing.get_tracing_manager",
-            return_value=mock_manager,
-        ):
-            event_dict: dict = {"event": "test_event"}
-            result = add_trace_id(None, "info", event_dict)
-
-            # Should return event_dict unchanged without trace_id
-            assert "trace_id" not in result
-            assert result["event"] == "test_event"
-
+        assert "trace_id" not in result
+        assert result["event"] == "test_event"
 
 class TestSetupLogging:
     """Tests for setup_logging function."""
 
-    def test_setup_logging_with_json_format(self) -> None:
+    @pytest.fixture
+    def mock_configure(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """Replace structlog.configure for the duration of a test."""
+        mock = Mock()
+        monkeypatch.setattr("structlog.configure", mock)
+        return mock
+
+    @pytest.fixture
+    def mock_basic_config(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """Replace logging.basicConfig for the duration of a test."""
+        mock = Mock()
+        monkeypatch.setattr("logging.basicConfig", mock)
+        return mock
+
+    def test_setup_logging_with_json_format(self, mock_configure: Mock) -> None:
         """Test setup_logging with json format."""
-        from pg_mcp.observability.logging import setup_logging
-
-        with patch("structlog.configure") as mock_configure:
-            setup_logging(level="INFO", format="json", include_trace_id=False)
+        setup_logging(level="INFO", format="json", include_trace_id=False)
 
-            mock_configure.assert_called_once()
-            call_kwargs = mock_configure.call_args[1]
+        mock_configure.assert_called_once()
+        call_kwargs = mock_configure.call_args[1]
 
-            # Check that processors list contains JSONRenderer
-            processors = call_kwargs["processors"]
-            processor_types = [type(p).__name__ for p in processors]
-            assert "JSONRenderer" in processor_types
+        # Check that processors list contains JSONRenderer
+        processors = call_kwargs["processors"]
+        processor_types = [type(p).__name__ for p in processors]
+        assert "JSONRenderer" in processor_types
 
-    def test_setup_logging_with_text_format(self) -> None:
+    def test_setup_logging_with_text_format(self, mock_configure: Mock) -> None:
         """Test setup_logging with text format."""
-        from pg_mcp.observability.logging import setup_logging
-
-        with patch("structlog.configure") as mock_configure:
-            setup_logging(level="INFO", format="text", include_trace_id=False)
-
-            mock_configure.assert_called_once()
-            call_kwargs = mock_configure.call_args[1]
-
-            # Check that processors list contains ConsoleRenderer
-            processors = call_kwargs["processors"]
-            processor_types = [type(p).__name__ for p in processors]
-            assert "ConsoleRenderer" in processor_types
-
-    def test_setup_logging_with_debug_level(self) -> None:
-        """Test setup_logging with DEBUG log level."""
-        import logging
-
-        from pg_mcp.observability.logging import setup_logging
-
-        with patch("structlog.configure"), patch("logging.basicConfig") as mock_basic_config:
-            setup_logging(level="DEBUG", format="json", include_trace_id=False)
-
-            # Verify basicConfig was called with DEBUG level
-            mock_basic_config.assert_called_once()
-            call_kwargs = mock_basic_config.call_args[1]
-            assert call_kwargs["level"] == logging.DEBUG
-
-    def test_setup_logging_with_warning_level(self) -> None:
-        """Test setup_logging with WARNING log level."""
-        import logging
-
-        from pg_mcp.observability.logging import setup_logging
-
-        with patch("structlog.configure"), patch("logging.basicConfig") as mock_basic_config:
-            setup_logging(level="WARNING", format="json", include_trace_id=False)
-
-            mock_basic_config.assert_called_once()
-            call_kwargs = mock_basic_config.call_args[1]
-            assert call_kwargs["level"] == logging.WARNING
-
-    def test_setup_logging_with_error_level(self) -> None:
-        """Test setup_logging with ERROR log level."""
-        import logging
-
-        from pg_mcp.observability.logging import setup_logging
-
-        with patch("structlog.configure"), patch("logging.basicConfig") as mock_basic_config:
-            setup_logging(level="ERROR", format="json", include_trace_id=False)
-
-            mock_basic_config.assert_called_once()
-            call_kwargs = mock_basic_config.call_args[1]
-            assert call_kwargs["level"] == logging.ERROR
-
-    def test_setup_logging_includes_trace_id_processor(self) -> None:
+        setup_logging(level="INFO", format="text", include_trace_id=False)
+
+        mock_configure.assert_called_once()
+        call_kwargs = mock_configure.call_args[1]
+
+        # Check that processors list contains ConsoleRenderer
+        processors = call_kwargs["processors"]
+        processor_types = [type(p).__name__ for p in processors]
+        assert "ConsoleRenderer" in processor_types
+
+    @pytest.mark.parametrize(
+        "level,expected",
+        [
+            ("DEBUG", logging.DEBUG),
+            ("WARNING", logging.WARNING),
+            ("ERROR", logging.ERROR),
+            ("info", logging.INFO),  # case-insensitive
+            ("INVALID_LEVEL", logging.INFO),  # unknown levels fall back to INFO
+        ],
+    )
+    def test_setup_logging_level(
+        self, mock_configure: Mock, mock_basic_config: Mock, level: str, expected: int
+    ) -> None:
+        """Test setup_logging passes the resolved level to logging.basicConfig."""
+        setup_logging(level=level, format="json", include_trace_id=False)
+
+        mock_basic_config.assert_called_once()
+        assert mock_basic_config.call_args[1]["level"] == expected
+
+    def test_setup_logging_includes_trace_id_processor(self, mock_configure: Mock) -> None:
         """Test setup_logging includes add_trace_id processor when include_trace_id=True."""
-        from pg_mcp.observability.logging import add_trace_id, setup_logging
-
-        with patch("structlog.configure") as mock_configure:
-            setup_logging(level="INFO", format="json", include_trace_id=True)
+        setup_logging(level="INFO", format="json", include_trace_id=True)
 
-            mock_configure.assert_called_once()
-            call_kwargs = mock_configure.call_args[1]
+        mock_configure.assert_called_once()
+        call_kwargs = mock_configure.call_args[1]
 
-            # Check that add_trace_id is in the processors list
-            processors = call_kwargs["processors"]
-            assert add_trace_id in processors
+        # Check that add_trace_id is in the processors list
+        processors = call_kwargs["processors"]
+        assert add_trace_id in processors
 
-    def test_setup_logging_excludes_trace_id_processor(self) -> None:
+    def test_setup_logging_excludes_trace_id_processor(self, mock_configure: Mock) -> None:
         """Test setup_logging excludes add_trace_id processor when include_trace_id=False."""
-        from pg_mcp.observability.logging import add_trace_id, setup_logging
+        setup_logging(level="INFO", format="json", include_trace_id=False)
 
-        with patch("structlog.configure") as mock_configure:
-            setup_logging(level="INFO", format="json", include_trace_id=False)
+        mock_configure.assert_called_once()
+        call_kwargs = mock_configure.call_args[1]
 
-            mock_configure.assert_called_once()
-            call_kwargs = mock_configure.call_args[1]
+        # Check that add_trace_id is NOT in the processors list
+        processors = call_kwargs["processors"]
+        assert add_trace_id not in processors
 
-            # Check that add_trace_id is NOT in the processors list
-            processors = call_kwargs["processors"]
-            assert add_trace_id not in processors
-
-    def test_setup_logging_case_insensitive_level(self) -> None:
-        """Test setup_logging handles lowercase level strings."""
-        import logging
-
-        from pg_mcp.observability.logging import setup_logging
-
-        with patch("structlog.configure"), patch("logging.basicConfig") as mock_basic_config:
-            setup_logging(level="info", format="json", include_trace_id=False)
-
-            mock_basic_config.assert_called_once()
-            call_kwargs = mock_basic_config.call_args[1]
-            assert call_kwargs["level"] == logging.INFO
-
-    def test_setup_logging_invalid_level_defaults_to_info(self) -> None:
-        """Test setup_logging defaults to INFO for invalid level."""
-        import logging
-
-        from pg_mcp.observability.logging import setup_logging
-
-        with patch("structlog.configure"), patch("logging.basicConfig") as mock_basic_config:
-            setup_logging(level="INVALID_LEVEL", format="json", include_trace_id=False)
-
-            mock_basic_config.assert_called_once()
-            call_kwargs = mock_basic_config.call_args[1]
-            # getattr with default INFO should be used for invalid level
-            assert call_kwargs["level"] == logging.INFO
-
-    def test_setup_logging_default_values(self) -> None:
+    def test_setup_logging_default_values(
+        self, mock_configure: Mock, mock_basic_config: Mock
+    ) -> None:
         """Test setup_logging with default parameter values."""
-        import logging
-
-        from pg_mcp.observability.logging import add_trace_id, setup_logging
-
-        with patch("structlog.configure") as mock_configure, patch(
-            "logging.basicConfig"
-        ) as mock_basic_config:
-            # Call with no arguments to test defaults
-            setup_logging()
+        # Call with no arguments to test defaults
+        setup_logging()
 
-            # Default level is INFO
-            mock_basic_config.assert_called_once()
-            basic_config_kwargs = mock_basic_config.call_args[1]
-            assert basic_config_kwargs["level"] == logging.INFO
+        # Default level is INFO
+        mock_basic_config.assert_called_once()
+        basic_config_kwargs = mock_basic_config.call_args[1]
+        assert basic_config_kwargs["level"] == logging.INFO
 
-            # Default format is json, include_trace_id is True
-            mock_configure.assert_called_once()
-            configure_kwargs = mock_configure.call_args[1]
-            processors = configure_kwargs["processors"]
+        # Default format is json, include_trace_id is True
+        mock_configure.assert_called_once()
+        configure_kwargs = mock_configure.call_args[1]
+        processors = configure_kwargs["processors"]
 
-            # Should have add_trace_id (include_trace_id=True by default)
-            assert add_trace_id in processors
+        # Should have add_trace_id (include_trace_id=True by default)
+        assert add_trace_id in processors
 
-            # Should have JSONRenderer (format="json" by default)
-            processor_types = [type(p).__name__ for p in processors]
-            assert "JSONRenderer" in processor_types
+        # Should have JSONRenderer (format="json" by default)
+        processor_types = [type(p).__name__ for p in processors]
+        assert "JSONRenderer" in processor_types
@@ -6,13 +6,16 @@ This module tests the Prometheus metrics HTTP server functionality including:
 - Metrics accessibility via HTTP
 """
 
-import asyncio
+from collections.abc import AsyncIterator
 from unittest.mock import patch
+from uuid import uuid4
 
+import httpx
 import pytest
 import pytest_asyncio
 from prometheus_client import CollectorRegistry, Counter
 
+from pg_mcp.observability.metrics import MetricsCollector
 from pg_mcp.observability.metrics_server import (
     MetricsServer,
     get_metrics_server,
@@ -21,29 +24,60 @@ from pg_mcp.observability.metrics_server import (
 )
 
 
+@pytest.fixture(scope="class")
+def registry() -> CollectorRegistry:
+    """Empty CollectorRegistry shared by a test class.
+
+    Servers only read from it, so sharing it across a class's tests is safe.
+    """
+    return CollectorRegistry()
+
+
+@pytest.fixture(scope="module")
+def served_registry() -> CollectorRegistry:
+    """Registry scraped through running_server, holding one test counter."""
+    registry = CollectorRegistry()
+    Counter("test_counter", "A test counter", registry=registry).inc()
+    return registry
+
+
+@pytest.fixture(scope="module")
+def collector(served_registry: CollectorRegistry) -> MetricsCollector:
+    """MetricsCollector registered on the served registry.
+
+    Shared by the module, so tests record under unique label values.
+    """
+    return MetricsCollector(registry=served_registry)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def running_server(served_registry: CollectorRegistry) -> AsyncIterator[MetricsServer]:
+    """Start one server for the module's HTTP tests and stop it afterwards."""
+    server = MetricsServer(port=0, registry=served_registry)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """One HTTP client for the module's requests.
+
+    trust_env=False keeps proxy settings from the environment away from
+    requests to 127.0.0.1.
+    """
+    async with httpx.AsyncClient(trust_env=False, timeout=5.0) as client:
+        yield client
+
+
 class TestMetricsServer:
     """Tests for MetricsServer class."""
 
-    @pytest.fixture
-    def registry(self) -> CollectorRegistry:
-        """Create an isolated CollectorRegistry for testing."""
-        return CollectorRegistry()
-
-    @pytest.fixture
-    def registry_with_metrics(self, registry: CollectorRegistry) -> CollectorRegistry:
-        """Create a registry with some test metrics."""
-        Counter(
-            "test_counter",
-            "A test counter",
-            registry=registry,
-        ).inc()
-        return registry
-
     @pytest_asyncio.fixture
     async def server(self, registry: CollectorRegistry) -> MetricsServer:
         """Create a MetricsServer instance."""
-        # Use a high port to avoid conflicts
-        server = MetricsServer(port=19090, registry=registry)
+        # Port 0: the OS picks a free port, so parallel workers never collide
+        server = MetricsServer(port=0, registry=registry)
         yield server
         # Ensure cleanup
         if server.is_running:
@@ -87,6 +121,17 @@ class TestMetricsServer:
         await server.stop()
         assert not server.is_running
 
+    @pytest.mark.asyncio
+    async def test_port_zero_reports_bound_port(self, server: MetricsServer) -> None:
+        """Test that a port-0 server reports the OS-assigned port while running."""
+        assert server.port == 0
+
+        await server.start()
+        assert server.port > 0
+
+        await server.stop()
+        assert server.port == 0
+
     @pytest.mark.asyncio
     async def test_start_twice_raises_error(self, server: MetricsServer) -> None:
         """Test that starting an already running server raises an error."""
@@ -98,175 +143,69 @@ class TestMetricsServer:
     @pytest.mark.asyncio
     async def test_stop_when_not_running(self, registry: CollectorRegistry) -> None:
         """Test that stopping a non-running server does nothing."""
-        server = MetricsServer(port=19091, registry=registry)
+        server = MetricsServer(port=0, registry=registry)
 
         # Should not raise
         await server.stop()
         assert not server.is_running
 
+    @pytest.mark.http_server
     @pytest.mark.asyncio
     async def test_metrics_endpoint_returns_prometheus_format(
-        self, registry_with_metrics: CollectorRegistry
+        self, running_server: MetricsServer, http_client: httpx.AsyncClient
     ) -> None:
         """Test that /metrics endpoint returns Prometheus format."""
-        server = MetricsServer(port=19092, registry=registry_with_metrics)
-        await server.start()
-
-        try:
-            # Connect and send HTTP request
-            reader, writer = await asyncio.open_connection("127.0.0.1", 19092)
-
-            request = b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n"
-            writer.write(request)
-            await writer.drain()
-
-            # Read response
-            response = await reader.read(4096)
-            response_text = response.decode("utf-8")
-
-            # Verify response
-            assert "HTTP/1.1 200 OK" in response_text
-            assert "text/plain" in response_text or "openmetrics" in response_text
-            assert "test_counter" in response_text
-
-            writer.close()
-            await writer.wait_closed()
-        finally:
-            await server.stop()
-
-    @pytest.mark.asyncio
-    async def test_health_endpoint(self, server: MetricsServer) -> None:
-        """Test that /health endpoint returns OK."""
-        await server.start()
-
-        try:
-            reader, writer = await asyncio.open_connection("127.0.0.1", 19090)
-
-            request = b"GET /health HTTP/1.1\r\nHost: localhost\r\n\r\n"
-            writer.write(request)
-            await writer.drain()
-
-            response = await reader.read(4096)
-            response_text = response.decode("utf-8")
-
-            assert "HTTP/1.1 200 OK" in response_text
-            assert "OK" in response_text
-
-            writer.close()
-            await writer.wait_closed()
-        finally:
-            await server.stop()
-
-    @pytest.mark.asyncio
-    async def test_healthz_endpoint(self, server: MetricsServer) -> None:
-        """Test that /healthz endpoint returns OK."""
-        await server.start()
-
-        try:
-            reader, writer = await asyncio.open_connection("127.0.0.1", 19090)
-
-            request = b"GET /healthz HTTP/1.1\r\nHost: localhost\r\n\r\n"
-            writer.write(request)
-            await writer.drain()
+        response = await http_client.get(f"http://127.0.0.1:{running_server.port}/metrics")
 
-            response = await reader.read(4096)
-            response_text = response.decode("utf-8")
-
-            assert "HTTP/1.1 200 OK" in response_text
-            assert "OK" in response_text
-
-            writer.close()
-            await writer.wait_closed()
-        finally:
-            await server.stop()
-
-    @pytest.mark.asyncio
-    async def test_not_found_endpoint(self, server: MetricsServer) -> None:
-        """Test that unknown endpoints return 404."""
-        await server.start()
-
-        try:
-            reader, writer = await asyncio.open_connection("127.0.0.1", 19090)
-
-            request = b"GET /unknown HTTP/1.1\r\nHost: localhost\r\n\r\n"
-            writer.write(request)
-            await writer.drain()
-
-            response = await reader.read(4096)
-            response_text = response.decode("utf-8")
-
-            assert "HTTP/1.1 404 Not Found" in response_text
-
-            writer.close()
-            await writer.wait_closed()
-        finally:
-            await server.stop()
-
-    @pytest.mark.asyncio
-    async def test_method_not_allowed(self, server: MetricsServer) -> None:
-        """Test that non-GET methods return 405."""
-        await server.start()
-
-        try:
-            reader, writer = await asyncio.open_connection("127.0.0.1", 19090)
-
-            request = b"POST /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n"
-            writer.write(request)
-            await writer.drain()
-
-            response = await reader.read(4096)
-            response_text = response.decode("utf-8")
-
-            assert "HTTP/1.1 405 Method Not Allowed" in response_text
-
-            writer.close()
-            await writer.wait_closed()
-        finally:
-            await server.stop()
+        # Verify response
+        assert response.status_code == 200
+        content_type = response.headers["content-type"]
+        assert "text/plain" in content_type or "openmetrics" in content_type
+        assert b"test_counter" in response.content
 
+    @pytest.mark.http_server
     @pytest.mark.asyncio
-    async def test_metrics_with_trailing_slash(self, server: MetricsServer) -> None:
-        """Test that /metrics/ also works."""
-        await server.start()
-
-        try:
-            reader, writer = await asyncio.open_connection("127.0.0.1", 19090)
-
-            request = b"GET /metrics/ HTTP/1.1\r\nHost: localhost\r\n\r\n"
-            writer.write(request)
-            await writer.drain()
-
-            response = await reader.read(4096)
-            response_text = response.decode("utf-8")
-
-            assert "HTTP/1.1 200 OK" in response_text
+    @pytest.mark.parametrize(
+        "method,path,expected_status",
+        [
+            ("GET", "/health", 200),
+            ("GET", "/healthz", 200),
+            ("GET", "/metrics/", 200),  # trailing slash also serves metrics
+            ("GET", "/unknown", 404),
+            ("POST", "/metrics", 405),
+        ],
+    )
+    async def test_endpoint_status(
+        self,
+        running_server: MetricsServer,
+        http_client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        expected_status: int,
+    ) -> None:
+        """Test the status code returned for each endpoint and method."""
+        response = await http_client.request(
+            method, f"http://127.0.0.1:{running_server.port}{path}"
+        )
 
-            writer.close()
-            await writer.wait_closed()
-        finally:
-            await server.stop()
+        assert response.status_code == expected_status
 
 
 class TestModuleFunctions:
     """Tests for module-level convenience functions."""
 
-    @pytest.fixture
-    def registry(self) -> CollectorRegistry:
-        """Create an isolated CollectorRegistry for testing."""
-        return CollectorRegistry()
-
-    @pytest_asyncio.fixture(autouse=True)
-    async def cleanup(self) -> None:
-        """Ensure module-level server is stopped after each test."""
+    @pytest_asyncio.fixture
+    async def stop_module_server(self) -> AsyncIterator[None]:
+        """Ensure the module-level server is stopped after tests that start it."""
         yield
         await stop_metrics_server()
 
     @pytest.mark.asyncio
     async def test_start_and_stop_metrics_server(
-        self, registry: CollectorRegistry
+        self, registry: CollectorRegistry, stop_module_server: None
     ) -> None:
         """Test start_metrics_server and stop_metrics_server functions."""
-        server = await start_metrics_server(port=19093, registry=registry)
+        server = await start_metrics_server(port=0, registry=registry)
 
         assert server.is_running
         assert get_metrics_server() is server
@@ -278,13 +217,13 @@ class TestModuleFunctions:
 
     @pytest.mark.asyncio
     async def test_start_metrics_server_twice_raises_error(
-        self, registry: CollectorRegistry
+        self, registry: CollectorRegistry, stop_module_server: None
     ) -> None:
         """Test that starting server twice raises an error."""
-        await start_metrics_server(port=19094, registry=registry)
+        await start_metrics_server(port=0, registry=registry)
 
         with pytest.raises(RuntimeError, match="already running"):
-            await start_metrics_server(port=19095, registry=registry)
+            await start_metrics_server(port=0, registry=registry)
 
     @pytest.mark.asyncio
     async def test_stop_when_not_started(self) -> None:
@@ -293,8 +232,7 @@ class TestModuleFunctions:
         await stop_metrics_server()
         assert get_metrics_server() is None
 
-    @pytest.mark.asyncio
-    async def test_get_metrics_server_returns_none_initially(self) -> None:
+    def test_get_metrics_server_returns_none_initially(self) -> None:
         """Test that get_metrics_server returns None when not started."""
         # Reset module state by patching
         with patch(
@@ -303,45 +241,30 @@ class TestModuleFunctions:
             assert get_metrics_server() is None
 
 
+@pytest.mark.http_server
 class TestMetricsServerIntegration:
     """Integration tests for MetricsServer with MetricsCollector."""
 
     @pytest.mark.asyncio
-    async def test_server_exposes_collector_metrics(self) -> None:
+    async def test_server_exposes_collector_metrics(
+        self,
+        running_server: MetricsServer,
+        http_client: httpx.AsyncClient,
+        collector: MetricsCollector,
+    ) -> None:
         """Test that server exposes metrics from MetricsCollector."""
-        from pg_mcp.observability.metrics import MetricsCollector
-
-        # Create collector with isolated registry
-        registry = CollectorRegistry()
-        collector = MetricsCollector(registry=registry)
-
-        # Record some metrics
+        # Unique label value, as the collector is shared across tests
+        database = f"testdb_{uuid4().hex[:8]}"
         collector.record_request(
-            database="testdb",
+            database=database,
             status="success",
             duration=0.5,
         )
 
-        # Create and start server with the same registry
-        server = MetricsServer(port=19096, registry=registry)
-        await server.start()
-
-        try:
-            reader, writer = await asyncio.open_connection("127.0.0.1", 19096)
-
-            request = b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n"
-            writer.write(request)
-            await writer.drain()
-
-            response = await reader.read(8192)
-            response_text = response.decode("utf-8")
+        response = await http_client.get(f"http://127.0.0.1:{running_server.port}/metrics")
 
-            # Verify our metrics are present
-            assert "pg_mcp_requests_total" in response_text
-            assert 'database="testdb"' in response_text
-            assert 'status="success"' in response_text
-
-            writer.close()
-            await writer.wait_closed()
-        finally:
-            await server.stop()
+        # Verify our metrics are present
+        assert response.status_code == 200
+        assert b"pg_mcp_requests_total" in response.content
+        assert f'database="{database}"'.encode() in response.content
+        assert b'status="success"' in response.content
@@ -323,6 +323,22 @@ class TestBackoffStrategyInterface:
             delay = strategy.get_delay(attempt)
             assert delay >= 0, f"Delay for attempt {attempt} should be non-negative"
 
+    @pytest.mark.parametrize("strategy_class,kwargs", [
+        (ExponentialBackoff, {"jitter": False}),
+        (FixedBackoff, {}),
+        (FibonacciBackoff, {}),
+    ])
+    def test_get_delays_matches_get_delay(
+        self,
+        strategy_class: type[BackoffStrategy],
+        kwargs: dict,
+    ) -> None:
+        """Test that get_delays matches per-attempt get_delay, in any order."""
+        strategy = strategy_class(**kwargs)
+        attempts = [1, 2, 3, 8, 4, 4, 12]
+
+        assert strategy.get_delays(attempts) == [strategy.get_delay(a) for a in attempts]
+
 
 class TestBackoffEdgeCases:
     """Tests for edge cases in backoff strategies."""
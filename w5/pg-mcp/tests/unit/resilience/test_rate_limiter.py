@@ -267,6 +267,101 @@ class TestRateLimiterRequestLimits:
             assert result.allowed is False
 
 
+class TestRateLimiterClock:
+    """Tests for RateLimiter clock injection."""
+
+    def test_injected_clock_drives_windows(self) -> None:
+        """Test injected clock is used instead of time.time."""
+        now = [1000.0]
+        config = RateLimitConfig(
+            enabled=True,
+            requests_per_minute=1,
+            requests_per_hour=100,
+            per_client_per_minute=100,
+        )
+        limiter = RateLimiter(config, clock=lambda: now[0])
+
+        assert limiter.check_request().allowed is True
+        denied = limiter.check_request()
+        assert denied.allowed is False
+        assert denied.reset_at == 1060.0
+        assert denied.retry_after == 60.0
+
+        now[0] = 1061.0
+        assert limiter.check_request().allowed is True
+
+
+class TestRateLimiterBatchRequests:
+    """Tests for RateLimiter.check_requests."""
+
+    @pytest.mark.parametrize(
+        "per_minute,per_hour,per_client,n",
+        [
+            (5, 100, 100, 8),    # minute limit binds
+            (100, 5, 100, 8),    # hour limit binds
+            (100, 100, 3, 8),    # client limit binds
+            (10, 10, 10, 4),     # nothing binds
+        ],
+    )
+    def test_matches_sequential_checks(
+        self, per_minute: int, per_hour: int, per_client: int, n: int
+    ) -> None:
+        """Test batch result and bucket state match n single checks."""
+        config = RateLimitConfig(
+            enabled=True,
+            requests_per_minute=per_minute,
+            requests_per_hour=per_hour,
+            per_client_per_minute=per_client,
+            client_identifier=ClientIdentifier.IP,
+        )
+        batched = RateLimiter(config)
+        sequential = RateLimiter(config)
+
+        with patch("time.time", return_value=1000.0):
+            result = batched.check_requests(n, client_ip="10.0.0.1")
+            singles = [sequential.check_request(client_ip="10.0.0.1") for _ in range(n)]
+
+        assert result.allowed_count == sum(r.allowed for r in singles)
+        assert result.denied_count == n - result.allowed_count
+        assert batched.get_status() == sequential.get_status()
+
+    def test_denied_batch_reports_binding_limit(self) -> None:
+        """Test denied batch reports the limit that rejected requests."""
+        config = RateLimitConfig(
+            enabled=True,
+            requests_per_minute=100,
+            requests_per_hour=1000,
+            per_client_per_minute=3,
+        )
+        limiter = RateLimiter(config)
+
+        with patch("time.time", return_value=1000.0):
+            result = limiter.check_requests(5, client_ip="10.0.0.1")
+
+        assert result.allowed_count == 3
+        assert result.limit == 3
+        assert result.remaining == 0
+        assert result.retry_after == 60.0
+
+    def test_negative_count_rejected(self) -> None:
+        """Test a negative request count raises instead of producing a negative result."""
+        limiter = RateLimiter(RateLimitConfig(enabled=True))
+
+        with pytest.raises(ValueError, match="non-negative"):
+            limiter.check_requests(-3)
+
+        assert limiter.get_status()["global_minute_count"] == 0
+
+    def test_disabled_limiter_allows_all(self) -> None:
+        """Test disabled limiter allows the whole batch."""
+        limiter = RateLimiter(RateLimitConfig(enabled=False))
+
+        result = limiter.check_requests(1000)
+
+        assert result.allowed_count == 1000
+        assert result.denied_count == 0
+
+
 class TestRateLimiterTokenLimits:
     """Tests for RateLimiter token limits."""
 
@@ -399,6 +494,57 @@ class TestRateLimiterHelpers:
         assert len(limiter._client_buckets) == 1
         assert "ip:192.168.1.2" in limiter._client_buckets
 
+    def test_cleanup_skips_bucket_refreshed_in_new_window(self) -> None:
+        """Test cleanup keeps a bucket whose window was renewed after going stale."""
+        now = [1000.0]
+        config = RateLimitConfig(enabled=True, per_client_per_minute=3)
+        limiter = RateLimiter(config, clock=lambda: now[0])
+
+        limiter.check_request(client_ip="192.168.1.1")
+        limiter.check_request(client_ip="192.168.1.2")
+
+        # Client 1 comes back much later and starts a new window
+        now[0] = 5000.0
+        limiter.check_request(client_ip="192.168.1.1")
+
+        now[0] = 5100.0
+        cleaned = limiter.cleanup_stale_buckets(max_age=200.0)
+
+        assert cleaned == 1
+        assert list(limiter._client_buckets) == ["ip:192.168.1.1"]
+
+    def test_expiry_heap_bounded_under_steady_traffic(self) -> None:
+        """Test window renewals do not grow the cleanup heap past the bucket count."""
+        now = [1000.0]
+        limiter = RateLimiter(RateLimitConfig(enabled=True), clock=lambda: now[0])
+
+        # 10 clients each renewing their window every minute for a day
+        for _ in range(24 * 60):
+            for client in range(10):
+                limiter.check_request(client_ip=f"10.0.0.{client}")
+            now[0] += 61.0
+
+        assert len(limiter._client_buckets) == 10
+        assert len(limiter._client_expiry_heap) == 10
+
+    def test_cleanup_removes_refreshed_bucket_once_stale(self) -> None:
+        """Test a bucket renewed after its heap entry is still cleaned up later."""
+        now = [1000.0]
+        limiter = RateLimiter(RateLimitConfig(enabled=True), clock=lambda: now[0])
+
+        limiter.check_request(client_ip="192.168.1.1")
+        now[0] = 5000.0
+        limiter.check_request(client_ip="192.168.1.1")
+
+        now[0] = 5100.0
+        assert limiter.cleanup_stale_buckets(max_age=200.0) == 0
+        assert len(limiter._client_expiry_heap) == 1
+
+        now[0] = 6000.0
+        assert limiter.cleanup_stale_buckets(max_age=200.0) == 1
+        assert limiter._client_buckets == {}
+        assert limiter._client_expiry_heap == []
+
     def test_get_status(self, limiter: RateLimiter) -> None:
         """Test status reporting."""
         with patch("time.time", return_value=1000.0):
@@ -0,0 +1,162 @@
+"""Load tests for rate limiter.
+
+Tests cover:
+- Bursts within and over the global limit
+- Independent per-client limits
+- Window reset
+- Token rate limiting
+- Stale bucket cleanup with many clients
+"""
+
+from pg_mcp.resilience.rate_limiter import (
+    ClientIdentifier,
+    RateLimitConfig,
+    RateLimiter,
+)
+
+
+class FakeClock:
+    """Settable clock injected into RateLimiter instead of patching time.time."""
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimiterUnderLoad:
+    """Test rate limiter behavior under various load conditions."""
+
+    def test_burst_requests_within_limit(self) -> None:
+        """Test handling burst of requests within the limit."""
+        config = RateLimitConfig(
+            enabled=True,
+            requests_per_minute=100,
+            requests_per_hour=1000,
+            per_client_per_minute=50,
+        )
+        clock = FakeClock(1000.0)
+        limiter = RateLimiter(config, clock=clock)
+
+        # Burst of 50 requests should all succeed
+        result = limiter.check_requests(50)
+
+        assert result.allowed_count == 50
+        assert result.denied_count == 0
+        assert limiter.get_status()["global_minute_count"] == 50
+
+    def test_burst_requests_exceeding_limit(self) -> None:
+        """Test handling burst of requests exceeding the limit."""
+        config = RateLimitConfig(
+            enabled=True,
+            requests_per_minute=10,
+            requests_per_hour=1000,
+            per_client_per_minute=50,
+        )
+        clock = FakeClock(1000.0)
+        limiter = RateLimiter(config, clock=clock)
+
+        result = limiter.check_requests(20)
+
+        assert result.allowed_count == 10  # Only 10 allowed
+        assert result.denied_count == 10  # Remaining denied
+
+    def test_multiple_clients_independent_limits(self) -> None:
+        """Test that multiple clients have independent rate limits."""
+        config = RateLimitConfig(
+            enabled=True,
+            requests_per_minute=100,
+            requests_per_hour=1000,
+            per_client_per_minute=5,
+            client_identifier=ClientIdentifier.IP,
+        )
+        clock = FakeClock(1000.0)
+        limiter = RateLimiter(config, clock=clock)
+
+        # Client A uses their limit and the next request is blocked
+        result = limiter.check_requests(6, client_ip="192.168.1.1")
+        assert result.allowed_count == 5
+        assert result.denied_count == 1
+
+        # Client B should still have quota
+        result = limiter.check_requests(5, client_ip="192.168.1.2")
+        assert result.allowed_count == 5
+        assert result.denied_count == 0
+
+        # Client C should also have quota
+        result = limiter.check_requests(1, client_ip="192.168.1.3")
+        assert result.allowed_count == 1
+
+    def test_rate_limit_window_reset(self) -> None:
+        """Test that rate limits reset after the time window."""
+        config = RateLimitConfig(
+            enabled=True,
+            requests_per_minute=5,
+            requests_per_hour=1000,
+        )
+        clock = FakeClock(1000.0)
+        limiter = RateLimiter(config, clock=clock)
+
+        # Use all quota
+        for _ in range(5):
+            result = limiter.check_request()
+            assert result.allowed
+
+        result = limiter.check_request()
+        assert not result.allowed
+
+        # After window expires
+        clock.now = 1061.0  # 61 seconds later
+        result = limiter.check_request()
+        assert result.allowed
+
+    def test_token_rate_limiting(self) -> None:
+        """Test token-based rate limiting."""
+        config = RateLimitConfig(
+            enabled=True,
+            tokens_per_minute=1000,
+            tokens_per_hour=10000,
+        )
+        clock = FakeClock(1000.0)
+        limiter = RateLimiter(config, clock=clock)
+
+        # Record tokens within limit
+        result = limiter.record_tokens(500)
+        assert result.allowed
+        assert result.remaining == 500
+
+        # Record more tokens
+        result = limiter.record_tokens(400)
+        assert result.allowed
+        assert result.remaining == 100
+
+        # Exceed limit
+        result = limiter.record_tokens(200)
+        assert not result.allowed
+        assert result.remaining == 0
+
+    def test_concurrent_client_cleanup(self) -> None:
+        """Test cleanup of stale client buckets."""
+        config = RateLimitConfig(
+            enabled=True,
+            per_client_per_minute=5,
+            # Set high global limits so we can create many client buckets
+            requests_per_minute=1000,
+            requests_per_hour=10000,
+        )
+        clock = FakeClock(1000.0)
+        limiter = RateLimiter(config, clock=clock)
+
+        # Create buckets for multiple clients
+        for i in range(100):
+            limiter.check_request(client_ip=f"192.168.1.{i}")
+
+        assert limiter.get_status()["client_buckets_count"] == 100
+
+        # Fast forward and cleanup
+        clock.now = 5000.0
+        cleaned = limiter.cleanup_stale_buckets(max_age=3600.0)
+
+        assert cleaned == 100
+        assert limiter.get_status()["client_buckets_count"] == 0
@@ -0,0 +1,310 @@
+"""Retry executor tests with transient failures.
+
+Tests cover:
+- Recovery after transient failures
+- OpenAI and database retry executors
+- Backoff schedules built from RetryConfig
+"""
+
+import pytest
+
+from pg_mcp.resilience.backoff import BackoffStrategyType
+from pg_mcp.resilience.retry_executor import (
+    DatabaseRetryConfig,
+    DatabaseRetryExecutor,
+    OpenAIRetryConfig,
+    OpenAIRetryExecutor,
+    RetryConfig,
+    RetryExecutor,
+)
+
+
+async def _no_sleep(_delay: float) -> None:
+    """Backoff sleep replacement so retry tests don't wait."""
+
+
+class TestRetryExecutorWithTransientFailures:
+    """Test retry executor with various failure scenarios."""
+
+    @pytest.fixture
+    def executor(self) -> RetryExecutor:
+        """Create executor with fast delays for testing."""
+        config = RetryConfig(
+            max_retries=3,
+            initial_delay=0.001,  # Very short delays for tests
+            max_delay=0.01,
+            backoff_strategy=BackoffStrategyType.EXPONENTIAL,
+        )
+        return RetryExecutor(config, sleep=_no_sleep)
+
+    @pytest.mark.asyncio
+    async def test_successful_first_attempt(self, executor: RetryExecutor) -> None:
+        """Test successful operation on first attempt."""
+        call_count = 0
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            return "success"
+
+        result = await executor.execute_with_retry(operation, "test_op")
+        assert result == "success"
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_succeeds_after_transient_failures(
+        self, executor: RetryExecutor
+    ) -> None:
+        """Test retry succeeds after transient failures."""
+        call_count = 0
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise Exception("connection_lost error")
+            return "success"
+
+        result = await executor.execute_with_retry(operation, "test_op")
+
+        assert result == "success"
+        assert call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_max_retries_exhausted(self, executor: RetryExecutor) -> None:
+        """Test that max retries is respected."""
+        call_count = 0
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            raise Exception("timeout error")
+
+        with pytest.raises(Exception, match="timeout"):
+            await executor.execute_with_retry(operation, "test_op")
+
+        # Initial try + 3 retries = 4 total calls
+        assert call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_fails_immediately(
+        self, executor: RetryExecutor
+    ) -> None:
+        """Test that non-retryable errors fail immediately."""
+        call_count = 0
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("Invalid input - not retryable")
+
+        with pytest.raises(ValueError):
+            await executor.execute_with_retry(operation, "test_op")
+
+        assert call_count == 1  # No retry for non-retryable errors
+
+    @pytest.mark.asyncio
+    async def test_custom_retryable_function(self, executor: RetryExecutor) -> None:
+        """Test custom is_retryable function."""
+        call_count = 0
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise ValueError("should retry")
+            return "success"
+
+        def custom_retryable(e: Exception) -> bool:
+            return isinstance(e, ValueError)
+
+        result = await executor.execute_with_retry(
+            operation, "test_op", is_retryable=custom_retryable
+        )
+
+        assert result == "success"
+        assert call_count == 2
+
+
+class TestOpenAIRetryExecutor:
+    """Test OpenAI-specific retry executor."""
+
+    @pytest.fixture
+    def executor(self) -> OpenAIRetryExecutor:
+        """Create OpenAI executor with fast delays."""
+        config = OpenAIRetryConfig(
+            max_retries=3,
+            initial_delay=0.001,
+            max_delay=0.01,
+        )
+        return OpenAIRetryExecutor(config, sleep=_no_sleep)
+
+    @pytest.mark.asyncio
+    async def test_retry_on_rate_limit(self, executor: OpenAIRetryExecutor) -> None:
+        """Test retry on rate limit error."""
+        call_count = 0
+
+        class RateLimitError(Exception):
+            pass
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise RateLimitError("rate limit exceeded")
+            return "success"
+
+        result = await executor.execute_with_retry(operation, "openai_call")
+
+        assert result == "success"
+        assert call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_no_retry_on_auth_error(self, executor: OpenAIRetryExecutor) -> None:
+        """Test no retry on authentication error."""
+        call_count = 0
+
+        class AuthenticationError(Exception):
+            pass
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            raise AuthenticationError("invalid api key")
+
+        with pytest.raises(AuthenticationError):
+            await executor.execute_with_retry(operation, "openai_call")
+
+        assert call_count == 1  # No retries
+
+    @pytest.mark.asyncio
+    async def test_retry_on_server_error(self, executor: OpenAIRetryExecutor) -> None:
+        """Test retry on server error."""
+        call_count = 0
+
+        class InternalServerError(Exception):
+            pass
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise InternalServerError("server error")
+            return "success"
+
+        result = await executor.execute_with_retry(operation, "openai_call")
+
+        assert result == "success"
+        assert call_count == 2
+
+
+class TestDatabaseRetryExecutor:
+    """Test database-specific retry executor."""
+
+    @pytest.fixture
+    def executor(self) -> DatabaseRetryExecutor:
+        """Create database executor with fast delays."""
+        config = DatabaseRetryConfig(
+            max_retries=2,
+            initial_delay=0.001,
+        )
+        return DatabaseRetryExecutor(config, sleep=_no_sleep)
+
+    @pytest.mark.asyncio
+    async def test_retry_on_connection_lost(
+        self, executor: DatabaseRetryExecutor
+    ) -> None:
+        """Test retry on connection lost error."""
+        call_count = 0
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise Exception("connection lost")
+            return "success"
+
+        result = await executor.execute_with_retry(operation, "db_query")
+
+        assert result == "success"
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_on_timeout(self, executor: DatabaseRetryExecutor) -> None:
+        """Test retry on timeout error."""
+        call_count = 0
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise TimeoutError("query timeout exceeded")
+            return "success"
+
+        result = await executor.execute_with_retry(operation, "db_query")
+
+        assert result == "success"
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_retry_on_syntax_error(
+        self, executor: DatabaseRetryExecutor
+    ) -> None:
+        """Test no retry on syntax error."""
+        call_count = 0
+
+        async def operation():
+            nonlocal call_count
+            call_count += 1
+            raise Exception("syntax error at or near SELECT")
+
+        with pytest.raises(Exception, match="syntax"):
+            await executor.execute_with_retry(operation, "db_query")
+
+        assert call_count == 1  # No retries
+
+
+class TestRetryExecutorBackoffSchedules:
+    """Tests for the backoff schedules RetryExecutor builds from RetryConfig."""
+
+    def test_exponential_backoff_delays(self) -> None:
+        """Test exponential backoff doubles from initial_delay, within the jitter band."""
+        config = RetryConfig(
+            max_retries=4,
+            initial_delay=0.001,
+            max_delay=1.0,
+            multiplier=2.0,
+            backoff_strategy=BackoffStrategyType.EXPONENTIAL,
+        )
+        executor = RetryExecutor(config)
+
+        delays = executor.backoff.get_delays(range(1, 5))
+
+        # 0.001 * 2^attempt, with ±25% jitter
+        for delay, expected in zip(delays, [0.002, 0.004, 0.008, 0.016], strict=True):
+            assert delay == pytest.approx(expected, rel=0.25)
+
+    def test_fixed_backoff_constant_delays(self) -> None:
+        """Test fixed backoff waits initial_delay before every retry."""
+        config = RetryConfig(
+            max_retries=3,
+            initial_delay=0.01,
+            backoff_strategy=BackoffStrategyType.FIXED,
+        )
+        executor = RetryExecutor(config)
+
+        assert executor.backoff.get_delays(range(1, 4)) == [0.01, 0.01, 0.01]
+
+    def test_fibonacci_backoff_pattern(self) -> None:
+        """Test fibonacci backoff scales 1, 1, 2, 3, 5 by initial_delay."""
+        config = RetryConfig(
+            max_retries=5,
+            initial_delay=0.001,
+            max_delay=1.0,
+            backoff_strategy=BackoffStrategyType.FIBONACCI,
+        )
+        executor = RetryExecutor(config)
+
+        delays = executor.backoff.get_delays(range(1, 6))
+
+        assert delays == pytest.approx([0.001, 0.001, 0.002, 0.003, 0.005])
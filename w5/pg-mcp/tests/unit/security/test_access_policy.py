@@ -9,6 +9,9 @@ Tests cover:
 - Exception handling
 """
 
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
+
 import pytest
 
 from pg_mcp.config.models import (
@@ -26,6 +29,7 @@ from pg_mcp.security.access_policy import (
     PolicyViolation,
     SchemaAccessDeniedError,
     TableAccessDeniedError,
+    ViolationKind,
 )
 
 
@@ -340,6 +344,19 @@ class TestColumnAccessValidation:
 
         assert result.passed is True
 
+    def test_column_patterns_compiled_once(
+        self, column_pattern_config: AccessPolicyConfig
+    ) -> None:
+        """Test that pattern checks reuse the patterns compiled at construction."""
+        policy = DatabaseAccessPolicy(column_pattern_config)
+
+        with patch("re.compile", side_effect=AssertionError("recompiled")):
+            result = policy.validate_columns([("users", "_password_hash")])
+            safe = policy.get_safe_columns("users", ["name", "_secret_key"])
+
+        assert result.passed is False
+        assert safe == ["name"]
+
     def test_select_star_reject_policy(
         self, select_star_reject_config: AccessPolicyConfig
     ) -> None:
@@ -459,7 +476,7 @@ class TestCompleteSQLValidation:
         result = policy.validate_sql(parsed)
 
         assert result.passed is False
-        assert any(v.check_type == "schema" for v in result.violations)
+        assert result.violation_kinds & ViolationKind.SCHEMA
 
     def test_validate_sql_table_violation(self, sql_parser: SQLParser) -> None:
         """Test SQL with table violation."""
@@ -474,7 +491,7 @@ class TestCompleteSQLValidation:
         result = policy.validate_sql(parsed)
 
         assert result.passed is False
-        assert any(v.check_type == "table" for v in result.violations)
+        assert result.violation_kinds & ViolationKind.TABLE
 
     def test_validate_sql_column_violation(self, sql_parser: SQLParser) -> None:
         """Test SQL with column violation."""
@@ -492,7 +509,7 @@ class TestCompleteSQLValidation:
         result = policy.validate_sql(parsed)
 
         assert result.passed is False
-        assert any(v.check_type == "column" for v in result.violations)
+        assert result.violation_kinds & ViolationKind.COLUMN
 
     def test_validate_sql_multiple_violations(self, sql_parser: SQLParser) -> None:
         """Test SQL with multiple violations."""
@@ -518,6 +535,74 @@ class TestCompleteSQLValidation:
         assert result.passed is False
         assert len(result.violations) >= 2
 
+    def test_validate_sql_reports_violations_in_check_order(self) -> None:
+        """Test single-pass validation keeps schema, table, column ordering."""
+        config = AccessPolicyConfig(
+            allowed_schemas=["public"],
+            tables=TableAccessConfig(denied=["secrets"]),
+            columns=ColumnAccessConfig(denied=["users.password"]),
+        )
+        policy = DatabaseAccessPolicy(config)
+
+        parsed = ParsedSQLInfo(
+            sql="",
+            schemas=["private"],
+            tables=["secrets"],
+            columns=[("users", "password")],
+        )
+        result = policy.validate_sql(parsed)
+
+        assert result.passed is False
+        assert [v.check_type for v in result.violations] == [
+            "schema",
+            "table",
+            "column",
+        ]
+        assert result.violation_kinds == (
+            ViolationKind.SCHEMA | ViolationKind.TABLE | ViolationKind.COLUMN
+        )
+
+    def test_validate_many_matches_validate_sql(self, sql_parser: SQLParser) -> None:
+        """Test batch validation returns one result per input, in order."""
+        config = AccessPolicyConfig(
+            tables=TableAccessConfig(denied=["secrets"]),
+            columns=ColumnAccessConfig(denied=["users.password"]),
+        )
+        policy = DatabaseAccessPolicy(config)
+
+        batch = [
+            sql_parser.parse_for_policy(sql)
+            for sql in (
+                "SELECT id FROM users",
+                "SELECT * FROM secrets",
+                "SELECT u.password FROM users u",
+            )
+        ]
+        results = policy.validate_many(batch)
+
+        assert results == [policy.validate_sql(parsed) for parsed in batch]
+        assert [r.passed for r in results] == [True, False, False]
+        assert policy.validate_many([]) == []
+
+    def test_validate_many_checks_each_column_once(self, sql_parser: SQLParser) -> None:
+        """Test batch validation reuses column verdicts across statements."""
+        config = AccessPolicyConfig(
+            columns=ColumnAccessConfig(denied_patterns=["*.*password*"]),
+        )
+        policy = DatabaseAccessPolicy(config)
+
+        batch = [
+            sql_parser.parse_for_policy("SELECT u.id, u.password FROM users u")
+        ] * 3
+        with patch.object(
+            policy, "_column_denial_reason", wraps=policy._column_denial_reason
+        ) as reason:
+            results = policy.validate_many(batch)
+
+        assert reason.call_count == 2
+        assert [r.passed for r in results] == [False, False, False]
+        assert results[0] is not results[1]
+
     def test_validate_sql_with_select_star(self, sql_parser: SQLParser) -> None:
         """Test SQL with SELECT * and sensitive columns."""
         config = AccessPolicyConfig(
@@ -658,6 +743,9 @@ class TestEdgeCases:
         assert violation.check_type == "table"
         assert violation.resource == "secret_table"
         assert violation.reason == "Access denied"
+        assert not hasattr(violation, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            violation.resource = "other_table"  # type: ignore[misc]
 
     def test_policy_validation_result_namedtuple(self) -> None:
         """Test PolicyValidationResult namedtuple structure."""
@@ -672,3 +760,4 @@ class TestEdgeCases:
         assert len(result.violations) == 1
         assert len(result.warnings) == 1
         assert result.rewritten_sql is not None
+        assert result.violation_kinds == ViolationKind.NONE
@@ -239,6 +239,41 @@ class TestWildcardColumnPatterns:
         result = policy.validate_columns([("orders", "id")])
         assert result.passed is True
 
+    @pytest.mark.parametrize(
+        "pattern,column,denied",
+        [
+            ("*.api_key?", "api_key1", True),
+            ("*.api_key?", "api_key", False),
+            ("*.pin_[0-9]", "pin_7", True),
+            ("*.pin_[0-9]", "pin_x", False),
+            ("*.*", "anything", True),
+        ],
+    )
+    def test_literal_precheck_keeps_glob_semantics(
+        self, pattern: str, column: str, denied: bool
+    ) -> None:
+        """Test that the substring pre-check agrees with the full glob match."""
+        config = AccessPolicyConfig(columns=ColumnAccessConfig(denied_patterns=[pattern]))
+        policy = DatabaseAccessPolicy(config)
+
+        result = policy.validate_columns([("users", column)])
+        assert result.passed is not denied
+
+    def test_combined_patterns_match_independently(self) -> None:
+        """Test that each pattern in the combined regex is anchored on its own."""
+        config = AccessPolicyConfig(
+            columns=ColumnAccessConfig(
+                denied_patterns=["*._secret*", "users.token", "*.pin_[0-9]"]
+            )
+        )
+        policy = DatabaseAccessPolicy(config)
+
+        assert policy.validate_columns([("orders", "_secret_key")]).passed is False
+        assert policy.validate_columns([("users", "token")]).passed is False
+        assert policy.validate_columns([("users", "pin_3")]).passed is False
+        assert policy.validate_columns([("users", "token_id")]).passed is True
+        assert policy.validate_columns([("orders", "token")]).passed is True
+
 
 # ============================================================================
 # Mixed Case Table/Column Names Tests
@@ -301,6 +336,20 @@ class TestMixedCaseNames:
             result = policy.validate_schema(schema)
             assert result.passed is True, f"Should allow {schema}"
 
+    def test_mixed_case_config_entries(self) -> None:
+        """Test that mixed case entries in the config itself are normalized."""
+        config = AccessPolicyConfig(
+            allowed_schemas=["Public"],
+            tables=TableAccessConfig(denied=["Secrets"]),
+            columns=ColumnAccessConfig(denied=["Users.Password"]),
+        )
+        policy = DatabaseAccessPolicy(config)
+
+        assert policy.validate_schema("public").passed is True
+        assert policy.validate_tables(["secrets"]).passed is False
+        assert policy.validate_columns([("users", "password")]).passed is False
+        assert policy.get_safe_columns("USERS", ["id", "PASSWORD"]) == ["id"]
+
 
 # ============================================================================
 # JOIN with Denied Table Tests
@@ -793,6 +842,20 @@ class TestSelectStarEdgeCases:
         assert "ssn" not in safe_columns
         assert "secret_key" not in safe_columns
 
+    def test_get_safe_columns_without_patterns(self) -> None:
+        """Test get_safe_columns on a wide table with only explicit denials."""
+        config = AccessPolicyConfig(
+            columns=ColumnAccessConfig(denied=["users.password", "orders.card_no"]),
+        )
+        policy = DatabaseAccessPolicy(config)
+
+        all_columns = [f"col_{i}" for i in range(200)] + ["Password", "card_no"]
+        safe_columns = policy.get_safe_columns("Users", all_columns)
+
+        # Only users.password is denied; orders.card_no applies to another table
+        assert safe_columns == [*all_columns[:200], "card_no"]
+        assert policy.get_safe_columns("products", ["password"]) == ["password"]
+
 
 # ============================================================================
 # Complex Scenario Tests
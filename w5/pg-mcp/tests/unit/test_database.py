@@ -3,7 +3,7 @@
 """Database connection pool unit tests."""
 
 import ssl
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
@@ -201,12 +201,6 @@ class TestDatabasePool:
         mock_conn.fetch = AsyncMock(return_value=[mock_record])
         mock_conn.execute = AsyncMock()
 
-        # Mock transaction context manager
-        mock_transaction = MagicMock()
-        mock_transaction.__aenter__ = AsyncMock(return_value=None)
-        mock_transaction.__aexit__ = AsyncMock(return_value=None)
-        mock_conn.transaction = MagicMock(return_value=mock_transaction)
-
         mock_pool = MagicMock()
         mock_pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
         mock_pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -215,8 +209,57 @@ class TestDatabasePool:
         result = await pool.fetch_readonly("SELECT 1", timeout=5.0)
 
         assert result == [mock_record]
-        mock_conn.transaction.assert_called_once_with(readonly=True)
-        mock_conn.execute.assert_called_once()  # SET LOCAL statement_timeout
+        # BEGIN READ ONLY and SET LOCAL share one round trip
+        assert mock_conn.execute.await_args_list == [
+            call("BEGIN READ ONLY; SET LOCAL statement_timeout = '5000'"),
+            call("COMMIT"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pool_fetch_readonly_rolls_back_on_error(self, db_config):
+        """Test fetch_readonly rolls back the transaction when the query fails."""
+        pool = DatabasePool(db_config)
+
+        mock_conn = AsyncMock()
+        mock_conn.fetch = AsyncMock(side_effect=RuntimeError("query failed"))
+        mock_conn.execute = AsyncMock()
+        mock_conn.is_closed = MagicMock(return_value=False)
+
+        mock_pool = MagicMock()
+        mock_pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
+        mock_pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+        pool._pool = mock_pool
+
+        with pytest.raises(RuntimeError, match="query failed"):
+            await pool.fetch_readonly("SELECT 1")
+
+        assert mock_conn.execute.await_args_list == [
+            call("BEGIN READ ONLY"),
+            call("ROLLBACK"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pool_fetch_readonly_rolls_back_on_begin_error(self, db_config):
+        """Test fetch_readonly rolls back when SET LOCAL fails after BEGIN."""
+        pool = DatabasePool(db_config)
+
+        mock_conn = AsyncMock()
+        mock_conn.execute = AsyncMock(side_effect=[RuntimeError("set failed"), None])
+        mock_conn.is_closed = MagicMock(return_value=False)
+
+        mock_pool = MagicMock()
+        mock_pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
+        mock_pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+        pool._pool = mock_pool
+
+        with pytest.raises(RuntimeError, match="set failed"):
+            await pool.fetch_readonly("SELECT 1", timeout=5.0)
+
+        mock_conn.fetch.assert_not_awaited()
+        assert mock_conn.execute.await_args_list == [
+            call("BEGIN READ ONLY; SET LOCAL statement_timeout = '5000'"),
+            call("ROLLBACK"),
+        ]
 
     @pytest.mark.asyncio
     async def test_pool_fetchrow(self, db_config):
@@ -140,6 +140,28 @@ class TestRetryExecutor:
         assert result == "success"
         assert call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_injected_sleep_receives_backoff_delays(self) -> None:
+        """Test injected sleep is awaited with each backoff delay."""
+        delays: list[float] = []
+
+        async def record_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        config = RetryConfig(
+            max_retries=2,
+            initial_delay=0.5,
+            backoff_strategy=BackoffStrategyType.FIXED,
+        )
+        executor = RetryExecutor(config, sleep=record_sleep)
+
+        async def operation():
+            raise Exception("timeout error")
+
+        with pytest.raises(Exception, match="timeout"):
+            await executor.execute_with_retry(operation, "test_op")
+        assert delays == [0.5, 0.5]
+
 
 class TestOpenAIRetryExecutor:
     """Tests for OpenAIRetryExecutor."""
@@ -242,3 +264,16 @@ class TestDatabaseRetryExecutor:
         error = ValueError("some unknown error")
         # Falls back to parent's _is_default_retryable which checks config.retryable_errors
         assert executor._is_default_retryable(error) is False
+
+    @pytest.mark.parametrize("message,expected", [
+        ("Connection was LOST", True),
+        ("server closed the connection unexpectedly", True),
+        ("connection refused", False),
+        ("Statement TIMEOUT", True),
+        ("SYNTAX ERROR at end of input", False),
+    ])
+    def test_classification_is_case_insensitive(
+        self, executor: DatabaseRetryExecutor, message: str, expected: bool
+    ) -> None:
+        """Test message matching ignores case and word order."""
+        assert executor._is_default_retryable(Exception(message)) is expected
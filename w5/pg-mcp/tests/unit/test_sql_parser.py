@@ -1,8 +1,17 @@
 """Unit tests for SQL parser and validation."""
 
-import pytest
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
 
-from pg_mcp.infrastructure.sql_parser import SQLParser
+import pytest
+from pydantic import ValidationError
+
+from pg_mcp.infrastructure.sql_parser import (
+    FORBIDDEN_KEYWORD_ANCHORS,
+    FORBIDDEN_KEYWORDS_PATTERNS,
+    ParsedSQLInfo,
+    SQLParser,
+)
 from pg_mcp.models.errors import SQLSyntaxError, UnsafeSQLError
 
 
@@ -147,6 +156,198 @@ class TestSQLParserValidation:
         result = sql_parser.validate("SELECT FROM")
         assert not result.is_valid
 
+    def test_unknown_dialect_rejected_at_construction(self) -> None:
+        """Test that the dialect is resolved once, when the parser is built."""
+        with pytest.raises(ValueError):
+            SQLParser(dialect="not_a_dialect")
+
+    def test_every_forbidden_keyword_has_anchor(self) -> None:
+        """Test that each keyword pattern's prefilter literal occurs in every match."""
+        for pattern, name in FORBIDDEN_KEYWORDS_PATTERNS:
+            anchor = FORBIDDEN_KEYWORD_ANCHORS[name]
+            assert anchor.upper() in pattern, f"{name}: {anchor!r} not in {pattern!r}"
+
+    def test_parser_construction_compiles_no_regex(self) -> None:
+        """Test that keyword regexes are compiled at import, not per parser."""
+        with patch("re.compile", side_effect=AssertionError("compiled")):
+            result = SQLParser(cache_size=0).validate("LISTEN channel")
+        assert result.error_message == "Forbidden keyword detected: LISTEN"
+
+    def test_forbidden_keywords_reported_in_pattern_order(self, sql_parser: SQLParser) -> None:
+        """Test that the pattern list order, not position in SQL, picks the error."""
+        result = sql_parser.validate("NOTIFY channel; LISTEN channel")
+        assert result.error_message == "Forbidden keyword detected: LISTEN"
+
+    def test_forbidden_keyword_detected_in_mixed_case(self, sql_parser: SQLParser) -> None:
+        """Test that the keyword prefilter is case-insensitive."""
+        result = sql_parser.validate("select * from t For Update")
+        assert result.error_message == "Forbidden keyword detected: FOR UPDATE"
+
+    @pytest.mark.parametrize(
+        ("sql", "keyword"),
+        [
+            ("LIſTEN channel", "LISTEN"),
+            ("LıSTEN channel", "LISTEN"),
+            ("NOTıFY channel", "NOTIFY"),
+            ("SELECT a İNTO t2 FROM t", "SELECT INTO"),
+        ],
+    )
+    def test_keyword_prefilter_matches_like_ignorecase(
+        self, sql_parser: SQLParser, sql: str, keyword: str
+    ) -> None:
+        """Test that the prefilter never skips what the IGNORECASE pattern matches.
+
+        re.IGNORECASE treats 'ſ', 'ı' and 'İ' as ASCII letters, which neither
+        lower() nor casefold() reproduces.
+        """
+        result = sql_parser.validate(sql)
+        assert result.error_message == f"Forbidden keyword detected: {keyword}"
+
+    def test_dangerous_function_call_rejected(self, sql_parser: SQLParser) -> None:
+        """Test that a dangerous function call is rejected whatever its spelling."""
+        result = sql_parser.validate("SELECT * FROM t WHERE PG_SLEEP (1) IS NULL")
+        assert not result.is_safe
+        assert result.error_message == "Dangerous function 'pg_sleep' is not allowed"
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "SELECT * FROM logs WHERE msg = 'pg_sleep(1)'",
+            "SELECT * FROM logs -- dblink(",
+        ],
+    )
+    def test_dangerous_function_name_in_literal_or_comment_is_safe(
+        self, sql_parser: SQLParser, sql: str
+    ) -> None:
+        """Test that function names inside string literals or comments are not calls."""
+        result = sql_parser.validate(sql)
+        assert result.is_valid
+        assert result.is_safe
+
+    @pytest.mark.parametrize(
+        "sql,key",
+        [
+            ("DROP TABLE users", "drop"),
+            ("  insert INTO users VALUES (1)", "insert"),
+            ("TRUNCATE users", "truncatetable"),
+            ("GRANT ALL ON users TO public", "grant"),
+            ("create", "command"),
+        ],
+    )
+    def test_write_statement_rejected(self, sql_parser: SQLParser, sql: str, key: str) -> None:
+        """Test that write/DDL statements are rejected by statement type."""
+        result = sql_parser.validate(sql)
+        assert result.is_valid
+        assert not result.is_safe
+        assert result.error_message == (
+            f"Statement type '{key}' is not allowed (read-only queries only)"
+        )
+
+    def test_bare_write_keyword_is_syntax_error(self, sql_parser: SQLParser) -> None:
+        """Test that an incomplete write statement is reported as invalid, not unsafe."""
+        result = sql_parser.validate("update")
+        assert not result.is_valid
+        with pytest.raises(SQLSyntaxError):
+            sql_parser.validate_and_raise("update")
+
+    def test_write_statement_with_trailing_garbage_is_stacked(
+        self, sql_parser: SQLParser
+    ) -> None:
+        """Test that a write statement followed by more input reports stacked queries."""
+        result = sql_parser.validate("DROP TABLE users; garbage")
+        assert not result.is_safe
+        assert result.error_message == "Multiple statements (stacked queries) are not allowed"
+
+    def test_write_keyword_later_in_select_is_parsed(self, sql_parser: SQLParser) -> None:
+        """Test that a write keyword that does not lead the statement is not rejected."""
+        result = sql_parser.validate("SELECT created, updated FROM drops")
+        assert result.is_safe
+
+    def test_dangerous_function_name_without_call_is_parsed(self) -> None:
+        """Test that a bare identifier matching a function name is not rejected."""
+        result = SQLParser(cache_size=0).validate("SELECT dblink_name FROM links")
+        assert result.is_safe
+
+    def test_ast_check_reports_highest_priority_error(self, sql_parser: SQLParser) -> None:
+        """Test that the single AST pass keeps the original error priority."""
+        stmt = sql_parser.parse(
+            "SELECT * FROM (SELECT 1) s "
+            "WHERE EXISTS (WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d) "
+            "FOR UPDATE"
+        )[0]
+        assert sql_parser._check_ast(stmt) == "Locking clause is not allowed"
+
+
+class TestSQLParserValidationCache:
+    """Tests for the validate() and parse_for_policy() result caches."""
+
+    def test_repeated_sql_returns_cached_result(self, sql_parser: SQLParser) -> None:
+        """Test that validating the same SQL twice reuses the first result."""
+        first = sql_parser.validate("SELECT pg_sleep(10)")
+        second = sql_parser.validate("SELECT pg_sleep(10)")
+        assert second is first
+        assert not second.is_safe
+
+    def test_cache_hit_skips_parsing(self, sql_parser: SQLParser) -> None:
+        """Test that a cache hit does not parse the SQL again."""
+        sql_parser.validate("SELECT * FROM users")
+        with patch.object(sql_parser, "parse", side_effect=AssertionError("parsed")):
+            assert sql_parser.validate("SELECT * FROM users").is_safe
+
+    def test_cache_is_bounded(self) -> None:
+        """Test that the least recently used entry is evicted."""
+        parser = SQLParser(cache_size=2)
+        first = parser.validate("SELECT 1")
+        parser.validate("SELECT 2")
+        parser.validate("SELECT 3")
+        assert parser.validate("SELECT 1") is not first
+
+    def test_cache_disabled(self) -> None:
+        """Test that cache_size=0 validates every call from scratch."""
+        parser = SQLParser(cache_size=0)
+        assert parser.validate("SELECT 1") is not parser.validate("SELECT 1")
+
+    def test_cached_result_is_immutable(self, sql_parser: SQLParser) -> None:
+        """Test that a shared cached result cannot be modified by a caller."""
+        result = sql_parser.validate("SELECT 1")
+        with pytest.raises(ValidationError):
+            result.is_safe = False  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            result.warnings.append("x")  # type: ignore[attr-defined]
+        assert sql_parser.validate("SELECT 1").warnings == ()
+
+    def test_parse_for_policy_is_cached(self, sql_parser: SQLParser) -> None:
+        """Test that parse_for_policy reuses the result for the same SQL."""
+        first = sql_parser.parse_for_policy("SELECT id FROM users")
+        with patch.object(sql_parser, "parse", side_effect=AssertionError("parsed")):
+            assert sql_parser.parse_for_policy("SELECT id FROM users") is first
+        with pytest.raises(FrozenInstanceError):
+            first.is_readonly = False  # type: ignore[misc]
+
+    def test_parse_for_policy_parses_once(self) -> None:
+        """Test that the read-only check in parse_for_policy reuses the parsed AST."""
+        parser = SQLParser()
+        with patch.object(parser, "parse", wraps=parser.parse) as parse:
+            parser.parse_for_policy("SELECT id FROM users")
+        assert parse.call_count == 1
+        with patch.object(parser, "parse", side_effect=AssertionError("parsed")):
+            assert parser.validate("SELECT id FROM users").is_safe
+
+    def test_parse_for_policy_interns_identifiers(self, sql_parser: SQLParser) -> None:
+        """Test that cached results share one string object per identifier."""
+        first = sql_parser.parse_for_policy("SELECT Users.id FROM Users")
+        second = sql_parser.parse_for_policy("SELECT u.name FROM users u")
+        assert first.tables[0] is second.tables[0] == "users"
+        assert first.columns[0][0] is second.columns[0][0]
+
+    def test_cache_clear(self, sql_parser: SQLParser) -> None:
+        """Test that cache_clear drops both validate and parse_for_policy results."""
+        validated = sql_parser.validate("SELECT 1")
+        parsed = sql_parser.parse_for_policy("SELECT 1")
+        sql_parser.cache_clear()
+        assert sql_parser.validate("SELECT 1") is not validated
+        assert sql_parser.parse_for_policy("SELECT 1") is not parsed
+
 
 class TestSQLParserValidateAndRaise:
     """Tests for validate_and_raise method."""
@@ -222,6 +423,23 @@ class TestSQLParserNormalize:
 class TestSQLParserParseForPolicy:
     """Tests for parse_for_policy method (access policy validation)."""
 
+    def test_parsed_info_normalizes_sequences_to_tuples(self) -> None:
+        """Test that list arguments are stored as tuples on the slotted dataclass."""
+        info = ParsedSQLInfo(
+            sql="SELECT id FROM users",
+            tables=["users"],
+            columns=[["users", "id"]],
+        )
+        assert info.tables == ("users",)
+        assert info.columns == (("users", "id"),)
+        assert not hasattr(info, "__dict__")
+        same = ParsedSQLInfo(
+            sql="SELECT id FROM users",
+            tables=("users",),
+            columns=(("users", "id"),),
+        )
+        assert hash(info) == hash(same)
+
     def test_basic_select_with_columns(self, sql_parser: SQLParser) -> None:
         """Test basic SELECT with explicit columns."""
         result = sql_parser.parse_for_policy(
@@ -233,7 +451,7 @@ class TestSQLParserParseForPolicy:
         assert ("users", "id") in result.columns
         assert ("users", "name") in result.columns
         assert not result.has_select_star
-        assert result.schemas == ["public"]
+        assert result.schemas == ("public",)
 
     def test_select_star_single_table(self, sql_parser: SQLParser) -> None:
         """Test SELECT * from single table."""
@@ -283,7 +501,7 @@ class TestSQLParserParseForPolicy:
     def test_default_schema_public(self, sql_parser: SQLParser) -> None:
         """Test that default schema is 'public' when not specified."""
         result = sql_parser.parse_for_policy("SELECT id FROM users")
-        assert result.schemas == ["public"]
+        assert result.schemas == ("public",)
 
     def test_join_with_aliases(self, sql_parser: SQLParser) -> None:
         """Test JOIN with table aliases resolves correctly."""
@@ -20,13 +20,15 @@ from pg_mcp.infrastructure.sql_parser import ParsedSQLInfo, SQLParser
 from pg_mcp.models.errors import SQLSyntaxError
 
 
+@pytest.fixture(scope="module")
+def parser() -> SQLParser:
+    """Create one SQL parser for the module (it holds no per-test state)."""
+    return SQLParser()
+
+
 class TestSQLParserEmptyAndWhitespace:
     """Edge case tests for empty and whitespace inputs."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_empty_string(self, parser: SQLParser) -> None:
         """Test empty SQL string."""
         result = parser.validate("")
@@ -68,10 +70,6 @@ class TestSQLParserEmptyAndWhitespace:
 class TestSQLParserUnicode:
     """Edge case tests for Unicode characters."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_unicode_chinese_in_string(self, parser: SQLParser) -> None:
         """Test SQL with Chinese characters in string literal."""
         result = parser.validate("SELECT * FROM users WHERE name = '中文'")
@@ -138,10 +136,6 @@ class TestSQLParserUnicode:
 class TestSQLParserVeryLongQueries:
     """Edge case tests for very long queries."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_1000_columns(self, parser: SQLParser) -> None:
         """Test query with 1000 columns."""
         columns = ", ".join([f"col{i}" for i in range(1000)])
@@ -187,10 +181,6 @@ class TestSQLParserVeryLongQueries:
 class TestSQLParserDeeplyNestedSubqueries:
     """Edge case tests for deeply nested subqueries."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_5_level_nested_subquery(self, parser: SQLParser) -> None:
         """Test 5 levels of nested subqueries."""
         sql = "SELECT * FROM t1"
@@ -256,10 +246,6 @@ class TestSQLParserDeeplyNestedSubqueries:
 class TestSQLParserManyJoins:
     """Edge case tests for queries with many JOINs."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_10_joins(self, parser: SQLParser) -> None:
         """Test query with 10 JOINs."""
         sql = "SELECT * FROM t1"
@@ -308,10 +294,6 @@ class TestSQLParserManyJoins:
 class TestSQLParserRecursiveCTE:
     """Edge case tests for recursive CTEs."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_recursive_cte_simple(self, parser: SQLParser) -> None:
         """Test simple recursive CTE."""
         sql = """
@@ -372,10 +354,6 @@ class TestSQLParserRecursiveCTE:
 class TestSQLParserMultipleCTEs:
     """Edge case tests for multiple CTEs."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_two_ctes(self, parser: SQLParser) -> None:
         """Test query with two CTEs."""
         sql = """
@@ -438,10 +416,6 @@ class TestSQLParserMultipleCTEs:
 class TestSQLParserWindowFunctions:
     """Edge case tests for window functions."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_row_number(self, parser: SQLParser) -> None:
         """Test ROW_NUMBER window function."""
         sql = """
@@ -541,10 +515,6 @@ class TestSQLParserWindowFunctions:
 class TestSQLParserJSONOperators:
     """Edge case tests for PostgreSQL JSON operators."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_json_arrow_text(self, parser: SQLParser) -> None:
         """Test ->> operator (extract as text)."""
         sql = "SELECT data->>'name' AS name FROM json_table"
@@ -635,10 +605,6 @@ class TestSQLParserJSONOperators:
 class TestSQLParserArrayOperations:
     """Edge case tests for PostgreSQL array operations."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_array_overlap(self, parser: SQLParser) -> None:
         """Test && operator (array overlap)."""
         sql = """
@@ -713,10 +679,6 @@ class TestSQLParserArrayOperations:
 class TestSQLParserReservedWordTableNames:
     """Edge case tests for reserved word table names."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_order_table(self, parser: SQLParser) -> None:
         """Test 'order' as table name (reserved word)."""
         result = parser.validate('SELECT * FROM "order"')
@@ -761,10 +723,6 @@ class TestSQLParserReservedWordTableNames:
 class TestSQLParserSchemaQualifiedNames:
     """Edge case tests for schema-qualified names."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_public_schema(self, parser: SQLParser) -> None:
         """Test public schema prefix."""
         result = parser.parse_for_policy("SELECT * FROM public.users")
@@ -812,10 +770,6 @@ class TestSQLParserSchemaQualifiedNames:
 class TestSQLParserComplexScenarios:
     """Edge case tests for complex query scenarios."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_complex_analytics_query(self, parser: SQLParser) -> None:
         """Test complex analytics query with CTEs, window functions, etc."""
         sql = """
@@ -974,10 +928,6 @@ class TestSQLParserComplexScenarios:
 class TestSQLParserExtractTablesEdgeCases:
     """Edge case tests for extract_tables method."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_extract_from_cte(self, parser: SQLParser) -> None:
         """Test table extraction from CTE."""
         tables = parser.extract_tables("""
@@ -1007,10 +957,6 @@ class TestSQLParserExtractTablesEdgeCases:
 class TestSQLParserAddLimitEdgeCases:
     """Edge case tests for add_limit method."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_add_limit_with_offset(self, parser: SQLParser) -> None:
         """Test adding limit to query with OFFSET."""
         result = parser.add_limit(
@@ -1051,10 +997,6 @@ class TestSQLParserAddLimitEdgeCases:
 class TestSQLParserNormalizeEdgeCases:
     """Edge case tests for normalize method."""
 
-    @pytest.fixture
-    def parser(self) -> SQLParser:
-        return SQLParser()
-
     def test_normalize_preserves_case_in_strings(self, parser: SQLParser) -> None:
         """Test that normalize preserves case in string literals."""
         result = parser.normalize("SELECT * FROM users WHERE name = 'John Doe'")